@@ -1,8 +1,16 @@
 from rootstock._utils.checksum import is_checksum_address, to_checksum_address
 from rootstock._utils.units import from_wei, to_wei
 from rootstock._version import __version__
+from rootstock.accelerator import (
+    AcceleratedTransaction,
+    GasBumpPolicy,
+    TransactionAccelerator,
+)
+from rootstock.airdrop import Airdrop, AirdropReport, AirdropResult
+from rootstock.code_cache import CodeCache
 from rootstock.constants import ChainId
 from rootstock.contracts import Contract
+from rootstock.events import ERC20Log, EventDecoder, decode_erc20_log, decode_erc20_logs
 from rootstock.exceptions import (
     ABIError,
     AddressError,
@@ -28,32 +36,64 @@ from rootstock.exceptions import (
     TransactionRevertedError,
     WalletError,
 )
+from rootstock.indexer import TransferIndexer
+from rootstock.ledger import BalanceLedger
+from rootstock.logs import LogFollower, LogQuery, iter_logs
+from rootstock.multicall import Multicall
 from rootstock.network import NetworkConfig
+from rootstock.nonces import NonceAllocator, SQLiteNonceAllocator
+from rootstock.outbox import OutboxEntry, TransactionOutbox
+from rootstock.portfolio import RBTC, Portfolio, PortfolioScanner
+from rootstock.presign import BroadcastReport, BulkBroadcaster, presign_transfers
 from rootstock.provider import RootstockProvider
 from rootstock.rns import RNS
-from rootstock.tokens import ERC20Token
-from rootstock.transactions import TransactionBuilder
+from rootstock.sharding import ShardedSender
+from rootstock.signing import ProcessPoolSigner
+from rootstock.token_registry import TokenMetadata, TokenRegistry
+from rootstock.tokens import ERC20Token, fetch_token_metadata
+from rootstock.transactions import PendingTransaction, TransactionBuilder
 from rootstock.wallet import Wallet, WalletInfo
 
 __all__ = [
+    "RBTC",
     "RNS",
     "ABIError",
+    "AcceleratedTransaction",
     "AddressError",
+    "Airdrop",
+    "AirdropReport",
+    "AirdropResult",
     "AllowanceExceededError",
+    "BalanceLedger",
+    "BroadcastReport",
+    "BulkBroadcaster",
     "ChainId",
+    "CodeCache",
     "Contract",
     "ContractError",
     "ContractNotFoundError",
     "DomainNotFoundError",
+    "ERC20Log",
     "ERC20Token",
+    "EventDecoder",
+    "GasBumpPolicy",
     "GasEstimationError",
     "InsufficientFundsError",
     "InvalidAddressError",
     "InvalidDomainError",
     "InvalidPrivateKeyError",
     "KeystoreDecryptionError",
+    "LogFollower",
+    "LogQuery",
+    "Multicall",
     "NetworkConfig",
+    "NonceAllocator",
     "NonceTooLowError",
+    "OutboxEntry",
+    "PendingTransaction",
+    "Portfolio",
+    "PortfolioScanner",
+    "ProcessPoolSigner",
     "ProviderConnectionError",
     "ProviderError",
     "RNSError",
@@ -61,16 +101,28 @@ __all__ = [
     "ResolverNotFoundError",
     "RootstockError",
     "RootstockProvider",
+    "SQLiteNonceAllocator",
+    "ShardedSender",
     "TokenError",
+    "TokenMetadata",
+    "TokenRegistry",
+    "TransactionAccelerator",
     "TransactionBuilder",
     "TransactionError",
+    "TransactionOutbox",
     "TransactionRevertedError",
+    "TransferIndexer",
     "Wallet",
     "WalletError",
     "WalletInfo",
     "__version__",
+    "decode_erc20_log",
+    "decode_erc20_logs",
+    "fetch_token_metadata",
     "from_wei",
     "is_checksum_address",
+    "iter_logs",
+    "presign_transfers",
     "to_checksum_address",
     "to_wei",
 ]
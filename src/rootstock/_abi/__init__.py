@@ -0,0 +1,59 @@
+"""Bundled ABIs and a process-wide cache of parsed ABIs and web3 contract classes."""
+
+from __future__ import annotations
+
+import functools
+import json
+import threading
+import weakref
+from importlib.resources import files as pkg_files
+
+from eth_hash.auto import keccak
+from web3 import Web3
+from web3.contract import Contract as Web3Contract
+
+_MAX_KEYED_ABIS = 1_024
+
+# id(abi) -> (abi, key); holding the list keeps its id from being reused while cached.
+_keys_by_id: dict[int, tuple[list, str]] = {}
+_classes: weakref.WeakKeyDictionary[Web3, dict[str, type[Web3Contract]]] = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+@functools.cache
+def load_abi(name: str) -> list[dict]:
+    """Return a bundled ABI, parsed once per process. Callers must not modify it."""
+    return json.loads((pkg_files(__name__) / f"{name}.json").read_text(encoding="utf-8"))
+
+
+def abi_key(abi: list[dict]) -> str:
+    """Return a hash identifying the contents of ``abi``."""
+    cached = _keys_by_id.get(id(abi))
+    if cached is not None and cached[0] is abi:
+        return cached[1]
+    key = keccak(json.dumps(abi, sort_keys=True, separators=(",", ":")).encode()).hex()
+    with _lock:
+        if len(_keys_by_id) >= _MAX_KEYED_ABIS:
+            _keys_by_id.clear()
+        _keys_by_id[id(abi)] = (abi, key)
+    return key
+
+
+def contract_class(w3: Web3, abi: list[dict]) -> type[Web3Contract]:
+    """Return the web3 contract class for ``abi``, built once per Web3 instance."""
+    key = abi_key(abi)
+    with _lock:
+        per_w3 = _classes.setdefault(w3, {})
+        cls = per_w3.get(key)
+    if cls is None:
+        cls = w3.eth.contract(abi=abi)
+        with _lock:
+            cls = per_w3.setdefault(key, cls)
+    return cls
+
+
+def bind_contract(w3: Web3, address: str, abi: list[dict]) -> Web3Contract:
+    """Return a web3 contract instance at ``address`` from the shared class for ``abi``."""
+    return contract_class(w3, abi)(address=address)
@@ -0,0 +1,267 @@
+"""Precompiled calldata encoders and return-data decoders for ABI functions."""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Callable, Sequence
+
+from eth_abi import decode, encode
+from eth_abi.grammar import ABIType, TupleType, parse
+from eth_hash.auto import keccak
+from eth_utils import is_checksum_address
+from eth_utils.abi import collapse_if_tuple
+
+from rootstock._utils.checksum import normalize_address_for_web3
+from rootstock.exceptions import ABIError
+
+_INT_RE = re.compile(r"(u?)int(\d*)$")
+_BYTES_RE = re.compile(r"bytes(\d+)$")
+
+
+@functools.lru_cache(maxsize=4096)
+def _check_checksum(value: str) -> None:
+    if not is_checksum_address(value):
+        raise ABIError(f"{value!r} is not a checksummed address")
+
+
+def _address_word(value: object) -> bytes:
+    if isinstance(value, str) and len(value) == 42 and value[:2] in ("0x", "0X"):
+        _check_checksum(value)
+        return bytes(12) + bytes.fromhex(value[2:])
+    if isinstance(value, (bytes, bytearray)) and len(value) == 20:
+        return bytes(12) + bytes(value)
+    raise TypeError("not an address")
+
+
+def _bool_word(value: object) -> bytes:
+    if not isinstance(value, bool):
+        raise TypeError("not a bool")
+    return int(value).to_bytes(32, "big")
+
+
+def _int_word(signed: bool, bits: int) -> Callable[[object], bytes]:
+    low, high = (-(2 ** (bits - 1)), 2 ** (bits - 1)) if signed else (0, 2**bits)
+
+    def word(value: object) -> bytes:
+        if not isinstance(value, int) or isinstance(value, bool) or not low <= value < high:
+            raise TypeError("integer out of range")
+        return value.to_bytes(32, "big", signed=signed)
+
+    return word
+
+
+def _bytes_word(size: int) -> Callable[[object], bytes]:
+    def word(value: object) -> bytes:
+        if not isinstance(value, (bytes, bytearray)) or len(value) != size:
+            raise TypeError(f"not bytes{size}")
+        return bytes(value) + bytes(32 - size)
+
+    return word
+
+
+def _static_encoder(abi_type: str) -> Callable[[object], bytes] | None:
+    """Return a one-word encoder for simple static types, or None."""
+    if abi_type == "address":
+        return _address_word
+    if abi_type == "bool":
+        return _bool_word
+    info = int_info(abi_type)
+    if info is not None:
+        return _int_word(*info)
+    match = _BYTES_RE.match(abi_type)
+    if match and 1 <= int(match.group(1)) <= 32:
+        return _bytes_word(int(match.group(1)))
+    return None
+
+
+def _check_addresses(abi_type: ABIType, value: object) -> None:
+    """Reject address strings without a valid EIP-55 checksum, as web3 does."""
+    if abi_type.is_array:
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                _check_addresses(abi_type.item_type, item)
+    elif isinstance(abi_type, TupleType):
+        if isinstance(value, (list, tuple)):
+            for component, item in zip(abi_type.components, value, strict=False):
+                _check_addresses(component, item)
+    elif abi_type.base == "address" and isinstance(value, str):
+        _check_checksum(value)
+
+
+def _numpy_int_words(abi_type: str, column) -> list[bytes] | None:
+    """Encode a NumPy integer array as 32-byte words in one pass, or return None."""
+    dtype = getattr(column, "dtype", None)
+    info = int_info(abi_type)
+    if dtype is None or info is None or dtype.kind not in "iu" or dtype.itemsize > 8:
+        return None
+    import numpy as np
+
+    signed, bits = info
+    if len(column):
+        low, high = int(column.min()), int(column.max())
+        limit = 2 ** (bits - 1) if signed else 2**bits
+        if high >= limit or low < (-limit if signed else 0):
+            raise ValueError(f"value out of range for {abi_type}")
+    words = np.zeros((len(column), 32), dtype=np.uint8)
+    if dtype.kind == "i":
+        words[column < 0] = 0xFF
+    words[:, 24:] = (
+        column.astype(">i8" if dtype.kind == "i" else ">u8").view(np.uint8).reshape(-1, 8)
+    )
+    blob = words.tobytes()
+    return [blob[i : i + 32] for i in range(0, len(blob), 32)]
+
+
+class FunctionCodec:
+    """Selector and argument encoder for one ABI function.
+
+    When every input is an address, bool, fixed-size integer or ``bytesN``,
+    arguments are packed into 32-byte words directly; anything else (or an
+    argument the fast path does not accept) goes through ``eth_abi``.
+    Address strings must carry a valid checksum on either path.
+    """
+
+    __slots__ = ("_address_types", "_fast", "input_types", "name", "selector")
+
+    def __init__(self, name: str, input_types: tuple[str, ...]):
+        self.name = name
+        self.input_types = input_types
+        self.selector = keccak(f"{name}({','.join(input_types)})".encode())[:4]
+        encoders = [_static_encoder(t) for t in input_types]
+        self._fast = None if None in encoders else tuple(encoders)
+        self._address_types = (
+            tuple(parse(t) for t in input_types)
+            if any("address" in t for t in input_types)
+            else None
+        )
+
+    @property
+    def signature(self) -> str:
+        return f"{self.name}({','.join(self.input_types)})"
+
+    def encode(self, *args) -> bytes:
+        """Return the calldata for a call with ``args``."""
+        if len(args) != len(self.input_types):
+            raise ABIError(
+                f"{self.signature} takes {len(self.input_types)} arguments, got {len(args)}"
+            )
+        if self._fast is not None:
+            try:
+                return self.selector + b"".join(
+                    f(a) for f, a in zip(self._fast, args, strict=True)
+                )
+            except (TypeError, ValueError):
+                pass
+        if self._address_types is not None:
+            for abi_type, value in zip(self._address_types, args, strict=True):
+                _check_addresses(abi_type, value)
+        try:
+            return self.selector + encode(self.input_types, args)
+        except Exception as exc:
+            raise ABIError(f"Cannot encode arguments for {self.signature}: {exc}") from exc
+
+    def encode_hex(self, *args) -> str:
+        return "0x" + self.encode(*args).hex()
+
+    def encode_many(self, columns: Sequence[Sequence]) -> list[bytes]:
+        """Return calldata for many calls, given one column of values per argument.
+
+        Static arguments are encoded a column at a time; NumPy integer arrays
+        are converted to words in a single vectorized step.
+        """
+        if len(columns) != len(self.input_types):
+            raise ABIError(
+                f"{self.signature} takes {len(self.input_types)} columns, got {len(columns)}"
+            )
+        if not columns:
+            return [self.selector]
+        rows = len(columns[0])
+        if any(len(c) != rows for c in columns):
+            raise ABIError("All columns must have the same length")
+        if self._fast is not None:
+            try:
+                word_columns = []
+                for abi_type, word, column in zip(
+                    self.input_types, self._fast, columns, strict=True
+                ):
+                    words = _numpy_int_words(abi_type, column)
+                    if words is None:
+                        values = column.tolist() if hasattr(column, "tolist") else column
+                        words = [word(v) for v in values]
+                    word_columns.append(words)
+            except (TypeError, ValueError):
+                pass
+            else:
+                selector = self.selector
+                return [selector + b"".join(row) for row in zip(*word_columns, strict=True)]
+        lists = [c.tolist() if hasattr(c, "tolist") else c for c in columns]
+        return [self.encode(*row) for row in zip(*lists, strict=True)]
+
+    def __repr__(self) -> str:
+        return f"FunctionCodec({self.signature!r})"
+
+
+@functools.lru_cache(maxsize=1024)
+def _codec(name: str, input_types: tuple[str, ...]) -> FunctionCodec:
+    return FunctionCodec(name, input_types)
+
+
+def function_codec(abi_entry: dict) -> FunctionCodec:
+    """Return the shared codec for an ABI function entry."""
+    types = tuple(collapse_if_tuple(i) for i in abi_entry.get("inputs", []))
+    return _codec(abi_entry["name"], types)
+
+
+def int_info(abi_type: str) -> tuple[bool, int] | None:
+    """Return ``(signed, bits)`` for an integer type, or None for anything else."""
+    match = _INT_RE.match(abi_type)
+    if match is None:
+        return None
+    return match.group(1) == "", int(match.group(2) or 256)
+
+
+def word_decoder(
+    abi_type: str, to_address: Callable[[str], str] = normalize_address_for_web3
+) -> Callable[[bytes], object] | None:
+    """Return a decoder for one 32-byte word of a simple static type, or None.
+
+    Addresses are passed through ``to_address`` as lowercase hex.
+    """
+    if abi_type == "address":
+        return lambda w: to_address("0x" + w[12:].hex())
+    if abi_type == "bool":
+        return lambda w: w[31] == 1
+    info = int_info(abi_type)
+    if info is not None:
+        signed = info[0]
+        return lambda w: int.from_bytes(w, "big", signed=signed)
+    match = _BYTES_RE.match(abi_type)
+    if match and 1 <= int(match.group(1)) <= 32:
+        size = int(match.group(1))
+        return lambda w: w[:size]
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def output_decoder(output_types: tuple[str, ...]) -> Callable[[bytes], object]:
+    """Return a decoder for function return data.
+
+    Addresses come back checksummed and a single output is unwrapped, as
+    ``Contract.call`` returns them. Outputs that are all one-word types are
+    sliced directly; others go through ``eth_abi``.
+    """
+    words = [word_decoder(t) for t in output_types]
+    size = 32 * len(output_types)
+
+    def decode_output(data: bytes) -> object:
+        if None not in words and len(data) == size:
+            values = [f(data[i * 32 : i * 32 + 32]) for i, f in enumerate(words)]
+        else:
+            values = [
+                normalize_address_for_web3(v) if t == "address" else v
+                for t, v in zip(output_types, decode(output_types, data), strict=True)
+            ]
+        return values[0] if len(values) == 1 else values
+
+    return decode_output
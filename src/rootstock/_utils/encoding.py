@@ -0,0 +1,17 @@
+"""Conversions between hex strings and bytes as they appear in RPC results."""
+
+from __future__ import annotations
+
+
+def as_bytes(value: bytes | str) -> bytes:
+    """Return ``value`` as bytes, decoding hex strings with or without ``0x``."""
+    if isinstance(value, bytes):
+        return value
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+
+def to_hex(value: bytes | str) -> str:
+    """Return ``value`` as a lowercase ``0x``-prefixed hex string."""
+    if isinstance(value, str):
+        return value.lower() if value.startswith("0x") else "0x" + value.lower()
+    return "0x" + bytes(value).hex()
@@ -0,0 +1,195 @@
+"""Gas-price bumping for transactions that are stuck in the mempool."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+from rootstock.exceptions import (
+    NonceTooLowError,
+    RPCError,
+    TransactionError,
+    TransactionRevertedError,
+)
+from rootstock.transactions import TransactionBuilder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GasBumpPolicy:
+    """When and how far to raise the gas price of a pending transaction.
+
+    A transaction is rebroadcast once it has waited ``stuck_after_blocks``
+    blocks since its last broadcast. Each replacement pays at least
+    ``bump_percent`` more than the previous one and at least the node's
+    current gas price, capped at ``max_gas_price``.
+    """
+
+    stuck_after_blocks: int = 10
+    bump_percent: int = 10
+    max_gas_price: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.stuck_after_blocks < 1:
+            raise ValueError("stuck_after_blocks must be at least 1")
+        if self.bump_percent < 1:
+            raise ValueError("bump_percent must be at least 1")
+
+    def next_gas_price(self, current: int, network_gas_price: int) -> int | None:
+        """Return the replacement gas price, or None if the cap is already reached."""
+        bumped = -(-current * (100 + self.bump_percent) // 100)
+        price = max(bumped, network_gas_price)
+        if self.max_gas_price is not None:
+            price = min(price, self.max_gas_price)
+        return price if price > current else None
+
+
+@dataclass
+class AcceleratedTransaction:
+    """A watched transaction and every replacement broadcast for its nonce."""
+
+    nonce: int
+    tx_dict: dict
+    hashes: list[str]
+    sent_block: int
+    mined_hash: str | None = None
+    receipt: dict | None = field(default=None, repr=False)
+
+    @property
+    def tx_hash(self) -> str:
+        """Hash of the most recent broadcast."""
+        return self.hashes[-1]
+
+    @property
+    def gas_price(self) -> int:
+        return self.tx_dict["gasPrice"]
+
+    @property
+    def mined(self) -> bool:
+        return self.mined_hash is not None
+
+    @property
+    def replaced(self) -> bool:
+        """True if a replacement, not the original broadcast, was mined."""
+        return self.mined_hash is not None and self.mined_hash != self.hashes[0]
+
+
+class TransactionAccelerator:
+    """Watches transactions sent through a TransactionBuilder and bumps stuck ones.
+
+    Replacements reuse the original nonce, so exactly one version can be
+    mined; ``AcceleratedTransaction.mined_hash`` reports which one it was.
+    """
+
+    def __init__(self, builder: TransactionBuilder, policy: GasBumpPolicy | None = None):
+        self._builder = builder
+        self._provider = builder.provider
+        self._policy = policy or GasBumpPolicy()
+        self._lock = threading.Lock()
+        self._pending: dict[int, AcceleratedTransaction] = {}
+
+    @property
+    def policy(self) -> GasBumpPolicy:
+        return self._policy
+
+    @property
+    def pending(self) -> list[AcceleratedTransaction]:
+        with self._lock:
+            return sorted(self._pending.values(), key=lambda item: item.nonce)
+
+    def send(self, tx_dict: dict) -> AcceleratedTransaction:
+        """Sign and broadcast via the builder without waiting, then watch it."""
+        tx_hash = self._builder.sign_and_send(tx_dict, wait=False)
+        return self.track(tx_dict, tx_hash)
+
+    def track(self, tx_dict: dict, tx_hash: str) -> AcceleratedTransaction:
+        """Watch a transaction that was already broadcast."""
+        item = AcceleratedTransaction(
+            nonce=tx_dict["nonce"],
+            tx_dict=dict(tx_dict),
+            hashes=[tx_hash],
+            sent_block=self._provider.get_block_number(),
+        )
+        with self._lock:
+            self._pending[item.nonce] = item
+        return item
+
+    def poll(self) -> list[AcceleratedTransaction]:
+        """Check every watched transaction once and bump the stuck ones.
+
+        Returns the transactions found mined during this pass.
+        """
+        head = self._provider.get_block_number()
+        mined = []
+        for item in self.pending:
+            if self._check_mined(item):
+                mined.append(item)
+            elif head - item.sent_block >= self._policy.stuck_after_blocks:
+                self._bump(item, head)
+        if mined:
+            with self._lock:
+                for item in mined:
+                    self._pending.pop(item.nonce, None)
+        return mined
+
+    def wait(
+        self, item: AcceleratedTransaction, timeout: int = 600, poll_interval: float = 5.0
+    ) -> dict:
+        """Poll (and bump) until ``item`` is mined, then return its receipt."""
+        deadline = time.monotonic() + timeout
+        while not item.mined:
+            self.poll()
+            if item.mined:
+                break
+            if time.monotonic() >= deadline:
+                raise TransactionError(
+                    f"Transaction with nonce {item.nonce} not mined within {timeout}s"
+                )
+            time.sleep(poll_interval)
+        if item.receipt is not None and item.receipt.get("status") == 0:
+            raise TransactionRevertedError(item.mined_hash, item.receipt)
+        return item.receipt
+
+    def _check_mined(self, item: AcceleratedTransaction) -> bool:
+        for tx_hash in reversed(item.hashes):
+            receipt = self._provider.get_transaction_receipt(tx_hash)
+            if receipt is not None:
+                item.mined_hash = tx_hash
+                item.receipt = receipt
+                if item.replaced:
+                    logger.info("Nonce %d mined as replacement %s", item.nonce, tx_hash)
+                return True
+        return False
+
+    def _bump(self, item: AcceleratedTransaction, head: int) -> None:
+        new_price = self._policy.next_gas_price(item.gas_price, self._provider.get_gas_price())
+        if new_price is None:
+            logger.warning(
+                "Nonce %d stuck at max gas price %d, not bumping", item.nonce, item.gas_price
+            )
+            return
+
+        replacement = dict(item.tx_dict, gasPrice=new_price)
+        signed = self._builder.wallet.sign_transaction(replacement)
+        try:
+            tx_hash = self._provider.send_raw_transaction(signed)
+        except NonceTooLowError:
+            # One of the earlier versions was mined; the next poll picks up its receipt.
+            return
+        except RPCError as exc:
+            logger.warning("Replacement for nonce %d rejected: %s", item.nonce, exc)
+            return
+
+        logger.info(
+            "Bumped nonce %d gas price %d -> %d (%s)",
+            item.nonce,
+            item.gas_price,
+            new_price,
+            tx_hash,
+        )
+        item.tx_dict = replacement
+        item.hashes.append(tx_hash)
+        item.sent_block = head
@@ -0,0 +1,225 @@
+"""Bulk ERC-20 distribution with pipelined nonces and resumable results."""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from rootstock._utils.checksum import normalize_address_for_web3
+from rootstock.signing import ProcessPoolSigner
+from rootstock.tokens import ERC20Token
+from rootstock.transactions import TransactionBuilder
+
+logger = logging.getLogger(__name__)
+
+SENT = "sent"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class AirdropResult:
+    """Outcome of one recipient row."""
+
+    row: int
+    recipient: str
+    amount: int
+    status: str
+    nonce: int | None = None
+    tx_hash: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class AirdropReport:
+    sent: list[AirdropResult] = field(default_factory=list)
+    failed: list[AirdropResult] = field(default_factory=list)
+    skipped: int = 0
+    unsent: int = 0  # rows not attempted because an earlier batch failed
+
+
+def read_recipients(path: str | Path) -> list[tuple[str, int]]:
+    """Read ``address,amount`` rows (amounts in the token's smallest unit) from a CSV file.
+
+    A header row is skipped if its amount column is not a number.
+    """
+    rows = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for i, record in enumerate(csv.reader(f)):
+            if not record or not record[0].strip():
+                continue
+            address, amount = record[0].strip(), record[1].strip()
+            if i == 0 and not amount.isdigit():
+                continue
+            rows.append((address, int(amount)))
+    return rows
+
+
+class Airdrop:
+    """Sends one token to many recipients through ``TransactionBuilder.send_many``.
+
+    Calldata for every row is encoded locally up front. All transfers share
+    one gas limit: ``gas_limit`` if given, otherwise the largest
+    ``estimate_gas`` over ``gas_sample_size`` rows spread across the list,
+    plus ``gas_margin_percent``. A transfer to an address that holds none of
+    the token costs noticeably more (its balance slot goes from zero to
+    non-zero), so when the sample may miss such rows pass a worst-case
+    ``gas_limit`` instead. Rows go out in batches of
+    ``batch_size`` with consecutive nonces, and each batch's outcome is
+    appended to ``results_path`` (JSON Lines) before the next one starts.
+
+    Broadcasts within a batch go out in nonce order and stop at the first
+    failure, whose nonce and the ones after it are released, so a row is only
+    recorded as sent when every row before it was sent too and no nonce gap
+    is left behind. The run then stops; running again with the same
+    recipients skips the rows already recorded as sent and carries on from
+    the failed one.
+    """
+
+    def __init__(
+        self,
+        token: ERC20Token,
+        builder: TransactionBuilder,
+        results_path: str | Path,
+        gas_limit: int | None = None,
+        gas_margin_percent: int = 20,
+        gas_sample_size: int = 10,
+        batch_size: int = 200,
+        concurrency: int = 8,
+        signer: ProcessPoolSigner | None = None,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if gas_sample_size < 1:
+            raise ValueError("gas_sample_size must be at least 1")
+        self._token = token
+        self._builder = builder
+        self._results_path = str(results_path)
+        self._gas_limit = gas_limit
+        self._gas_margin_percent = gas_margin_percent
+        self._gas_sample_size = gas_sample_size
+        self._batch_size = batch_size
+        self._concurrency = concurrency
+        self._signer = signer
+
+    @property
+    def gas_limit(self) -> int | None:
+        """The fixed or learned gas limit; None until the first run learns it."""
+        return self._gas_limit
+
+    def run(
+        self, recipients: Iterable[tuple[str, int]] | str | Path, gas_price: int | None = None
+    ) -> AirdropReport:
+        """Distribute to ``recipients`` (pairs or a CSV path) and return what happened."""
+        if isinstance(recipients, (str, Path)):
+            recipients = read_recipients(recipients)
+        rows = [(normalize_address_for_web3(a), int(v)) for a, v in recipients]
+        if any(amount < 0 for _, amount in rows):
+            raise ValueError("amounts must be non-negative")
+
+        done = self._load_sent()
+        report = AirdropReport()
+        pending: list[tuple[int, str, int]] = []
+        for index, (recipient, amount) in enumerate(rows):
+            previous = done.get(index)
+            if previous is None:
+                pending.append((index, recipient, amount))
+            elif (previous.recipient.lower(), previous.amount) != (recipient.lower(), amount):
+                raise ValueError(
+                    f"Row {index} differs from {self._results_path}; use a new results file"
+                )
+            else:
+                report.skipped += 1
+        if not pending:
+            return report
+
+        calldata = self._token.encode_transfers(
+            [r for _, r, _ in pending], [a for *_, a in pending]
+        )
+        if self._gas_limit is None:
+            self._gas_limit = self._learn_gas_limit(calldata)
+        if gas_price is None:
+            gas_price = self._builder.provider.get_gas_price()
+
+        for start in range(0, len(pending), self._batch_size):
+            batch = pending[start : start + self._batch_size]
+            entries = [
+                {"to": self._token.address, "data": data, "gas_limit": self._gas_limit}
+                for data in calldata[start : start + self._batch_size]
+            ]
+            handles = self._builder.send_many(
+                entries,
+                concurrency=self._concurrency,
+                gas_price=gas_price,
+                signer=self._signer,
+                stop_on_error=True,
+            )
+            results = [
+                AirdropResult(index, recipient, amount, SENT, handle.nonce, handle.tx_hash)
+                if handle.sent
+                else AirdropResult(index, recipient, amount, FAILED, error=str(handle.error))
+                for (index, recipient, amount), handle in zip(batch, handles, strict=True)
+            ]
+            self._record(results)
+            for result in results:
+                (report.sent if result.status == SENT else report.failed).append(result)
+            if any(result.status == FAILED for result in results):
+                report.unsent = len(pending) - start - len(batch)
+                break
+
+        logger.info(
+            "Airdrop of %s: %d sent, %d failed, %d not attempted, %d already done",
+            self._token.address,
+            len(report.sent),
+            len(report.failed),
+            report.unsent,
+            report.skipped,
+        )
+        return report
+
+    def _learn_gas_limit(self, calldata: list[bytes]) -> int:
+        sender = normalize_address_for_web3(self._builder.wallet.address)
+        count = min(self._gas_sample_size, len(calldata))
+        rows = sorted({i * (len(calldata) - 1) // max(1, count - 1) for i in range(count)})
+        estimate = max(
+            self._builder.provider.estimate_gas(
+                {"from": sender, "to": self._token.address, "data": "0x" + calldata[i].hex()}
+            )
+            for i in rows
+        )
+        gas = estimate * (100 + self._gas_margin_percent) // 100
+        logger.info(
+            "Learned airdrop gas limit %d (largest of %d estimates: %d)", gas, len(rows), estimate
+        )
+        return gas
+
+    def _load_sent(self) -> dict[int, AirdropResult]:
+        sent: dict[int, AirdropResult] = {}
+        if not os.path.exists(self._results_path):
+            return sent
+        with open(self._results_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                result = AirdropResult(**{**record, "amount": int(record["amount"])})
+                if result.status == SENT:
+                    sent[result.row] = result
+                else:
+                    sent.pop(result.row, None)
+        return sent
+
+    def _record(self, results: list[AirdropResult]) -> None:
+        with open(self._results_path, "a", encoding="utf-8") as f:
+            for r in results:
+                record = {**asdict(r), "amount": str(r.amount)}
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def __repr__(self) -> str:
+        return f"Airdrop(token={self._token.address!r}, results={self._results_path!r})"
@@ -0,0 +1,138 @@
+"""Cache of contract code hashes, so code checks skip repeated ``eth_getCode`` calls."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterable
+from contextlib import closing
+from pathlib import Path
+
+from eth_hash.auto import keccak
+
+from rootstock.provider import RootstockProvider
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS code_hashes (
+    chain_id INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    code_hash TEXT NOT NULL,
+    PRIMARY KEY (chain_id, address)
+);
+"""
+
+
+class CodeCache:
+    """Code hashes of contract addresses, per chain, in memory and optionally in SQLite.
+
+    Only addresses that have code are remembered: an empty account can get
+    code later (for example through CREATE2), so it is asked about again
+    every time. With a ``path`` the hashes are shared with other processes
+    and survive restarts.
+    """
+
+    def __init__(self, path: str | Path | None = None, timeout: float = 30.0):
+        self._path = str(path) if path is not None else None
+        self._timeout = timeout
+        self._hashes: dict[tuple[int, str], str] = {}
+        self._lock = threading.Lock()
+        if self._path is not None:
+            with closing(self._connect()) as conn:
+                conn.executescript(_SCHEMA)
+
+    def code_hash(self, provider: RootstockProvider, address: str) -> str | None:
+        """Return the keccak hash of the code at ``address``, or None if it has none."""
+        return self.code_hashes(provider, [address])[address]
+
+    def is_contract(self, provider: RootstockProvider, address: str) -> bool:
+        return self.code_hash(provider, address) is not None
+
+    def code_hashes(
+        self, provider: RootstockProvider, addresses: Iterable[str], batch_size: int = 100
+    ) -> dict[str, str | None]:
+        """Look up many addresses, fetching unknown ones in batched ``eth_getCode`` requests.
+
+        The result is keyed by the addresses as given.
+        """
+        chain_id = provider.chain_id
+        addresses = list(addresses)
+        found: dict[str, str] = {}
+        with self._lock:
+            for a in addresses:
+                cached = self._hashes.get((chain_id, a.lower()))
+                if cached is not None:
+                    found[a.lower()] = cached
+        missing = list(dict.fromkeys(a.lower() for a in addresses if a.lower() not in found))
+        if missing and self._path is not None:
+            stored = self._load(chain_id, missing)
+            found.update(stored)
+            missing = [a for a in missing if a not in stored]
+
+        fetched: dict[str, str] = {}
+        for i in range(0, len(missing), batch_size):
+            chunk = missing[i : i + batch_size]
+            codes = (
+                provider.get_code_many(chunk) if len(chunk) > 1 else [provider.get_code(chunk[0])]
+            )
+            for address, code in zip(chunk, codes, strict=True):
+                if code:
+                    fetched[address] = "0x" + keccak(code).hex()
+        if fetched and self._path is not None:
+            self._store(chain_id, fetched)
+        found.update(fetched)
+
+        with self._lock:
+            for address, code_hash in found.items():
+                self._hashes[(chain_id, address)] = code_hash
+        return {a: found.get(a.lower()) for a in addresses}
+
+    def is_contract_many(
+        self, provider: RootstockProvider, addresses: Iterable[str], batch_size: int = 100
+    ) -> dict[str, bool]:
+        hashes = self.code_hashes(provider, addresses, batch_size)
+        return {a: h is not None for a, h in hashes.items()}
+
+    def clear(self) -> None:
+        """Forget the in-memory entries (the SQLite file, if any, is kept)."""
+        with self._lock:
+            self._hashes.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._hashes)
+
+    def _load(self, chain_id: int, addresses: list[str]) -> dict[str, str]:
+        found: dict[str, str] = {}
+        with closing(self._connect()) as conn:
+            # Stay under SQLite's default limit on bound parameters.
+            for i in range(0, len(addresses), 500):
+                chunk = addresses[i : i + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(
+                    "SELECT address, code_hash FROM code_hashes "
+                    f"WHERE chain_id = ? AND address IN ({placeholders})",
+                    (chain_id, *chunk),
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def _store(self, chain_id: int, hashes: dict[str, str]) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO code_hashes VALUES (?, ?, ?)",
+                [(chain_id, address, code_hash) for address, code_hash in hashes.items()],
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=self._timeout)
+
+    def __repr__(self) -> str:
+        return f"CodeCache(path={self._path!r}, entries={len(self)})"
+
+
+_default_cache = CodeCache()
+
+
+def default_code_cache() -> CodeCache:
+    """The in-memory cache ``Contract`` uses when none is given."""
+    return _default_cache
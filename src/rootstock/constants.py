@@ -30,6 +30,12 @@ RNS_REGISTRY: dict[ChainId, str] = {
     ChainId.TESTNET: "0x7d284aaac6e925aad802a53c0c69efe3764597b8",
 }
 
+# Multicall3 is deployed at the same address on both networks.
+MULTICALL3: dict[ChainId, str] = {
+    ChainId.MAINNET: "0xcA11bde05977b3631167028862bE2a173976CA11",
+    ChainId.TESTNET: "0xcA11bde05977b3631167028862bE2a173976CA11",
+}
+
 TOKENS: dict[str, dict[ChainId, str]] = {
     "WRBTC": {
         ChainId.MAINNET: "0x542FDA317318eBf1d3DeAF76E0B632741a7e677d",
@@ -4,16 +4,24 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
 
+from eth_utils.abi import collapse_if_tuple
+from web3._utils.filters import construct_event_filter_params
 from web3.contract import Contract as Web3Contract
 from web3.exceptions import ContractLogicError
 
+from rootstock._abi import bind_contract
+from rootstock._utils.abi import FunctionCodec, function_codec, output_decoder
 from rootstock._utils.checksum import normalize_address_for_web3
-from rootstock.constants import ZERO_ADDRESS
+from rootstock.code_cache import CodeCache, default_code_cache
+from rootstock.events import EventDecoder
 from rootstock.exceptions import ABIError, ContractError, ContractNotFoundError, RPCError
+from rootstock.logs import LogFollower, iter_logs
 from rootstock.provider import RootstockProvider
 from rootstock.transactions import TransactionBuilder
+from rootstock.types import BlockIdentifier
 from rootstock.wallet import Wallet
 
 logger = logging.getLogger(__name__)
@@ -21,8 +29,20 @@ logger = logging.getLogger(__name__)
 
 class Contract:
     def __init__(
-        self, provider: RootstockProvider, address: str, abi: list[dict], *, verify: bool = True
+        self,
+        provider: RootstockProvider,
+        address: str,
+        abi: list[dict],
+        *,
+        verify: bool = True,
+        code_cache: CodeCache | None = None,
     ):
+        """Wrap the contract at ``address``.
+
+        With ``verify`` the address must have code. Addresses found to have
+        code are remembered in ``code_cache`` (default: one shared by the
+        whole process), so later instances skip the ``eth_getCode`` call.
+        """
         if not abi:
             raise ABIError("ABI cannot be empty")
 
@@ -30,12 +50,13 @@ class Contract:
         self._address = normalize_address_for_web3(address)
 
         if verify:
-            code = provider.get_code(self._address)
-            if not code:
+            cache = code_cache if code_cache is not None else default_code_cache()
+            if not cache.is_contract(provider, self._address):
                 raise ContractNotFoundError(f"No contract code at address {address}")
 
         self._abi = abi
-        self._contract: Web3Contract = provider.w3.eth.contract(address=self._address, abi=abi)
+        self._codecs: dict[str, list[FunctionCodec]] = {}
+        self._bound: Web3Contract | None = None
 
     @classmethod
     def from_abi_file(
@@ -76,13 +97,9 @@ class Contract:
         **kwargs,
     ) -> dict | str:
         """Send a state-changing transaction to a contract function."""
-        fn = self._get_function(function_name)
+        data = self.encode_function_data(function_name, *args, **kwargs)
         builder = tx_builder or TransactionBuilder(self._provider, wallet)
 
-        data = fn(*args, **kwargs).build_transaction(
-            {"from": normalize_address_for_web3(wallet.address), "gas": 0}
-        )["data"]
-
         tx_dict = builder.build_transaction(
             to=self._address,
             value=value,
@@ -94,10 +111,41 @@ class Contract:
         return builder.sign_and_send(tx_dict, wait=wait, timeout=timeout)
 
     def encode_function_data(self, function_name: str, *args, **kwargs) -> str:
-        """Return ABI-encoded call data for a function."""
-        fn = self._get_function(function_name)
-        data = fn(*args, **kwargs).build_transaction({"from": ZERO_ADDRESS, "gas": 0})["data"]
-        return data
+        """Return ABI-encoded call data for a function, encoded locally."""
+        candidates = self._function_codecs(function_name)
+        if kwargs:
+            names = self._input_names(function_name, len(args) + len(kwargs))
+            try:
+                args = (*args, *(kwargs[n] for n in names[len(args) :]))
+            except KeyError as exc:
+                raise ABIError(f"Unknown argument {exc} for {function_name}") from None
+        matching = [c for c in candidates if len(c.input_types) == len(args)]
+        if len(matching) == 1:
+            return matching[0].encode_hex(*args)
+        # Overloads with the same arity need web3's type-based resolution.
+        try:
+            return self.web3_contract.encode_abi(function_name, args=list(args))
+        except Exception as exc:
+            raise ABIError(f"Cannot encode call to {function_name}: {exc}") from exc
+
+    def encode_many(self, function_name: str, columns: Sequence[Sequence]) -> list[bytes]:
+        """Return calldata for many calls, one column of values per argument.
+
+        Columns may be lists or NumPy integer arrays. ``function_name`` must
+        have a single overload taking ``len(columns)`` arguments.
+        """
+        return self._codec_for(function_name, len(columns)).encode_many(columns)
+
+    def decode_many(
+        self, function_name: str, results: Iterable[bytes | str], arg_count: int | None = None
+    ) -> list[object]:
+        """Decode many return values of ``function_name``, as ``call`` would return them."""
+        entry = self._function_entry(function_name, arg_count)
+        decoder = output_decoder(tuple(collapse_if_tuple(o) for o in entry.get("outputs", [])))
+        return [
+            decoder(bytes.fromhex(r.removeprefix("0x")) if isinstance(r, str) else bytes(r))
+            for r in results
+        ]
 
     def get_events(
         self,
@@ -108,7 +156,7 @@ class Contract:
     ) -> list[dict]:
         """Fetch historical events via eth_getLogs."""
         try:
-            event = self._contract.events[event_name]
+            event = self.web3_contract.events[event_name]
         except (KeyError, AttributeError) as exc:
             raise ABIError(f"Event {event_name!r} not found in ABI") from exc
 
@@ -121,6 +169,126 @@ class Contract:
         except Exception as exc:
             raise RPCError(f"Failed to fetch events: {exc}") from exc
 
+    def iter_events(
+        self,
+        event_name: str,
+        from_block: int = 0,
+        to_block: BlockIdentifier = "latest",
+        filters: dict | None = None,
+        chunk_size: int = 2_000,
+        concurrency: int = 4,
+    ) -> Iterator[dict]:
+        """Stream decoded events over a long block range, in chain order.
+
+        Uses ``iter_logs``: the range is fetched in adaptive chunks on
+        ``concurrency`` threads, so backfilling from block 0 neither times out
+        nor holds every event in memory. ``filters`` on indexed arguments are
+        applied by the node, the rest while decoding.
+        """
+        event, params, local = self._event_filter(event_name, filters)
+        for log in iter_logs(
+            self._provider,
+            params,
+            from_block,
+            to_block,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        ):
+            decoded = dict(event.process_log(log))
+            if all(decoded["args"][k] in v for k, v in local.items()):
+                yield decoded
+
+    def iter_event_columns(
+        self,
+        event_name: str,
+        from_block: int = 0,
+        to_block: BlockIdentifier = "latest",
+        filters: dict | None = None,
+        batch_size: int = 50_000,
+        chunk_size: int = 2_000,
+        concurrency: int = 4,
+        checksum: bool = True,
+    ) -> Iterator[dict[str, list]]:
+        """Like ``iter_events``, but yield batches of columns (see ``EventDecoder``).
+
+        Only indexed arguments can be filtered.
+        """
+        event, params, local = self._event_filter(event_name, filters)
+        if local:
+            raise ABIError(f"Cannot filter columns on non-indexed arguments: {sorted(local)}")
+        decoder = EventDecoder(event.abi, checksum=checksum)
+        logs = iter_logs(
+            self._provider,
+            params,
+            from_block,
+            to_block,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+        yield from decoder.iter_batches(logs, batch_size)
+
+    def export_events(
+        self,
+        event_name: str,
+        path: str | Path,
+        format: str = "parquet",
+        from_block: int = 0,
+        to_block: BlockIdentifier = "latest",
+        filters: dict | None = None,
+        batch_size: int = 50_000,
+        chunk_size: int = 2_000,
+        concurrency: int = 4,
+    ) -> int:
+        """Stream events to a Parquet or Arrow IPC file and return the number of rows.
+
+        Requires ``pyarrow``.
+        """
+        try:
+            event = self.web3_contract.events[event_name]
+        except (KeyError, AttributeError) as exc:
+            raise ABIError(f"Event {event_name!r} not found in ABI") from exc
+        batches = self.iter_event_columns(
+            event_name,
+            from_block,
+            to_block,
+            filters,
+            batch_size=batch_size,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+        return EventDecoder(event.abi).write(batches, path, format)
+
+    def follow_events(
+        self,
+        event_name: str,
+        filters: dict | None = None,
+        from_block: int | None = None,
+        checkpoint_path: str | Path | None = None,
+        confirmations: int = 0,
+        poll_interval: float = 5.0,
+    ) -> Iterator[dict]:
+        """Yield new events as blocks arrive, until the consumer stops iterating.
+
+        Events come from a ``LogFollower`` (see there for the filter,
+        checkpoint and reorg behavior) and carry a ``removed`` key: True for
+        events from blocks that a reorg orphaned, delivered newest first.
+        ``from_block`` defaults to the next block, and is ignored when
+        resuming from an existing ``checkpoint_path``.
+        """
+        event, params, local = self._event_filter(event_name, filters)
+        follower = LogFollower(
+            self._provider,
+            params,
+            from_block=from_block,
+            checkpoint_path=checkpoint_path,
+            confirmations=confirmations,
+            poll_interval=poll_interval,
+        )
+        for log in follower.follow():
+            decoded = dict(event.process_log(log))
+            if all(decoded["args"][k] in v for k, v in local.items()):
+                yield {**decoded, "removed": log["removed"]}
+
     @property
     def functions(self) -> list[str]:
         return [item["name"] for item in self._abi if item.get("type") == "function"]
@@ -135,11 +303,79 @@ class Contract:
 
     @property
     def web3_contract(self) -> Web3Contract:
-        return self._contract
+        # Bound on first use: web3 builds per-instance function and event objects.
+        if self._bound is None:
+            self._bound = bind_contract(self._provider.w3, self._address, self._abi)
+        return self._bound
+
+    def _function_codecs(self, name: str) -> list[FunctionCodec]:
+        codecs = self._codecs.get(name)
+        if codecs is None:
+            codecs = [
+                function_codec(item)
+                for item in self._abi
+                if item.get("type") == "function" and item.get("name") == name
+            ]
+            if not codecs:
+                raise ABIError(f"Function {name!r} not found in ABI")
+            self._codecs[name] = codecs
+        return codecs
+
+    def _event_filter(self, event_name: str, filters: dict | None) -> tuple:
+        """Return the event, ``eth_getLogs`` params for its indexed filters, and the other filters."""
+        try:
+            event = self.web3_contract.events[event_name]
+        except (KeyError, AttributeError) as exc:
+            raise ABIError(f"Event {event_name!r} not found in ABI") from exc
+        filters = filters or {}
+        indexed = {i["name"] for i in event.abi["inputs"] if i.get("indexed")}
+        _, params = construct_event_filter_params(
+            event.abi,
+            self._provider.w3.codec,
+            contract_address=self._address,
+            argument_filters={k: v for k, v in filters.items() if k in indexed},
+        )
+        local = {
+            k: v if isinstance(v, (list, tuple)) else [v]
+            for k, v in filters.items()
+            if k not in indexed
+        }
+        return event, params, local
+
+    def _codec_for(self, name: str, arg_count: int) -> FunctionCodec:
+        matching = [c for c in self._function_codecs(name) if len(c.input_types) == arg_count]
+        if len(matching) != 1:
+            raise ABIError(f"Expected one {name} overload taking {arg_count} arguments")
+        return matching[0]
+
+    def _function_entry(self, name: str, arg_count: int | None) -> dict:
+        entries = [
+            item
+            for item in self._abi
+            if item.get("type") == "function"
+            and item.get("name") == name
+            and (arg_count is None or len(item.get("inputs", [])) == arg_count)
+        ]
+        if not entries:
+            raise ABIError(f"Function {name!r} not found in ABI")
+        if len(entries) > 1:
+            raise ABIError(f"{name} is overloaded; pass arg_count")
+        return entries[0]
+
+    def _input_names(self, name: str, arg_count: int) -> list[str]:
+        for item in self._abi:
+            inputs = item.get("inputs", [])
+            if (
+                item.get("type") == "function"
+                and item.get("name") == name
+                and len(inputs) == arg_count
+            ):
+                return [i.get("name", "") for i in inputs]
+        raise ABIError(f"No {name} overload takes {arg_count} arguments")
 
     def _get_function(self, name: str):
         try:
-            return self._contract.functions[name]
+            return self.web3_contract.functions[name]
         except (KeyError, AttributeError) as exc:
             raise ABIError(f"Function {name!r} not found in ABI") from exc
 
@@ -0,0 +1,269 @@
+"""Fast decoding of event logs: ERC-20 Transfer/Approval logs and column-oriented decoding of any event."""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from eth_abi import decode
+from eth_hash.auto import keccak
+from eth_utils.abi import collapse_if_tuple
+from web3 import Web3
+
+from rootstock._utils.abi import int_info, word_decoder
+from rootstock._utils.encoding import as_bytes
+
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+APPROVAL_TOPIC = "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925"
+
+_EVENT_NAMES = {
+    bytes.fromhex(TRANSFER_TOPIC[2:]): "Transfer",
+    bytes.fromhex(APPROVAL_TOPIC[2:]): "Approval",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ERC20Log:
+    """A decoded Transfer or Approval log.
+
+    For ``Approval`` logs ``from_address`` is the owner and ``to_address``
+    the spender.
+    """
+
+    event: str
+    token: str
+    from_address: str
+    to_address: str
+    value: int
+    block_number: int
+    log_index: int
+    tx_hash: str
+
+
+@functools.lru_cache(maxsize=65_536)
+def _checksum(lower_hex: str) -> str:
+    return Web3.to_checksum_address(lower_hex)
+
+
+def decode_erc20_log(log: dict, checksum: bool = True) -> ERC20Log | None:
+    """Decode one ``eth_getLogs`` entry, or return None if it is not a standard
+    Transfer/Approval log (wrong topic0, non-indexed addresses, indexed value).
+
+    With ``checksum=False`` addresses stay lowercase, which is faster.
+    """
+    topics = log["topics"]
+    if len(topics) != 3:
+        return None
+    event = _EVENT_NAMES.get(as_bytes(topics[0]))
+    if event is None:
+        return None
+    data = as_bytes(log["data"])
+    if len(data) != 32:
+        return None
+    from_hex = "0x" + as_bytes(topics[1])[12:].hex()
+    to_hex = "0x" + as_bytes(topics[2])[12:].hex()
+    token = log["address"].lower()
+    if checksum:
+        from_hex, to_hex, token = _checksum(from_hex), _checksum(to_hex), _checksum(token)
+    return ERC20Log(
+        event=event,
+        token=token,
+        from_address=from_hex,
+        to_address=to_hex,
+        value=int.from_bytes(data, "big"),
+        block_number=log["blockNumber"],
+        log_index=log["logIndex"],
+        tx_hash="0x" + as_bytes(log["transactionHash"]).hex(),
+    )
+
+
+def decode_erc20_logs(logs: Iterable[dict], checksum: bool = True) -> list[ERC20Log]:
+    """Decode many logs, dropping the ones that are not standard Transfer/Approval logs."""
+    decoded = (decode_erc20_log(log, checksum) for log in logs)
+    return [log for log in decoded if log is not None]
+
+
+class EventDecoder:
+    """Decodes logs of one event straight into columns.
+
+    ``decode`` returns a dict of equal-length lists: ``block_number``,
+    ``log_index``, ``tx_hash``, ``address`` and one list per event argument,
+    in ABI order. Indexed arguments of dynamic type (``string``, ``bytes``,
+    arrays) are only stored on chain as a hash, so their column holds that
+    hash as hex. Logs of other events are skipped.
+    """
+
+    BASE_COLUMNS = ("block_number", "log_index", "tx_hash", "address")
+
+    def __init__(self, event_abi: dict, checksum: bool = True):
+        inputs = event_abi.get("inputs", [])
+        types = [collapse_if_tuple(i) for i in inputs]
+        self.name: str = event_abi["name"]
+        self._anonymous = bool(event_abi.get("anonymous"))
+        self._topic = keccak(f"{self.name}({','.join(types)})".encode())
+        self._arg_names = [i.get("name") or f"arg{n}" for n, i in enumerate(inputs)]
+        self._types = dict(zip(self._arg_names, types, strict=True))
+        self._indexed = [
+            (name, t)
+            for name, t, i in zip(self._arg_names, types, inputs, strict=True)
+            if i.get("indexed")
+        ]
+        self._data = [
+            (name, t)
+            for name, t, i in zip(self._arg_names, types, inputs, strict=True)
+            if not i.get("indexed")
+        ]
+        self._address = _checksum if checksum else str
+        self._data_types = tuple(t for _, t in self._data)
+        self._data_words = [word_decoder(t, self._address) for t in self._data_types]
+        self._data_addresses = [i for i, t in enumerate(self._data_types) if t == "address"]
+        self._topic_readers = [
+            word_decoder(t, self._address) or (lambda w: "0x" + w.hex()) for _, t in self._indexed
+        ]
+
+    @property
+    def topic(self) -> str:
+        return "0x" + self._topic.hex()
+
+    @property
+    def columns(self) -> list[str]:
+        return [*self.BASE_COLUMNS, *self._arg_names]
+
+    def decode(self, logs: Iterable[dict]) -> dict[str, list]:
+        """Decode ``logs`` into one list per column."""
+        out: dict[str, list] = {name: [] for name in self.columns}
+        block_numbers, log_indexes = out["block_number"], out["log_index"]
+        tx_hashes, addresses = out["tx_hash"], out["address"]
+        indexed_cols = [out[name] for name, _ in self._indexed]
+        data_cols = [out[name] for name, _ in self._data]
+        first_topic = 0 if self._anonymous else 1
+        wanted = len(self._indexed) + first_topic
+        fast_data = None not in self._data_words
+        data_size = 32 * len(self._data_types)
+        to_address = self._address
+
+        for log in logs:
+            topics = [as_bytes(t) for t in log["topics"]]
+            if len(topics) != wanted or (not self._anonymous and topics[0] != self._topic):
+                continue
+            data = as_bytes(log["data"])
+            if fast_data and len(data) == data_size:
+                values = [
+                    read(data[i * 32 : i * 32 + 32]) for i, read in enumerate(self._data_words)
+                ]
+            else:
+                values = list(decode(self._data_types, data))
+                for i in self._data_addresses:
+                    values[i] = to_address(values[i])
+            for column, read, topic in zip(
+                indexed_cols, self._topic_readers, topics[first_topic:], strict=True
+            ):
+                column.append(read(topic))
+            for column, value in zip(data_cols, values, strict=True):
+                column.append(value)
+            block_numbers.append(log["blockNumber"])
+            log_indexes.append(log["logIndex"])
+            tx_hashes.append("0x" + as_bytes(log["transactionHash"]).hex())
+            addresses.append(to_address(log["address"].lower()))
+        return out
+
+    def iter_batches(
+        self, logs: Iterable[dict], batch_size: int = 50_000
+    ) -> Iterator[dict[str, list]]:
+        """Decode a stream of logs into column batches of up to ``batch_size`` rows."""
+        chunk: list[dict] = []
+        for log in logs:
+            chunk.append(log)
+            if len(chunk) >= batch_size:
+                yield self.decode(chunk)
+                chunk = []
+        if chunk:
+            yield self.decode(chunk)
+
+    def to_arrow(self, columns: dict[str, list]):
+        """Convert decoded columns to a ``pyarrow.Table`` (requires ``pyarrow``).
+
+        Integers wider than 64 bits, such as ``uint256``, do not fit any Arrow
+        integer type and are stored as decimal strings.
+        """
+        pa = _pyarrow()
+        schema = self.arrow_schema()
+        arrays = []
+        for field in schema:
+            values = columns[field.name]
+            if field.type == pa.string() and values and not isinstance(values[0], str):
+                values = [str(v) for v in values]
+            arrays.append(pa.array(values, type=field.type))
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    def arrow_schema(self):
+        pa = _pyarrow()
+        fields = [
+            pa.field("block_number", pa.uint64()),
+            pa.field("log_index", pa.uint32()),
+            pa.field("tx_hash", pa.string()),
+            pa.field("address", pa.string()),
+        ]
+        indexed = {name for name, _ in self._indexed}
+        for name in self._arg_names:
+            abi_type = self._types[name]
+            if name in indexed and word_decoder(abi_type) is None:
+                arrow_type = pa.string()
+            else:
+                arrow_type = _arrow_type(pa, abi_type)
+            fields.append(pa.field(name, arrow_type))
+        return pa.schema(fields)
+
+    def write(
+        self, batches: Iterable[dict[str, list]], path: str | Path, format: str = "parquet"
+    ) -> int:
+        """Stream column batches to a Parquet or Arrow IPC (``format="arrow"``) file.
+
+        Returns the number of rows written.
+        """
+        pa = _pyarrow()
+        schema = self.arrow_schema()
+        if format == "parquet":
+            import pyarrow.parquet as pq
+
+            writer = pq.ParquetWriter(str(path), schema)
+        elif format == "arrow":
+            writer = pa.ipc.new_file(str(path), schema)
+        else:
+            raise ValueError(f"Unknown format {format!r}; use 'parquet' or 'arrow'")
+        rows = 0
+        with writer:
+            for batch in batches:
+                table = self.to_arrow(batch)
+                writer.write_table(table)
+                rows += table.num_rows
+        return rows
+
+    def __repr__(self) -> str:
+        return f"EventDecoder({self.name!r})"
+
+
+def _arrow_type(pa, abi_type: str):
+    if abi_type == "bool":
+        return pa.bool_()
+    info = int_info(abi_type)
+    if info is not None:
+        signed, bits = info
+        if bits <= 64:
+            return pa.int64() if signed else pa.uint64()
+        return pa.string()
+    if abi_type == "bytes" or (abi_type.startswith("bytes") and abi_type[5:].isdigit()):
+        return pa.binary()
+    return pa.string()
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "Arrow export requires pyarrow: pip install rootstock-sdk[arrow]"
+        ) from exc
+    return pyarrow
@@ -0,0 +1,282 @@
+"""Local index of ERC-20 holder balances built from Transfer logs, stored in SQLite."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+
+from rootstock._utils.checksum import normalize_address_for_web3
+from rootstock._utils.encoding import to_hex
+from rootstock.constants import ZERO_ADDRESS
+from rootstock.events import TRANSFER_TOPIC, decode_erc20_logs
+from rootstock.logs import _fetch_range
+from rootstock.provider import RootstockProvider
+from rootstock.tokens import ERC20Token
+
+logger = logging.getLogger(__name__)
+
+# uint256 needs up to 78 decimal digits; zero padding makes TEXT order match numeric order.
+_BALANCE_DIGITS = 78
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transfers (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    from_address TEXT NOT NULL,
+    to_address TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS transfers_from ON transfers (from_address, block_number);
+CREATE INDEX IF NOT EXISTS transfers_to ON transfers (to_address, block_number);
+CREATE TABLE IF NOT EXISTS balances (
+    holder TEXT PRIMARY KEY,
+    balance TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS balances_by_amount ON balances (balance);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    block_number INTEGER PRIMARY KEY,
+    block_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _encode_balance(value: int) -> str:
+    return f"{value:0{_BALANCE_DIGITS}d}"
+
+
+class TransferIndexer:
+    """Follows one token's Transfer logs and keeps every holder's balance in SQLite.
+
+    ``sync`` indexes from the last checkpoint up to the chain head (minus
+    ``confirmations``) in ``chunk_size``-block ranges; a range the node
+    rejects (timeout, result limit) is fetched in halves. Each range is
+    applied in one SQLite transaction together with a checkpoint of its
+    last block's hash. Before indexing further, the newest checkpoint is
+    compared with the chain; after a reorg the index rolls back to the newest
+    checkpoint still on the chain and re-indexes from there.
+    """
+
+    def __init__(
+        self,
+        provider: RootstockProvider,
+        token: ERC20Token | str,
+        path: str | Path,
+        start_block: int = 0,
+        confirmations: int = 0,
+        chunk_size: int = 2_000,
+        keep_checkpoints: int = 128,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._provider = provider
+        address = token.address if isinstance(token, ERC20Token) else token
+        self._token = normalize_address_for_web3(address)
+        self._path = str(path)
+        self._start_block = start_block
+        self._confirmations = confirmations
+        self._chunk_size = chunk_size
+        self._keep_checkpoints = keep_checkpoints
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA)
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('token', ?)",
+                (self._token.lower(),),
+            )
+            stored = conn.execute("SELECT value FROM meta WHERE key = 'token'").fetchone()[0]
+        if stored != self._token.lower():
+            raise ValueError(f"{self._path} indexes token {stored}, not {self._token}")
+
+    @property
+    def token(self) -> str:
+        return self._token
+
+    @property
+    def last_block(self) -> int:
+        """Highest block whose transfers are fully indexed."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT MAX(block_number) FROM checkpoints").fetchone()
+        return row[0] if row[0] is not None else self._start_block - 1
+
+    def sync(self, to_block: int | None = None) -> int:
+        """Index new blocks and return the number of transfers added."""
+        with self._sync_lock:
+            head = self._provider.get_block_number() - self._confirmations
+            if to_block is not None:
+                head = min(head, to_block)
+            self._handle_reorg()
+            added = 0
+            start = self.last_block + 1
+            while start <= head and not self._stop.is_set():
+                end = min(start + self._chunk_size - 1, head)
+                added += self._index_range(start, end)
+                start = end + 1
+            return added
+
+    def start(self, poll_interval: float = 30.0) -> None:
+        """Run ``sync`` on a background daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(poll_interval,), name="rootstock-indexer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def balance_of(self, holder: str) -> int:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT balance FROM balances WHERE holder = ?", (holder.lower(),)
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def balance_at(self, holder: str, block: int) -> int:
+        """Balance of ``holder`` at the end of ``block``, computed from stored transfers."""
+        addr = holder.lower()
+        with closing(self._connect()) as conn:
+            received = conn.execute(
+                "SELECT value FROM transfers WHERE to_address = ? AND block_number <= ?",
+                (addr, block),
+            ).fetchall()
+            sent = conn.execute(
+                "SELECT value FROM transfers WHERE from_address = ? AND block_number <= ?",
+                (addr, block),
+            ).fetchall()
+        return sum(int(v) for (v,) in received) - sum(int(v) for (v,) in sent)
+
+    def top_holders(self, limit: int = 100) -> list[tuple[str, int]]:
+        """Largest holders first, as (checksum address, balance) pairs."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT holder, balance FROM balances ORDER BY balance DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [(normalize_address_for_web3(h), int(b)) for h, b in rows]
+
+    def holder_count(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM balances").fetchone()[0]
+
+    def _run(self, poll_interval: float) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sync()
+            except Exception:
+                logger.exception("Indexer sync failed")
+            self._stop.wait(poll_interval)
+
+    def _index_range(self, start: int, end: int) -> int:
+        logs, _ = _fetch_range(
+            self._provider, {"address": self._token, "topics": [TRANSFER_TOPIC]}, start, end
+        )
+        # Fetched after the logs: if a reorg slips in between, the next sync sees a mismatch.
+        end_hash = to_hex(self._provider.get_block(end)["hash"])
+
+        rows = []
+        deltas: dict[str, int] = {}
+        for item in decode_erc20_logs(logs, checksum=False):
+            if item.event != "Transfer":
+                continue
+            rows.append(
+                (
+                    item.block_number,
+                    item.log_index,
+                    item.tx_hash,
+                    item.from_address,
+                    item.to_address,
+                    str(item.value),
+                )
+            )
+            deltas[item.from_address] = deltas.get(item.from_address, 0) - item.value
+            deltas[item.to_address] = deltas.get(item.to_address, 0) + item.value
+
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO transfers VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._apply_deltas(conn, deltas)
+            conn.execute("INSERT OR REPLACE INTO checkpoints VALUES (?, ?)", (end, end_hash))
+            conn.execute(
+                "DELETE FROM checkpoints WHERE block_number NOT IN "
+                "(SELECT block_number FROM checkpoints ORDER BY block_number DESC LIMIT ?)",
+                (self._keep_checkpoints,),
+            )
+        logger.debug("Indexed blocks %d..%d: %d transfers", start, end, len(rows))
+        return len(rows)
+
+    def _handle_reorg(self) -> None:
+        with closing(self._connect()) as conn:
+            checkpoints = conn.execute(
+                "SELECT block_number, block_hash FROM checkpoints ORDER BY block_number DESC"
+            ).fetchall()
+        if not checkpoints:
+            return
+        for i, (number, block_hash) in enumerate(checkpoints):
+            if to_hex(self._provider.get_block(number)["hash"]) == block_hash:
+                if i > 0:
+                    self._rollback(number)
+                return
+        logger.warning("No checkpoint of %s survived a reorg; re-indexing", self._token)
+        self._rollback(self._start_block - 1)
+
+    def _rollback(self, fork_block: int) -> None:
+        with closing(self._connect()) as conn, conn:
+            removed = conn.execute(
+                "SELECT from_address, to_address, value FROM transfers WHERE block_number > ?",
+                (fork_block,),
+            ).fetchall()
+            deltas: dict[str, int] = {}
+            for from_addr, to_addr, value in removed:
+                deltas[from_addr] = deltas.get(from_addr, 0) + int(value)
+                deltas[to_addr] = deltas.get(to_addr, 0) - int(value)
+            self._apply_deltas(conn, deltas)
+            conn.execute("DELETE FROM transfers WHERE block_number > ?", (fork_block,))
+            conn.execute("DELETE FROM checkpoints WHERE block_number > ?", (fork_block,))
+        logger.warning(
+            "Reorg: rolled %s back to block %d (%d transfers removed)",
+            self._token,
+            fork_block,
+            len(removed),
+        )
+
+    @staticmethod
+    def _apply_deltas(conn: sqlite3.Connection, deltas: dict[str, int]) -> None:
+        # Mints and burns move tokens to and from the zero address, which is not a holder.
+        deltas.pop(ZERO_ADDRESS, None)
+        holders = [h for h, d in deltas.items() if d != 0]
+        current: dict[str, int] = {}
+        for i in range(0, len(holders), 500):
+            chunk = holders[i : i + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            for holder, balance in conn.execute(
+                f"SELECT holder, balance FROM balances WHERE holder IN ({placeholders})", chunk
+            ):
+                current[holder] = int(balance)
+        updated = [(h, current.get(h, 0) + deltas[h]) for h in holders]
+        conn.executemany(
+            "INSERT OR REPLACE INTO balances VALUES (?, ?)",
+            [(h, _encode_balance(b)) for h, b in updated if b != 0],
+        )
+        conn.executemany(
+            "DELETE FROM balances WHERE holder = ?", [(h,) for h, b in updated if b == 0]
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=30.0)
+
+    def __repr__(self) -> str:
+        return f"TransferIndexer(token={self._token!r}, path={self._path!r})"
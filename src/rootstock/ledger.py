@@ -0,0 +1,120 @@
+"""Local RBTC balance ledger for wallets that send in bursts."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from rootstock.exceptions import InsufficientFundsError
+from rootstock.provider import RootstockProvider
+
+logger = logging.getLogger(__name__)
+
+
+class BalanceLedger:
+    """Tracks one wallet's spendable balance without a get_balance call per send.
+
+    The ledger snapshots the on-chain balance and transaction count at one
+    block, then debits each pending transaction locally by its worst-case
+    cost (value + gas * gasPrice), keyed by nonce. Once a receipt lands the
+    reservation shrinks to the actual cost; reservations for nonces below the
+    snapshot's transaction count are dropped when the ledger reconciles
+    against a newer block. Reconciliation happens when the snapshot is older
+    than ``max_age`` seconds and once more before refusing a send.
+    """
+
+    def __init__(self, provider: RootstockProvider, address: str, max_age: float = 30.0):
+        self._provider = provider
+        self._address = address
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._reservations: dict[int, int] = {}
+        self._balance = 0
+        self._chain_nonce = 0
+        self._block: int | None = None
+        self._fetched_at = 0.0
+
+    @property
+    def address(self) -> str:
+        return self._address
+
+    @property
+    def available(self) -> int:
+        """Spendable balance in wei after subtracting pending reservations."""
+        with self._lock:
+            if self._block is None:
+                self._refresh()
+            return self._available()
+
+    @property
+    def pending(self) -> dict[int, int]:
+        with self._lock:
+            return dict(self._reservations)
+
+    def reserve(self, nonce: int, amount: int) -> None:
+        """Debit ``amount`` wei for the transaction with ``nonce``.
+
+        Raises InsufficientFundsError if the balance cannot cover it, even
+        after re-reading it from the chain.
+        """
+        with self._lock:
+            if self._block is None or time.monotonic() - self._fetched_at >= self._max_age:
+                self._reconcile()
+            available = self._available(exclude=nonce)
+            if available < amount:
+                self._reconcile()
+                available = self._available(exclude=nonce)
+            if available < amount:
+                raise InsufficientFundsError(
+                    f"Insufficient funds: balance {available} wei < required {amount} wei"
+                )
+            self._reservations[nonce] = amount
+
+    def settle(self, nonce: int, actual_cost: int) -> None:
+        """Record the actual cost of a mined transaction."""
+        with self._lock:
+            if nonce in self._reservations:
+                self._reservations[nonce] = actual_cost
+
+    def release(self, nonce: int) -> None:
+        """Drop the reservation of a transaction that was never broadcast."""
+        with self._lock:
+            self._reservations.pop(nonce, None)
+
+    def reconcile(self) -> None:
+        """Re-read the balance if the chain head moved since the last snapshot."""
+        with self._lock:
+            self._reconcile()
+
+    def _reconcile(self) -> None:
+        head = self._provider.get_block_number()
+        if head == self._block:
+            self._fetched_at = time.monotonic()
+            return
+        self._refresh(head)
+
+    def _refresh(self, block: int | None = None) -> None:
+        if block is None:
+            block = self._provider.get_block_number()
+        # Balance and nonce are read at the same block so they agree on what has been mined.
+        self._balance = self._provider.get_balance(self._address, block)
+        self._chain_nonce = self._provider.get_transaction_count(self._address, block)
+        self._block = block
+        self._fetched_at = time.monotonic()
+        for nonce in [n for n in self._reservations if n < self._chain_nonce]:
+            del self._reservations[nonce]
+        logger.debug(
+            "Ledger for %s at block %d: balance=%d, pending=%d",
+            self._address,
+            block,
+            self._balance,
+            len(self._reservations),
+        )
+
+    def _available(self, exclude: int | None = None) -> int:
+        reserved = sum(amount for n, amount in self._reservations.items() if n != exclude)
+        return self._balance - reserved
+
+    def __repr__(self) -> str:
+        return f"BalanceLedger(address={self._address!r}, pending={len(self._reservations)})"
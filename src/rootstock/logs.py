@@ -0,0 +1,462 @@
+"""Streaming ``eth_getLogs`` over long block ranges, across many contracts, and live."""
+
+from __future__ import annotations
+
+import contextlib
+import heapq
+import json
+import logging
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from hexbytes import HexBytes
+
+from rootstock._abi import bind_contract
+from rootstock._utils.checksum import normalize_address_for_web3
+from rootstock._utils.encoding import to_hex
+from rootstock.exceptions import ABIError, ProviderError
+from rootstock.provider import RootstockProvider
+from rootstock.types import BlockIdentifier
+
+if TYPE_CHECKING:
+    from rootstock.contracts import Contract
+    from rootstock.tokens import ERC20Token
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_block(provider: RootstockProvider, block: BlockIdentifier) -> int:
+    if isinstance(block, int):
+        return block
+    if block == "latest":
+        return provider.get_block_number()
+    return provider.get_block(block)["number"]
+
+
+def _fetch_range(
+    provider: RootstockProvider, filter_params: dict, start: int, end: int
+) -> tuple[list[dict], bool]:
+    """Fetch ``start..end``, halving the range on errors. Also returns whether it had to split."""
+    try:
+        return provider.get_logs({**filter_params, "fromBlock": start, "toBlock": end}), False
+    except ProviderError:
+        if start == end:
+            raise
+    mid = (start + end) // 2
+    logger.debug("eth_getLogs %d..%d failed; splitting", start, end)
+    left, _ = _fetch_range(provider, filter_params, start, mid)
+    right, _ = _fetch_range(provider, filter_params, mid + 1, end)
+    return left + right, True
+
+
+def iter_logs(
+    provider: RootstockProvider,
+    filter_params: dict,
+    from_block: int = 0,
+    to_block: BlockIdentifier = "latest",
+    chunk_size: int = 2_000,
+    max_chunk_size: int = 100_000,
+    target_logs: int = 5_000,
+    concurrency: int = 4,
+) -> Iterator[dict]:
+    """Yield every log matching ``filter_params`` between two blocks, in chain order.
+
+    The range is fetched in chunks, ``concurrency`` at a time, and only
+    those chunks are held in memory. Chunk size adapts: it doubles (up to
+    ``max_chunk_size``) while chunks return well under ``target_logs``,
+    halves when they return more, and a chunk the node rejects (timeout,
+    result limit) is split in half until it succeeds.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    end_block = _resolve_block(provider, to_block)
+    filter_params = {k: v for k, v in filter_params.items() if k not in ("fromBlock", "toBlock")}
+    size = chunk_size
+    next_start = from_block
+    pending: deque[Future] = deque()
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        try:
+            while pending or next_start <= end_block:
+                while len(pending) < max(1, concurrency) and next_start <= end_block:
+                    end = min(next_start + size - 1, end_block)
+                    pending.append(
+                        pool.submit(_fetch_range, provider, filter_params, next_start, end)
+                    )
+                    next_start = end + 1
+                logs, split = pending.popleft().result()
+                if split or len(logs) > target_logs:
+                    size = max(1, size // 2)
+                elif len(logs) < target_logs // 4:
+                    size = min(max_chunk_size, size * 2)
+                yield from logs
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _log_to_json(log: dict) -> dict:
+    out = {}
+    for key, value in log.items():
+        if isinstance(value, (bytes, bytearray)):
+            value = to_hex(value)
+        elif key == "topics":
+            value = [to_hex(t) for t in value]
+        out[key] = value
+    return out
+
+
+def _log_from_json(log: dict) -> dict:
+    out = dict(log)
+    out["topics"] = [HexBytes(t) for t in log["topics"]]
+    for key in ("data", "blockHash", "transactionHash"):
+        if key in out:
+            out[key] = HexBytes(out[key])
+    return out
+
+
+class LogFollower:
+    """Delivers new logs matching a filter, in order, as blocks arrive.
+
+    Each ``poll`` first checks the newest remembered block hash against the
+    chain. After a reorg it rewinds to the newest remembered block still on
+    the chain and returns copies of the logs it had delivered from orphaned
+    blocks, newest first, with ``removed`` set to True. Then it returns the
+    logs of up to ``chunk_size`` new blocks (``removed`` False), leaving the
+    newest ``confirmations`` blocks for later.
+
+    Once caught up with ``confirmations=0`` it switches to an ``eth_newFilter``
+    log filter, and goes back to range polling for good if the node rejects
+    or forgets the filter.
+
+    With a ``checkpoint_path`` the position, recent block hashes and recently
+    delivered logs are written to a JSON file after every batch, so a new
+    follower on the same file resumes where the last one stopped and can
+    still report removals for logs it delivered before a restart.
+    """
+
+    def __init__(
+        self,
+        provider: RootstockProvider,
+        filter_params: dict,
+        from_block: int | None = None,
+        checkpoint_path: str | Path | None = None,
+        confirmations: int = 0,
+        poll_interval: float = 5.0,
+        chunk_size: int = 2_000,
+        use_filter: bool = True,
+        keep_blocks: int = 128,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._provider = provider
+        self._params = {
+            k: v for k, v in filter_params.items() if k not in ("fromBlock", "toBlock")
+        }
+        self._checkpoint_path = str(checkpoint_path) if checkpoint_path is not None else None
+        self._confirmations = confirmations
+        self._poll_interval = poll_interval
+        self._chunk_size = chunk_size
+        self._use_filter = use_filter and confirmations == 0
+        self._keep_blocks = keep_blocks
+        self._filter_id: str | None = None
+        self._caught_up = False
+        self._hashes: dict[int, str] = {}
+        self._delivered: dict[int, list[dict]] = {}
+        self._stop = threading.Event()
+        if self._checkpoint_path is not None and os.path.exists(self._checkpoint_path):
+            self._load()
+        else:
+            self._next_block = (
+                provider.get_block_number() + 1 if from_block is None else from_block
+            )
+
+    @property
+    def next_block(self) -> int:
+        """First block whose logs have not been delivered yet."""
+        return self._next_block
+
+    def poll(self) -> list[dict]:
+        """Return removals and new logs since the last poll, and save the checkpoint."""
+        batch = self._fetch()
+        self._save()
+        return batch
+
+    def follow(self) -> Iterator[dict]:
+        """Yield logs forever (until ``stop``), sleeping ``poll_interval`` once caught up.
+
+        The checkpoint is saved after each batch has been consumed. If the
+        consumer stops in the middle of a batch, that batch is delivered
+        again next time.
+        """
+        self._stop.clear()
+        try:
+            while not self._stop.is_set():
+                state = self._state()
+                batch = self._fetch()
+                try:
+                    yield from batch
+                except GeneratorExit:
+                    self._restore(state)
+                    raise
+                self._save()
+                if self._caught_up:
+                    self._stop.wait(self._poll_interval)
+        finally:
+            self._uninstall_filter()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _fetch(self) -> list[dict]:
+        batch = self._check_reorg()
+        head = self._provider.get_block_number() - self._confirmations
+        self._caught_up = True
+        if self._filter_id is not None:
+            filtered = self._filter_changes()
+            if filtered is not None:
+                return batch + filtered
+        if self._next_block > head:
+            return batch
+
+        end = min(head, self._next_block + self._chunk_size - 1)
+        if self._use_filter and end == head and self._filter_id is None:
+            # Installed before reading the range, so no block falls between the two.
+            self._install_filter(head + 1)
+        logs = self._provider.get_logs(
+            {**self._params, "fromBlock": self._next_block, "toBlock": end}
+        )
+        # Read after the logs: if a reorg slips in between, the next poll sees a mismatch.
+        self._hashes[end] = to_hex(self._provider.get_block(end)["hash"])
+        self._next_block = end + 1
+        self._caught_up = end == head
+        return batch + self._deliver(sorted(logs, key=lambda g: (g["blockNumber"], g["logIndex"])))
+
+    def _deliver(self, logs: list[dict]) -> list[dict]:
+        out = []
+        for log in logs:
+            block = log["blockNumber"]
+            seen = self._delivered.get(block, [])
+            if any(d["logIndex"] == log["logIndex"] for d in seen):
+                continue
+            entry = {**log, "removed": False}
+            self._delivered[block] = [*seen, entry]
+            self._hashes.setdefault(block, to_hex(log["blockHash"]))
+            out.append(entry)
+        self._prune()
+        return out
+
+    def _remove_after(self, fork_block: int) -> list[dict]:
+        removed = []
+        for block in sorted((b for b in self._delivered if b > fork_block), reverse=True):
+            removed.extend(
+                {**log, "removed": True} for log in reversed(self._delivered.pop(block))
+            )
+        for block in [b for b in self._hashes if b > fork_block]:
+            del self._hashes[block]
+        self._next_block = min(self._next_block, fork_block + 1)
+        if removed:
+            logger.warning("Reorg: %d logs removed after block %d", len(removed), fork_block)
+        return removed
+
+    def _check_reorg(self) -> list[dict]:
+        blocks = sorted(self._hashes, reverse=True)
+        for i, number in enumerate(blocks):
+            if to_hex(self._provider.get_block(number)["hash"]) == self._hashes[number]:
+                return self._remove_after(number) if i > 0 else []
+        if not blocks:
+            return []
+        logger.warning("No remembered block survived a reorg; rewinding to block %d", blocks[-1])
+        return self._remove_after(blocks[-1] - 1)
+
+    def _install_filter(self, from_block: int) -> None:
+        try:
+            self._filter_id = self._provider.new_filter({**self._params, "fromBlock": from_block})
+        except ProviderError as exc:
+            logger.info("eth_newFilter unavailable, polling block ranges: %s", exc)
+            self._use_filter = False
+
+    def _filter_changes(self) -> list[dict] | None:
+        try:
+            changes = self._provider.get_filter_changes(self._filter_id)
+        except ProviderError as exc:
+            logger.warning("Log filter failed, falling back to range polling: %s", exc)
+            self._filter_id = None
+            self._use_filter = False
+            return None
+        removed = [c for c in changes if c.get("removed")]
+        batch: list[dict] = []
+        if removed:
+            batch = self._remove_after(min(c["blockNumber"] for c in removed) - 1)
+        added = sorted(
+            (c for c in changes if not c.get("removed")),
+            key=lambda g: (g["blockNumber"], g["logIndex"]),
+        )
+        batch += self._deliver(added)
+        if added:
+            self._next_block = max(self._next_block, added[-1]["blockNumber"] + 1)
+        return batch
+
+    def _uninstall_filter(self) -> None:
+        if self._filter_id is None:
+            return
+        with contextlib.suppress(ProviderError):
+            self._provider.uninstall_filter(self._filter_id)
+        self._filter_id = None
+
+    def _prune(self) -> None:
+        if not self._hashes:
+            return
+        oldest = max(self._hashes) - self._keep_blocks
+        for block in [b for b in self._hashes if b <= oldest]:
+            del self._hashes[block]
+        for block in [b for b in self._delivered if b <= oldest]:
+            del self._delivered[block]
+
+    def _state(self) -> dict:
+        return {
+            "next_block": self._next_block,
+            "hashes": dict(self._hashes),
+            "delivered": dict(self._delivered),
+        }
+
+    def _restore(self, state: dict) -> None:
+        self._next_block = state["next_block"]
+        self._hashes = state["hashes"]
+        self._delivered = state["delivered"]
+
+    def _save(self) -> None:
+        if self._checkpoint_path is None:
+            return
+        state = {
+            "next_block": self._next_block,
+            "hashes": {str(b): h for b, h in self._hashes.items()},
+            "logs": {
+                str(b): [
+                    _log_to_json({k: v for k, v in log.items() if k != "removed"}) for log in logs
+                ]
+                for b, logs in self._delivered.items()
+            },
+        }
+        tmp = self._checkpoint_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self._checkpoint_path)
+
+    def _load(self) -> None:
+        with open(self._checkpoint_path, encoding="utf-8") as f:
+            state = json.load(f)
+        self._next_block = state["next_block"]
+        self._hashes = {int(b): h for b, h in state["hashes"].items()}
+        self._delivered = {
+            int(b): [{**_log_from_json(log), "removed": False} for log in logs]
+            for b, logs in state["logs"].items()
+        }
+        logger.info("Resuming logs from block %d (%s)", self._next_block, self._checkpoint_path)
+
+    def __repr__(self) -> str:
+        return f"LogFollower(next_block={self._next_block})"
+
+
+class LogQuery:
+    """Fetches events of many contracts with one ``eth_getLogs`` filter per range.
+
+    Events are registered per contract with ``add``. The query asks the node
+    for logs from any registered address whose topic0 is any registered
+    event, in up to ``max_addresses`` addresses per filter. It then decodes
+    each log with the decoder registered for its (address, topic0) pair.
+    The filter matches every address/event combination, so logs of an event
+    that was not registered for that address are dropped.
+    """
+
+    def __init__(
+        self,
+        provider: RootstockProvider,
+        chunk_size: int = 2_000,
+        concurrency: int = 4,
+        max_addresses: int = 1_000,
+    ):
+        if max_addresses < 1:
+            raise ValueError("max_addresses must be at least 1")
+        self._provider = provider
+        self._chunk_size = chunk_size
+        self._concurrency = concurrency
+        self._max_addresses = max_addresses
+        self._decoders: dict[tuple[str, str], Callable[[dict], dict]] = {}
+
+    def add(self, target: Contract | ERC20Token, *event_names: str) -> LogQuery:
+        """Watch ``event_names`` (default: every event in its ABI) on a contract."""
+        web3_contract = target.web3_contract
+        if not event_names:
+            event_names = tuple(e["name"] for e in web3_contract.abi if e.get("type") == "event")
+        for name in event_names:
+            try:
+                event = web3_contract.events[name]
+            except (KeyError, AttributeError) as exc:
+                raise ABIError(f"Event {name!r} not found in ABI") from exc
+            self._decoders[(target.address.lower(), to_hex(event.topic))] = event.process_log
+        return self
+
+    def add_event(self, address: str, event_abi: dict) -> LogQuery:
+        """Watch an event given by its ABI entry on any contract address."""
+        address = normalize_address_for_web3(address)
+        contract = bind_contract(self._provider.w3, address, [event_abi])
+        event = contract.events[event_abi["name"]]
+        self._decoders[(address.lower(), to_hex(event.topic))] = event.process_log
+        return self
+
+    @property
+    def addresses(self) -> list[str]:
+        return sorted({address for address, _ in self._decoders})
+
+    @property
+    def topics(self) -> list[str]:
+        return sorted({topic for _, topic in self._decoders})
+
+    def iter_events(
+        self, from_block: int = 0, to_block: BlockIdentifier = "latest"
+    ) -> Iterator[dict]:
+        """Yield decoded events of every registered contract, in chain order."""
+        if not self._decoders:
+            return
+        to_block = _resolve_block(self._provider, to_block)
+        addresses = [normalize_address_for_web3(a) for a in self.addresses]
+        topics = [self.topics]
+        streams = [
+            iter_logs(
+                self._provider,
+                {"address": addresses[i : i + self._max_addresses], "topics": topics},
+                from_block,
+                to_block,
+                chunk_size=self._chunk_size,
+                concurrency=self._concurrency,
+            )
+            for i in range(0, len(addresses), self._max_addresses)
+        ]
+        logs = streams[0] if len(streams) == 1 else heapq.merge(*streams, key=_log_order)
+        decoders = self._decoders
+        for log in logs:
+            log_topics = log["topics"]
+            if not log_topics:
+                continue
+            decoder = decoders.get((log["address"].lower(), to_hex(log_topics[0])))
+            if decoder is not None:
+                yield dict(decoder(log))
+
+    def get_events(self, from_block: int = 0, to_block: BlockIdentifier = "latest") -> list[dict]:
+        return list(self.iter_events(from_block, to_block))
+
+    def __len__(self) -> int:
+        return len(self._decoders)
+
+    def __repr__(self) -> str:
+        return f"LogQuery(addresses={len(self.addresses)}, events={len(self._decoders)})"
+
+
+def _log_order(log: dict) -> tuple[int, int]:
+    return log["blockNumber"], log["logIndex"]
@@ -0,0 +1,131 @@
+"""Batching many read-only calls into one eth_call via Multicall3."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from eth_abi import decode, encode
+from eth_utils.abi import collapse_if_tuple
+
+from rootstock._utils.abi import function_codec, output_decoder
+from rootstock._utils.checksum import normalize_address_for_web3
+from rootstock.constants import MULTICALL3, ChainId
+from rootstock.exceptions import ABIError, ContractError, RPCError
+from rootstock.provider import RootstockProvider
+from rootstock.types import BlockIdentifier
+
+if TYPE_CHECKING:
+    from rootstock.contracts import Contract
+    from rootstock.tokens import ERC20Token
+
+logger = logging.getLogger(__name__)
+
+# aggregate3((address target, bool allowFailure, bytes callData)[])
+_AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+_AGGREGATE3_RESULT = ["(bool,bytes)[]"]
+
+
+class Multicall:
+    """Collects view calls on any number of contracts and runs them in few eth_calls.
+
+    Calls are queued with ``add`` (or ``add_call`` for raw calldata) and run
+    by ``execute``, which returns the decoded results in the order they were
+    added. Each ``batch_size`` calls become one ``aggregate3`` call; batches
+    run on up to ``concurrency`` threads. With ``allow_failure=True`` a call
+    that reverts yields None; otherwise any revert fails the whole batch with
+    ContractError.
+    """
+
+    def __init__(
+        self,
+        provider: RootstockProvider,
+        address: str | None = None,
+        allow_failure: bool = False,
+        batch_size: int = 500,
+        concurrency: int = 4,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if address is None:
+            try:
+                address = MULTICALL3[ChainId(provider.chain_id)]
+            except (KeyError, ValueError):
+                raise ValueError(
+                    f"No Multicall3 address known for chain ID {provider.chain_id}; pass address="
+                ) from None
+        self._provider = provider
+        self._address = normalize_address_for_web3(address)
+        self._allow_failure = allow_failure
+        self._batch_size = batch_size
+        self._concurrency = max(1, concurrency)
+        self._calls: list[tuple[str, bytes, Callable[[bytes], object]]] = []
+
+    @property
+    def address(self) -> str:
+        return self._address
+
+    def add(self, target: Contract | ERC20Token, function_name: str, *args) -> int:
+        """Queue a view function call and return its index in the results."""
+        web3_contract = target.web3_contract
+        try:
+            fn = web3_contract.functions[function_name](*args)
+        except (KeyError, AttributeError) as exc:
+            raise ABIError(f"Function {function_name!r} not found in ABI") from exc
+        output_types = [collapse_if_tuple(o) for o in fn.abi.get("outputs", [])]
+        data = function_codec(fn.abi).encode(*args)
+        return self.add_call(target.address, data, output_types)
+
+    def add_call(self, target: str, data: bytes | str, output_types: list[str]) -> int:
+        """Queue a call from raw calldata, decoding its return data as ``output_types``."""
+        if isinstance(data, str):
+            data = bytes.fromhex(data.removeprefix("0x"))
+        self._calls.append(
+            (normalize_address_for_web3(target), data, output_decoder(tuple(output_types)))
+        )
+        return len(self._calls) - 1
+
+    def execute(self, block: BlockIdentifier = "latest") -> list[object]:
+        """Run every queued call and clear the queue."""
+        calls, self._calls = self._calls, []
+        if not calls:
+            return []
+        batches = [calls[i : i + self._batch_size] for i in range(0, len(calls), self._batch_size)]
+        if len(batches) == 1 or self._concurrency == 1:
+            results = [self._run_batch(batch, block) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self._concurrency, len(batches))) as pool:
+                results = list(pool.map(lambda batch: self._run_batch(batch, block), batches))
+        logger.debug("Multicall ran %d calls in %d eth_calls", len(calls), len(batches))
+        return [value for batch in results for value in batch]
+
+    def _run_batch(self, batch: list, block: BlockIdentifier) -> list[object]:
+        payload = _AGGREGATE3_SELECTOR + encode(
+            ["(address,bool,bytes)[]"],
+            [[(target, self._allow_failure, data) for target, data, _ in batch]],
+        )
+        try:
+            raw = self._provider.call({"to": self._address, "data": payload}, block)
+        except RPCError as exc:
+            raise ContractError(f"Multicall batch failed: {exc}") from exc
+        (returned,) = decode(_AGGREGATE3_RESULT, raw)
+        values: list[object] = []
+        for (_, _, decode_output), (success, data) in zip(batch, returned, strict=True):
+            if not success:
+                values.append(None)
+                continue
+            try:
+                values.append(decode_output(data))
+            except Exception:
+                if not self._allow_failure:
+                    raise ContractError("Multicall returned undecodable data") from None
+                values.append(None)
+        return values
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __repr__(self) -> str:
+        return f"Multicall(address={self._address!r}, queued={len(self._calls)})"
@@ -0,0 +1,182 @@
+"""Nonce allocation backends shared between processes sending from one wallet."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from contextlib import closing
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+ALLOCATED = "allocated"
+BROADCAST = "broadcast"
+CONFIRMED = "confirmed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nonces (
+    address TEXT NOT NULL,
+    nonce INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    tx_hash TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (address, nonce)
+)
+"""
+
+
+class NonceAllocator(ABC):
+    """Interface for nonce backends used by TransactionBuilder.
+
+    ``allocate`` receives the on-chain transaction count and returns the first
+    nonce of a contiguous block of ``count`` nonces reserved for the caller.
+    """
+
+    @abstractmethod
+    def allocate(self, address: str, chain_nonce: int, count: int = 1) -> int: ...
+
+    @abstractmethod
+    def mark_broadcast(self, address: str, nonce: int, tx_hash: str) -> None: ...
+
+    @abstractmethod
+    def mark_confirmed(self, address: str, nonce: int) -> None: ...
+
+    @abstractmethod
+    def release(self, address: str, nonce: int) -> None:
+        """Return an allocated nonce that was never broadcast."""
+
+    @abstractmethod
+    def reset(self, address: str) -> None: ...
+
+
+class SQLiteNonceAllocator(NonceAllocator):
+    """Nonce allocator backed by a SQLite file on local disk.
+
+    Every allocation runs inside a ``BEGIN IMMEDIATE`` transaction, so SQLite's
+    file lock serializes workers (e.g. gunicorn processes) that share the file.
+    Each nonce is recorded as allocated, broadcast or confirmed; released
+    nonces are deleted and handed out again to fill the gap.
+
+    A nonce still allocated ``lease_seconds`` after it was handed out (its
+    worker died before broadcasting) is taken back and reused, so it cannot
+    hold every later nonce behind a gap. The lease must comfortably exceed
+    the time between ``allocate`` and broadcast; None disables reclaiming.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        timeout: float = 30.0,
+        history: int = 1024,
+        lease_seconds: float | None = 300.0,
+    ):
+        self._path = str(path)
+        self._timeout = timeout
+        self._history = history
+        self._lease_seconds = lease_seconds
+        with closing(self._connect()) as conn:
+            conn.execute(_SCHEMA)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def allocate(self, address: str, chain_nonce: int, count: int = 1) -> int:
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        addr = address.lower()
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Anything below the on-chain count has been mined (by us or a replacement).
+            conn.execute(
+                "UPDATE nonces SET state = ?, updated_at = ? "
+                "WHERE address = ? AND nonce < ? AND state != ?",
+                (CONFIRMED, now, addr, chain_nonce, CONFIRMED),
+            )
+            conn.execute(
+                "DELETE FROM nonces WHERE address = ? AND nonce < ?",
+                (addr, chain_nonce - self._history),
+            )
+            if self._lease_seconds is not None:
+                expired = conn.execute(
+                    "DELETE FROM nonces WHERE address = ? AND state = ? AND updated_at < ?",
+                    (addr, ALLOCATED, now - self._lease_seconds),
+                ).rowcount
+                if expired:
+                    logger.warning(
+                        "Reclaimed %d nonce(s) of %s whose lease expired", expired, address
+                    )
+            taken = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT nonce FROM nonces WHERE address = ? AND nonce >= ? ORDER BY nonce",
+                    (addr, chain_nonce),
+                )
+            ]
+            start = chain_nonce
+            for nonce in taken:
+                if nonce >= start + count:
+                    break
+                start = nonce + 1
+            conn.executemany(
+                "INSERT INTO nonces (address, nonce, state, tx_hash, updated_at) "
+                "VALUES (?, ?, ?, NULL, ?)",
+                [(addr, n, ALLOCATED, now) for n in range(start, start + count)],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        logger.debug("Allocated nonces %d..%d for %s", start, start + count - 1, address)
+        return start
+
+    def mark_broadcast(self, address: str, nonce: int, tx_hash: str) -> None:
+        self._upsert(address, nonce, BROADCAST, tx_hash)
+
+    def mark_confirmed(self, address: str, nonce: int) -> None:
+        self._upsert(address, nonce, CONFIRMED, None)
+
+    def release(self, address: str, nonce: int) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "DELETE FROM nonces WHERE address = ? AND nonce = ? AND state = ?",
+                (address.lower(), nonce, ALLOCATED),
+            )
+
+    def reset(self, address: str) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM nonces WHERE address = ?", (address.lower(),))
+
+    def get_state(self, address: str, nonce: int) -> str | None:
+        """Return the recorded state of a nonce, or None if it is free."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT state FROM nonces WHERE address = ? AND nonce = ?",
+                (address.lower(), nonce),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _upsert(self, address: str, nonce: int, state: str, tx_hash: str | None) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO nonces (address, nonce, state, tx_hash, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (address, nonce) DO UPDATE SET state = excluded.state, "
+                "tx_hash = COALESCE(excluded.tx_hash, nonces.tx_hash), "
+                "updated_at = excluded.updated_at",
+                (address.lower(), nonce, state, tx_hash, time.time()),
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A fresh connection per operation keeps the allocator safe across fork().
+        return sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+
+    def __repr__(self) -> str:
+        return f"SQLiteNonceAllocator(path={self._path!r})"
@@ -0,0 +1,340 @@
+"""Durable outbox for outgoing transactions, stored in SQLite."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from eth_hash.auto import keccak
+
+from rootstock.constants import DEFAULT_GAS_LIMIT_TRANSFER
+from rootstock.exceptions import (
+    AddressError,
+    GasEstimationError,
+    ProviderConnectionError,
+    RootstockError,
+)
+from rootstock.provider import is_already_known_error
+from rootstock.transactions import TransactionBuilder, _normalize_data
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+SIGNED = "signed"
+BROADCAST = "broadcast"
+MINED = "mined"
+REVERTED = "reverted"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    to_address TEXT NOT NULL,
+    value TEXT NOT NULL,
+    data TEXT NOT NULL,
+    gas_limit INTEGER,
+    status TEXT NOT NULL,
+    nonce INTEGER,
+    tx_hash TEXT,
+    raw_tx TEXT,
+    error TEXT,
+    receipt TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+_COLUMNS = "key, to_address, value, data, gas_limit, status, nonce, tx_hash, error, receipt"
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """Snapshot of one outbox row."""
+
+    key: str
+    to: str
+    value: int
+    data: str
+    gas_limit: int | None
+    status: str
+    nonce: int | None = None
+    tx_hash: str | None = None
+    error: str | None = None
+    receipt: dict | None = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in (MINED, REVERTED, FAILED)
+
+
+def _json_default(obj: object) -> object:
+    if isinstance(obj, bytes):
+        return "0x" + obj.hex()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def _row_to_entry(row: tuple) -> OutboxEntry:
+    key, to, value, data, gas_limit, status, nonce, tx_hash, error, receipt = row
+    return OutboxEntry(
+        key=key,
+        to=to,
+        value=int(value),
+        data=data,
+        gas_limit=gas_limit,
+        status=status,
+        nonce=nonce,
+        tx_hash=tx_hash,
+        error=error,
+        receipt=json.loads(receipt) if receipt else None,
+    )
+
+
+class TransactionOutbox:
+    """Queue of transfer intents that survives process crashes.
+
+    Intents are enqueued under an idempotency key; enqueuing the same key
+    twice returns the existing entry. A worker (``process_once`` or the
+    background thread from ``start``) builds and signs each intent, stores the
+    signed transaction *before* broadcasting it, and records the receipt once
+    it is mined. After a restart, stored transactions that have no receipt are
+    rebroadcast as-is, so the same nonce and hash are reused.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        builder: TransactionBuilder,
+        max_per_second: float = 5.0,
+        batch_size: int = 50,
+    ):
+        if max_per_second <= 0:
+            raise ValueError("max_per_second must be positive")
+        self._path = str(path)
+        self._builder = builder
+        self._provider = builder.provider
+        self._interval = 1.0 / max_per_second
+        self._batch_size = batch_size
+        self._last_send = 0.0
+        self._recovered = False
+        self._nonce_floor = 0
+        self._process_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        with closing(self._connect()) as conn:
+            conn.execute(_SCHEMA)
+
+    def enqueue(
+        self,
+        key: str,
+        to: str,
+        value: int = 0,
+        data: bytes | str = b"",
+        gas_limit: int | None = None,
+    ) -> OutboxEntry:
+        """Add a transfer intent. Re-enqueuing an existing key returns the stored entry."""
+        if value < 0:
+            raise ValueError("value must be non-negative")
+        data_hex = _normalize_data(data)
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO outbox (key, to_address, value, data, gas_limit, status, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, to, str(value), data_hex, gas_limit, QUEUED, now, now),
+            )
+            row = conn.execute(f"SELECT {_COLUMNS} FROM outbox WHERE key = ?", (key,)).fetchone()
+        entry = _row_to_entry(row)
+        if (entry.to.lower(), entry.value, entry.data) != (to.lower(), value, data_hex):
+            raise ValueError(f"Idempotency key {key!r} already used for a different transfer")
+        return entry
+
+    def get(self, key: str) -> OutboxEntry | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(f"SELECT {_COLUMNS} FROM outbox WHERE key = ?", (key,)).fetchone()
+        return _row_to_entry(row) if row else None
+
+    def entries(self, status: str | None = None) -> list[OutboxEntry]:
+        query = f"SELECT {_COLUMNS} FROM outbox"
+        params: tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query + " ORDER BY id", params).fetchall()
+        return [_row_to_entry(row) for row in rows]
+
+    def process_once(self) -> int:
+        """Run one worker pass and return the number of newly broadcast intents.
+
+        The first pass after construction rebroadcasts every stored
+        transaction that has no receipt yet; later passes only retry those
+        whose broadcast was never acknowledged (e.g. after a connection error).
+        """
+        with self._process_lock:
+            if self._recovered:
+                self._rebroadcast((SIGNED,))
+            else:
+                self._rebroadcast((SIGNED, BROADCAST))
+                self._recovered = True
+            self._collect_receipts()
+            return self._send_queued()
+
+    def start(self, poll_interval: float = 5.0) -> None:
+        """Run the worker on a background daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(poll_interval,), name="rootstock-outbox", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, poll_interval: float) -> None:
+        while not self._stop.is_set():
+            try:
+                self.process_once()
+            except Exception:
+                logger.exception("Outbox worker pass failed")
+            self._stop.wait(poll_interval)
+
+    def _rebroadcast(self, statuses: tuple[str, ...]) -> None:
+        placeholders = ", ".join("?" for _ in statuses)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT key, status, nonce, tx_hash, raw_tx FROM outbox "
+                f"WHERE status IN ({placeholders}) ORDER BY nonce",
+                statuses,
+            ).fetchall()
+        for key, status, nonce, tx_hash, raw_tx in rows:
+            self._nonce_floor = max(self._nonce_floor, nonce + 1)
+            if self._provider.get_transaction_receipt(tx_hash) is not None:
+                continue
+            try:
+                self._provider.send_raw_transaction(bytes.fromhex(raw_tx[2:]))
+            except ProviderConnectionError as exc:
+                logger.warning("Rebroadcast of %s failed: %s", key, exc)
+                continue
+            except RootstockError as exc:
+                if is_already_known_error(exc):
+                    pass
+                elif status == SIGNED:
+                    # The node never accepted it, so it will not be mined: give up its nonce.
+                    self._fail_signed(key, nonce, exc)
+                    continue
+                else:
+                    logger.warning("Rebroadcast of %s failed: %s", key, exc)
+                    continue
+            self._builder._mark_broadcast(nonce, tx_hash)
+            self._update(key, status=BROADCAST)
+            logger.info("Rebroadcast outbox entry %s", key)
+
+    def _fail_signed(self, key: str, nonce: int, exc: Exception) -> None:
+        self._builder.release_nonce(nonce)
+        if self._nonce_floor == nonce + 1:
+            self._nonce_floor = nonce
+        else:
+            logger.warning("Nonce %d of %s is now a gap that later nonces wait behind", nonce, key)
+        self._update(key, status=FAILED, error=str(exc), raw_tx=None)
+        logger.warning("Rebroadcast of %s rejected, marked failed: %s", key, exc)
+
+    def _collect_receipts(self) -> None:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT key, tx_hash FROM outbox WHERE status IN (?, ?) ORDER BY nonce",
+                (SIGNED, BROADCAST),
+            ).fetchall()
+        for key, tx_hash in rows:
+            receipt = self._provider.get_transaction_receipt(tx_hash)
+            if receipt is None:
+                continue
+            status = MINED if receipt.get("status") != 0 else REVERTED
+            self._update(key, status=status, receipt=json.dumps(receipt, default=_json_default))
+
+    def _send_queued(self) -> int:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT key, to_address, value, data, gas_limit FROM outbox "
+                "WHERE status = ? ORDER BY id LIMIT ?",
+                (QUEUED, self._batch_size),
+            ).fetchall()
+        sent = 0
+        for key, to, value, data, gas_limit in rows:
+            if self._stop.is_set():
+                break
+            if self._send_one(key, to, int(value), data, gas_limit):
+                sent += 1
+        return sent
+
+    def _send_one(self, key: str, to: str, value: int, data: str, gas_limit: int | None) -> bool:
+        if gas_limit is None and data == "0x":
+            gas_limit = DEFAULT_GAS_LIMIT_TRANSFER
+        # Stored transactions from before a restart still hold their nonces.
+        nonce = self._builder._auto_nonce(minimum=self._nonce_floor)
+        try:
+            tx_dict = self._builder.build_transaction(
+                to=to, value=value, data=data, gas_limit=gas_limit, nonce=nonce
+            )
+        except (GasEstimationError, AddressError, ValueError) as exc:
+            self._builder.release_nonce(nonce)
+            self._update(key, status=FAILED, error=str(exc))
+            return False
+        except Exception:
+            # Possibly transient (e.g. the node is unreachable): leave it queued for the next pass.
+            self._builder.release_nonce(nonce)
+            raise
+
+        raw = self._builder.wallet.sign_transaction(tx_dict)
+        tx_hash = "0x" + keccak(raw).hex()
+        # Persist before broadcasting so a crash here is recovered by rebroadcasting.
+        self._update(key, status=SIGNED, nonce=nonce, tx_hash=tx_hash, raw_tx="0x" + raw.hex())
+
+        delay = self._last_send + self._interval - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._last_send = time.monotonic()
+        try:
+            self._provider.send_raw_transaction(raw)
+        except ProviderConnectionError as exc:
+            # The node may have received it; keep it SIGNED so the next pass rebroadcasts.
+            self._builder._broadcast_failed(nonce, raw, exc)
+            self._nonce_floor = nonce + 1
+            raise
+        except RootstockError as exc:
+            if not is_already_known_error(exc):
+                self._builder._broadcast_failed(nonce, raw, exc)
+                self._update(key, status=FAILED, error=str(exc), raw_tx=None)
+                return False
+        self._builder._mark_broadcast(nonce, tx_hash)
+        self._nonce_floor = nonce + 1
+        self._update(key, status=BROADCAST)
+        return True
+
+    def _update(self, key: str, **columns: object) -> None:
+        assignments = ", ".join(f"{name} = ?" for name in columns)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                f"UPDATE outbox SET {assignments}, updated_at = ? WHERE key = ?",
+                (*columns.values(), time.time(), key),
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+
+    def __repr__(self) -> str:
+        return f"TransactionOutbox(path={self._path!r})"
@@ -0,0 +1,164 @@
+"""Bulk RBTC and ERC-20 balance reads for many holders."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+
+from rootstock._utils.checksum import normalize_address_for_web3
+from rootstock.constants import MULTICALL3
+from rootstock.exceptions import TokenError
+from rootstock.multicall import Multicall
+from rootstock.provider import RootstockProvider
+from rootstock.tokens import ERC20Token
+
+logger = logging.getLogger(__name__)
+
+RBTC = "RBTC"
+"""Token entry that stands for the native RBTC balance."""
+
+# Selectors of getEthBalance(address) on Multicall3 and ERC-20 balanceOf(address).
+_GET_ETH_BALANCE = bytes.fromhex("4d2301cc")
+_BALANCE_OF = bytes.fromhex("70a08231")
+
+
+@dataclass(frozen=True)
+class Portfolio:
+    """Raw balances of ``holders`` (rows) in ``tokens`` (columns) at one block."""
+
+    block: int
+    holders: list[str]
+    tokens: list[str]
+    decimals: list[int]
+    balances: list[list[int]]
+
+    def column(self, token: str) -> list[int]:
+        """Balances of every holder in one token, given by address or ``RBTC``."""
+        index = self._token_index(token)
+        return [row[index] for row in self.balances]
+
+    def human(self) -> list[list[Decimal]]:
+        """Balances in full token units."""
+        return [
+            [Decimal(raw).scaleb(-d) for raw, d in zip(row, self.decimals, strict=True)]
+            for row in self.balances
+        ]
+
+    def to_numpy(self, human: bool = False):
+        """Return the matrix as a NumPy array (requires ``numpy``).
+
+        Raw balances can exceed 64 bits, so they come back as an ``object``
+        array of Python ints; ``human=True`` gives ``float64`` full units.
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ImportError("to_numpy requires numpy: pip install rootstock-sdk[numpy]") from exc
+        raw = np.array(self.balances, dtype=object).reshape(len(self.holders), len(self.tokens))
+        if not human:
+            return raw
+        scales = np.array([10.0**d for d in self.decimals])
+        return raw.astype(np.float64) / scales
+
+    def _token_index(self, token: str) -> int:
+        key = token if token == RBTC else token.lower()
+        for i, t in enumerate(self.tokens):
+            if (t if t == RBTC else t.lower()) == key:
+                return i
+        raise KeyError(token)
+
+
+class PortfolioScanner:
+    """Reads a dense holder x token balance matrix with few RPC calls.
+
+    ERC-20 ``balanceOf`` calls and RBTC balances (Multicall3's
+    ``getEthBalance``) are packed into multicall batches that run on
+    ``concurrency`` threads, all pinned to the same block. On chains without
+    a known Multicall3 it falls back to one call per balance on the same
+    thread pool.
+    """
+
+    def __init__(
+        self,
+        provider: RootstockProvider,
+        tokens: Sequence[ERC20Token | str],
+        batch_size: int = 500,
+        concurrency: int = 4,
+        multicall_address: str | None = None,
+    ):
+        if not tokens:
+            raise ValueError("tokens must not be empty")
+        self._provider = provider
+        self._tokens = [
+            t if isinstance(t, ERC20Token) or t == RBTC else ERC20Token(provider, t)
+            for t in tokens
+        ]
+        self._batch_size = batch_size
+        self._concurrency = max(1, concurrency)
+        self._multicall_address = multicall_address or MULTICALL3.get(provider.chain_id)
+
+    @property
+    def tokens(self) -> list[str]:
+        return [t if t == RBTC else t.address for t in self._tokens]
+
+    def scan(self, holders: Sequence[str], block: int | None = None) -> Portfolio:
+        """Read every holder's balance in every token at ``block`` (default: the latest)."""
+        holder_addrs = [normalize_address_for_web3(h) for h in holders]
+        if block is None:
+            block = self._provider.get_block_number()
+        decimals = [18 if t == RBTC else t.decimals() for t in self._tokens]
+        if self._multicall_address is not None:
+            flat = self._scan_multicall(holder_addrs, block)
+        else:
+            flat = self._scan_direct(holder_addrs, block)
+        width = len(self._tokens)
+        balances = [flat[i * width : (i + 1) * width] for i in range(len(holder_addrs))]
+        logger.info("Scanned %d holders x %d tokens at block %d", len(holder_addrs), width, block)
+        return Portfolio(block, holder_addrs, self.tokens, decimals, balances)
+
+    def _scan_multicall(self, holders: list[str], block: int) -> list[int]:
+        mc = Multicall(
+            self._provider,
+            self._multicall_address,
+            allow_failure=True,
+            batch_size=self._batch_size,
+            concurrency=self._concurrency,
+        )
+        flat: list[int] = []
+        # Queue a bounded slice at a time so 100k+ holders do not sit in memory as calls.
+        per_round = max(1, self._batch_size * self._concurrency * 4 // len(self._tokens))
+        for start in range(0, len(holders), per_round):
+            chunk = holders[start : start + per_round]
+            for holder in chunk:
+                # Both calls take one address argument, so the calldata is built by hand.
+                arg = bytes(12) + bytes.fromhex(holder[2:])
+                for token in self._tokens:
+                    if token == RBTC:
+                        mc.add_call(mc.address, _GET_ETH_BALANCE + arg, ["uint256"])
+                    else:
+                        mc.add_call(token.address, _BALANCE_OF + arg, ["uint256"])
+            results = mc.execute(block)
+            for i, value in enumerate(results):
+                if value is None:
+                    holder = chunk[i // len(self._tokens)]
+                    token = self.tokens[i % len(self._tokens)]
+                    raise TokenError(f"Balance of {holder} in {token} could not be read")
+            flat.extend(results)
+        return flat
+
+    def _scan_direct(self, holders: list[str], block: int) -> list[int]:
+        def read(pair: tuple[str, ERC20Token | str]) -> int:
+            holder, token = pair
+            if token == RBTC:
+                return self._provider.get_balance(holder, block)
+            return token.balance_of(holder, block=block)
+
+        pairs = [(h, t) for h in holders for t in self._tokens]
+        with ThreadPoolExecutor(max_workers=self._concurrency) as pool:
+            return list(pool.map(read, pairs))
+
+    def __repr__(self) -> str:
+        return f"PortfolioScanner(tokens={len(self._tokens)})"
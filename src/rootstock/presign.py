@@ -0,0 +1,166 @@
+"""Offline presigning of transfers and bulk broadcast of the signed file."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+
+from eth_hash.auto import keccak
+
+from rootstock._utils.checksum import normalize_address_for_web3
+from rootstock.exceptions import NonceTooLowError, RootstockError
+from rootstock.provider import RootstockProvider, is_already_known_error
+from rootstock.signing import ProcessPoolSigner
+from rootstock.transactions import _intent_to_tx
+from rootstock.wallet import Wallet
+
+logger = logging.getLogger(__name__)
+
+
+def presign_transfers(
+    wallet: Wallet,
+    intents: Iterable[dict],
+    start_nonce: int,
+    gas_price: int,
+    path: str | Path,
+    chain_id: int | None = None,
+    signer: ProcessPoolSigner | None = None,
+    chunk_size: int = 10_000,
+) -> int:
+    """Sign transfer intents without any RPC and write them to a JSON Lines file.
+
+    Intents use the ``TransactionBuilder.send_many`` keys (``to``, ``value``,
+    ``data``, ``gas_limit``). Nonces run consecutively from ``start_nonce``.
+    Intents with calldata must carry ``gas_limit`` because gas cannot be
+    estimated offline. Each output line holds ``nonce``, ``to``, ``value``,
+    ``tx_hash`` and ``raw``. Returns the number of transactions written.
+    """
+    from_addr = normalize_address_for_web3(wallet.address)
+    chain = chain_id if chain_id is not None else wallet.chain_id
+    nonce = start_nonce
+    it = iter(intents)
+    with open(path, "w", encoding="utf-8") as out:
+        while chunk := list(islice(it, chunk_size)):
+            tx_dicts = []
+            for entry in chunk:
+                tx = _intent_to_tx(entry, from_addr, chain)
+                if tx["gas"] is None:
+                    raise ValueError(f"Intent for nonce {nonce} has data but no gas_limit")
+                tx["nonce"] = nonce
+                tx["gasPrice"] = gas_price
+                tx_dicts.append(tx)
+                nonce += 1
+            for tx, raw in zip(tx_dicts, wallet.sign_transactions(tx_dicts, signer), strict=True):
+                record = {
+                    "nonce": tx["nonce"],
+                    "to": tx["to"],
+                    "value": str(tx["value"]),
+                    "tx_hash": "0x" + keccak(raw).hex(),
+                    "raw": "0x" + raw.hex(),
+                }
+                out.write(json.dumps(record) + "\n")
+    count = nonce - start_nonce
+    logger.info("Presigned %d transactions (nonces %d..%d)", count, start_nonce, nonce - 1)
+    return count
+
+
+def read_presigned(path: str | Path) -> Iterator[dict]:
+    """Stream records from a file written by ``presign_transfers``."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+@dataclass
+class BroadcastReport:
+    """Outcome counts of a bulk broadcast; ``failed`` lists ``(nonce, error)`` pairs."""
+
+    sent: int = 0
+    already_known: int = 0
+    already_mined: int = 0
+    failed: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return self.sent + self.already_known + self.already_mined + len(self.failed)
+
+
+class BulkBroadcaster:
+    """Streams presigned transactions into ``eth_sendRawTransaction`` at a bounded rate.
+
+    At most ``concurrency`` broadcasts are in flight and no more than
+    ``max_per_second`` are started per second. "Already known" responses
+    count as success, and a "nonce too low" rejection counts as already mined
+    when the node has a receipt for the record's hash, so a file can be
+    broadcast again after an interruption.
+    """
+
+    def __init__(
+        self, provider: RootstockProvider, max_per_second: float = 20.0, concurrency: int = 4
+    ):
+        if max_per_second <= 0:
+            raise ValueError("max_per_second must be positive")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._provider = provider
+        self._interval = 1.0 / max_per_second
+        self._concurrency = concurrency
+
+    def broadcast_file(self, path: str | Path, skip: int = 0) -> BroadcastReport:
+        """Broadcast every record in ``path`` after the first ``skip`` lines."""
+        return self.broadcast(islice(read_presigned(path), skip, None))
+
+    def broadcast(self, records: Iterable[dict]) -> BroadcastReport:
+        report = BroadcastReport()
+        inflight: list[tuple[dict, Future]] = []
+        next_start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self._concurrency) as pool:
+            for record in records:
+                if len(inflight) >= self._concurrency:
+                    self._collect(inflight.pop(0), report)
+                delay = next_start - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_start = max(next_start, time.monotonic()) + self._interval
+                raw = bytes.fromhex(record["raw"][2:])
+                inflight.append((record, pool.submit(self._provider.send_raw_transaction, raw)))
+            for item in inflight:
+                self._collect(item, report)
+        logger.info(
+            "Broadcast %d presigned transactions: %d sent, %d already known, "
+            "%d already mined, %d failed",
+            report.total,
+            report.sent,
+            report.already_known,
+            report.already_mined,
+            len(report.failed),
+        )
+        return report
+
+    def _collect(self, item: tuple[dict, Future], report: BroadcastReport) -> None:
+        record, future = item
+        nonce = record["nonce"]
+        try:
+            future.result()
+        except RootstockError as exc:
+            if is_already_known_error(exc):
+                report.already_known += 1
+            elif isinstance(exc, NonceTooLowError) and self._is_mined(record):
+                report.already_mined += 1
+            else:
+                logger.warning("Broadcast of nonce %d failed: %s", nonce, exc)
+                report.failed.append((nonce, str(exc)))
+            return
+        report.sent += 1
+
+    def _is_mined(self, record: dict) -> bool:
+        # Without a receipt for this exact hash, a different transaction took the nonce.
+        tx_hash = record.get("tx_hash") or "0x" + keccak(bytes.fromhex(record["raw"][2:])).hex()
+        return self._provider.get_transaction_receipt(tx_hash) is not None
@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
+from eth_hash.auto import keccak
+from hexbytes import HexBytes
 from web3 import Web3
-from web3.exceptions import ContractLogicError, TimeExhausted, Web3RPCError
+from web3.exceptions import (
+    ContractLogicError,
+    TimeExhausted,
+    TransactionNotFound,
+    Web3RPCError,
+)
 from web3.middleware import ExtraDataToPOAMiddleware
 
 from rootstock._utils.checksum import normalize_address_for_web3
@@ -23,40 +33,83 @@ from rootstock.types import BlockIdentifier
 
 logger = logging.getLogger(__name__)
 
+_ALREADY_KNOWN_MARKERS = (
+    "already known",
+    "known transaction",
+    "already imported",
+    "same hash already exists",
+)
+
+
+def is_already_known_error(error: Exception) -> bool:
+    """Return True if a broadcast failed only because the node already has the transaction."""
+    msg = str(error).lower()
+    return any(marker in msg for marker in _ALREADY_KNOWN_MARKERS)
+
 
 class RootstockProvider:
     """web3.py connection to a Rootstock node with POA middleware
-    and legacy transaction support (no EIP-1559)."""
+    and legacy transaction support (no EIP-1559).
 
-    def __init__(self, network: NetworkConfig, request_timeout: int = 30, max_retries: int = 3):
+    ``broadcast_urls`` lists extra nodes that signed transactions are sent to
+    in parallel with the main RPC URL; reads always use the main URL.
+    """
+
+    def __init__(
+        self,
+        network: NetworkConfig,
+        request_timeout: int = 30,
+        max_retries: int = 3,
+        broadcast_urls: Sequence[str] = (),
+    ):
         if max_retries < 1:
             raise ValueError("max_retries must be at least 1")
         self._network = network
         self._max_retries = max_retries
         self._w3 = self._configure_web3(network.rpc_url, request_timeout)
+        self._broadcast_w3s = [
+            self._configure_web3(url, request_timeout)
+            for url in dict.fromkeys(broadcast_urls)
+            if url != network.rpc_url
+        ]
+        self._broadcast_pool: ThreadPoolExecutor | None = None
+        self._broadcast_pool_lock = threading.Lock()
         logger.info("Connected to %s (chain_id=%d)", network.name, network.chain_id)
 
     @classmethod
     def from_mainnet(
-        cls, rpc_url: str | None = None, request_timeout: int = 30, max_retries: int = 3
+        cls,
+        rpc_url: str | None = None,
+        request_timeout: int = 30,
+        max_retries: int = 3,
+        broadcast_urls: Sequence[str] = (),
     ) -> RootstockProvider:
         """Connect to RSK mainnet (chain_id=30)."""
-        return cls(NetworkConfig.mainnet(rpc_url), request_timeout, max_retries)
+        return cls(NetworkConfig.mainnet(rpc_url), request_timeout, max_retries, broadcast_urls)
 
     @classmethod
     def from_testnet(
-        cls, rpc_url: str | None = None, request_timeout: int = 30, max_retries: int = 3
+        cls,
+        rpc_url: str | None = None,
+        request_timeout: int = 30,
+        max_retries: int = 3,
+        broadcast_urls: Sequence[str] = (),
     ) -> RootstockProvider:
         """Connect to RSK testnet (chain_id=31)."""
-        return cls(NetworkConfig.testnet(rpc_url), request_timeout, max_retries)
+        return cls(NetworkConfig.testnet(rpc_url), request_timeout, max_retries, broadcast_urls)
 
     @classmethod
     def from_url(
-        cls, rpc_url: str, chain_id: int, request_timeout: int = 30, max_retries: int = 3
+        cls,
+        rpc_url: str,
+        chain_id: int,
+        request_timeout: int = 30,
+        max_retries: int = 3,
+        broadcast_urls: Sequence[str] = (),
     ) -> RootstockProvider:
         """Connect to a custom RPC URL with the given chain_id."""
         network = NetworkConfig.custom(chain_id=chain_id, rpc_url=rpc_url)
-        return cls(network, request_timeout, max_retries)
+        return cls(network, request_timeout, max_retries, broadcast_urls)
 
     @property
     def w3(self) -> Web3:
@@ -103,7 +156,13 @@ class RootstockProvider:
         return dict(result)
 
     def get_transaction_receipt(self, tx_hash: str) -> dict | None:
-        receipt = self._call_with_retry(self._w3.eth.get_transaction_receipt, tx_hash)
+        """Return the receipt, or None while the transaction is pending or unknown."""
+        try:
+            receipt = self._call_with_retry(
+                self._w3.eth.get_transaction_receipt, tx_hash, reraise=(TransactionNotFound,)
+            )
+        except TransactionNotFound:
+            return None
         return dict(receipt) if receipt else None
 
     def get_gas_price(self) -> int:
@@ -118,12 +177,45 @@ class RootstockProvider:
         except ContractLogicError as exc:
             raise GasEstimationError(f"Gas estimation failed: {exc}") from exc
 
+    def get_logs(self, filter_params: dict) -> list[dict]:
+        """Return the logs matching an ``eth_getLogs`` filter."""
+        logs = self._call_with_retry(self._w3.eth.get_logs, filter_params)
+        return [dict(log) for log in logs]
+
+    def new_filter(self, filter_params: dict) -> str:
+        """Install an ``eth_newFilter`` log filter and return its ID."""
+        return self._call_with_retry(lambda: self._w3.eth.filter(filter_params).filter_id)
+
+    def get_filter_changes(self, filter_id: str) -> list[dict]:
+        """Return logs added (or, with ``removed`` set, orphaned) since the last poll."""
+        changes = self._call_with_retry(self._w3.eth.get_filter_changes, filter_id)
+        return [dict(log) for log in changes]
+
+    def uninstall_filter(self, filter_id: str) -> bool:
+        return self._call_with_retry(self._w3.eth.uninstall_filter, filter_id)
+
     def get_code(self, address: str, block: BlockIdentifier = "latest") -> bytes:
         result = self._call_with_retry(
             self._w3.eth.get_code, normalize_address_for_web3(address), block
         )
         return bytes(result)
 
+    def get_code_many(
+        self, addresses: Sequence[str], block: BlockIdentifier = "latest"
+    ) -> list[bytes]:
+        """Fetch the code of many addresses in one JSON-RPC batch request."""
+        if not addresses:
+            return []
+        checksummed = [normalize_address_for_web3(a) for a in addresses]
+
+        def run() -> list:
+            with self._w3.batch_requests() as batch:
+                for address in checksummed:
+                    batch.add(self._w3.eth.get_code(address, block))
+                return batch.execute()
+
+        return [bytes(code) for code in self._call_with_retry(run)]
+
     def call(self, tx_params: dict, block: BlockIdentifier = "latest") -> bytes:
         """Execute a read-only call. Raises RPCError if the call reverts."""
         try:
@@ -135,8 +227,18 @@ class RootstockProvider:
         except ContractLogicError as exc:
             raise RPCError(f"Call reverted: {exc}") from exc
 
-    def send_raw_transaction(self, signed_tx: bytes | str) -> str:
-        """Broadcast a signed transaction and return the transaction hash."""
+    def send_raw_transaction(self, signed_tx: bytes | str, fan_out: bool | None = None) -> str:
+        """Broadcast a signed transaction and return the transaction hash.
+
+        With ``fan_out`` (the default when ``broadcast_urls`` were given) the
+        transaction goes to every endpoint in parallel and this returns as
+        soon as one accepts it. "Already known" counts as accepted; an error
+        is raised only if every endpoint rejects the transaction.
+        """
+        if fan_out is None:
+            fan_out = bool(self._broadcast_w3s)
+        if fan_out and self._broadcast_w3s:
+            return self._fan_out(HexBytes(signed_tx))
         try:
             tx_hash = self._w3.eth.send_raw_transaction(signed_tx)
             result = tx_hash.hex() if isinstance(tx_hash, bytes) else str(tx_hash)
@@ -146,6 +248,33 @@ class RootstockProvider:
             logger.error("Failed to send transaction: %s", exc)
             raise self._wrap_error(exc) from exc
 
+    def _fan_out(self, raw: bytes) -> str:
+        tx_hash = keccak(raw).hex()
+        endpoints = [self._w3, *self._broadcast_w3s]
+        pool = self._broadcast_executor()
+        pending = {pool.submit(w3.eth.send_raw_transaction, raw) for w3 in endpoints}
+        first_error: Exception | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                exc = future.exception()
+                if exc is None or is_already_known_error(exc):
+                    logger.info("Transaction sent: %s (to %d nodes)", tx_hash, len(endpoints))
+                    return tx_hash
+                logger.debug("Broadcast endpoint rejected %s: %s", tx_hash, exc)
+                first_error = first_error or exc
+        logger.error("Failed to send transaction: %s", first_error)
+        raise self._wrap_error(first_error) from first_error
+
+    def _broadcast_executor(self) -> ThreadPoolExecutor:
+        with self._broadcast_pool_lock:
+            if self._broadcast_pool is None:
+                self._broadcast_pool = ThreadPoolExecutor(
+                    max_workers=4 * (len(self._broadcast_w3s) + 1),
+                    thread_name_prefix="rootstock-broadcast",
+                )
+            return self._broadcast_pool
+
     def wait_for_transaction(
         self, tx_hash: str, timeout: int = 120, poll_interval: float = 2.0
     ) -> dict:
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
-from importlib.resources import files as pkg_files
 
+from rootstock._abi import bind_contract
+from rootstock._abi import load_abi as _load_abi
 from rootstock._utils.checksum import normalize_address_for_web3
 from rootstock._utils.checksum import to_checksum_address as rsk_checksum
 from rootstock._utils.namehash import namehash
@@ -24,11 +24,6 @@ logger = logging.getLogger(__name__)
 _LABEL_RE = re.compile(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$")
 
 
-def _load_abi(name: str) -> list[dict]:
-    abi_dir = pkg_files("rootstock._abi")
-    return json.loads((abi_dir / f"{name}.json").read_text(encoding="utf-8"))
-
-
 class RNS:
     def __init__(
         self,
@@ -50,7 +45,7 @@ class RNS:
 
         self._registry_address = normalize_address_for_web3(reg_addr)
         registry_abi = _load_abi("rns_registry")
-        self._registry = provider.w3.eth.contract(address=self._registry_address, abi=registry_abi)
+        self._registry = bind_contract(provider.w3, self._registry_address, registry_abi)
         self._resolver_abi = _load_abi("rns_resolver")
 
     def resolve(self, domain: str) -> str:
@@ -155,4 +150,4 @@ class RNS:
 
     def _get_resolver_contract(self, resolver_address: str):
         addr = normalize_address_for_web3(resolver_address)
-        return self._provider.w3.eth.contract(address=addr, abi=self._resolver_abi)
+        return bind_contract(self._provider.w3, addr, self._resolver_abi)
@@ -0,0 +1,171 @@
+"""Sending from a pool of hot wallets so nonce sequences run in parallel."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from rootstock.constants import DEFAULT_GAS_LIMIT_TRANSFER
+from rootstock.nonces import NonceAllocator
+from rootstock.provider import RootstockProvider
+from rootstock.transactions import PendingTransaction, TransactionBuilder
+from rootstock.wallet import Wallet
+
+logger = logging.getLogger(__name__)
+
+
+class ShardedSender:
+    """Routes outgoing transactions to the least-loaded wallet of a pool.
+
+    Load is the number of transactions a wallet has in flight. A stuck
+    transaction only blocks the wallet that sent it, and a batch split over N
+    wallets is broadcast as N independent nonce streams. Wallets whose last
+    known balance is below ``min_balance`` receive no new work while other
+    wallets are available, and ``rebalance`` tops them up by
+    ``top_up_amount`` from the richest wallet.
+    """
+
+    def __init__(
+        self,
+        provider: RootstockProvider,
+        wallets: list[Wallet],
+        min_balance: int = 0,
+        top_up_amount: int | None = None,
+        nonce_allocator: NonceAllocator | None = None,
+    ):
+        if not wallets:
+            raise ValueError("wallets must not be empty")
+        self._provider = provider
+        self._min_balance = min_balance
+        self._top_up_amount = top_up_amount
+        self._builders = {
+            w.address: TransactionBuilder(provider, w, nonce_allocator=nonce_allocator)
+            for w in wallets
+        }
+        if len(self._builders) != len(wallets):
+            raise ValueError("wallets must be distinct")
+        self._lock = threading.Lock()
+        self._inflight: dict[str, list[PendingTransaction]] = {a: [] for a in self._builders}
+        self._balances: dict[str, int] = {}
+
+    @property
+    def addresses(self) -> list[str]:
+        return list(self._builders)
+
+    def builder(self, address: str) -> TransactionBuilder:
+        return self._builders[address]
+
+    def loads(self) -> dict[str, int]:
+        """Return the number of in-flight transactions per wallet."""
+        with self._lock:
+            self._prune_done()
+            return {addr: len(handles) for addr, handles in self._inflight.items()}
+
+    def transfer(
+        self,
+        to: str,
+        value: int = 0,
+        data: bytes | str = b"",
+        gas_limit: int | None = None,
+    ) -> PendingTransaction:
+        """Send one transaction from the least-loaded wallet without waiting."""
+        entry: dict = {"to": to, "value": value, "data": data}
+        if gas_limit is not None:
+            entry["gas_limit"] = gas_limit
+        handle = self.send_many([entry], concurrency=1)[0]
+        if handle.error is not None:
+            raise handle.error
+        return handle
+
+    def send_many(
+        self, txs: list[dict], concurrency: int = 8, gas_price: int | None = None
+    ) -> list[PendingTransaction]:
+        """Spread a batch over the pool and broadcast each share in parallel.
+
+        Entries use the same keys as ``TransactionBuilder.send_many``. Handles
+        are returned in input order; ``handle.sender`` tells which wallet
+        sent each one.
+        """
+        if not txs:
+            return []
+        actual_gas_price = gas_price if gas_price is not None else self._provider.get_gas_price()
+
+        with self._lock:
+            self._prune_done()
+            eligible = [a for a in self._builders if self._balances.get(a, 0) >= self._min_balance]
+            if not self._balances or not eligible:
+                eligible = list(self._builders)
+            heap = [(len(self._inflight[a]), i, a) for i, a in enumerate(eligible)]
+            heapq.heapify(heap)
+            groups: dict[str, list[int]] = {}
+            for position in range(len(txs)):
+                load, i, addr = heapq.heappop(heap)
+                groups.setdefault(addr, []).append(position)
+                heapq.heappush(heap, (load + 1, i, addr))
+
+        def send_group(addr: str) -> list[PendingTransaction]:
+            entries = [txs[p] for p in groups[addr]]
+            return self._builders[addr].send_many(
+                entries, concurrency=concurrency, gas_price=actual_gas_price
+            )
+
+        handles: list[PendingTransaction | None] = [None] * len(txs)
+        with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+            for addr, group_handles in zip(groups, pool.map(send_group, groups), strict=True):
+                for position, handle in zip(groups[addr], group_handles, strict=True):
+                    handles[position] = handle
+                with self._lock:
+                    self._inflight[addr].extend(h for h in group_handles if h.sent)
+
+        logger.info("Sent %d transactions across %d wallets", len(txs), len(groups))
+        return handles
+
+    def refresh(self) -> None:
+        """Re-read nonces and balances to drop mined transactions from the load counts."""
+        for addr in self._builders:
+            chain_nonce = self._provider.get_transaction_count(addr)
+            balance = self._provider.get_balance(addr)
+            with self._lock:
+                self._inflight[addr] = [
+                    h for h in self._inflight[addr] if h.nonce >= chain_nonce and not h.done
+                ]
+                self._balances[addr] = balance
+
+    def rebalance(self) -> list[PendingTransaction]:
+        """Top up wallets below ``min_balance`` from the richest wallet in the pool."""
+        if self._top_up_amount is None:
+            raise ValueError("rebalance requires top_up_amount")
+        self.refresh()
+        gas_price = self._provider.get_gas_price()
+        fee = DEFAULT_GAS_LIMIT_TRANSFER * gas_price
+        with self._lock:
+            balances = dict(self._balances)
+
+        handles = []
+        for needy in sorted(balances, key=balances.get):
+            if balances[needy] >= self._min_balance:
+                break
+            donor = max(balances, key=balances.get)
+            if balances[donor] - self._top_up_amount - fee < self._min_balance:
+                logger.warning("No wallet can top up %s without dropping below min", needy)
+                break
+            handle = self._builders[donor].send_many(
+                [{"to": needy, "value": self._top_up_amount}], gas_price=gas_price
+            )[0]
+            handles.append(handle)
+            if handle.sent:
+                balances[donor] -= self._top_up_amount + fee
+                balances[needy] += self._top_up_amount
+                with self._lock:
+                    self._inflight[donor].append(handle)
+                logger.info("Topping up %s from %s (%s)", needy, donor, handle.tx_hash)
+        return handles
+
+    def _prune_done(self) -> None:
+        for addr, handles in self._inflight.items():
+            self._inflight[addr] = [h for h in handles if not h.done]
+
+    def __repr__(self) -> str:
+        return f"ShardedSender(wallets={len(self._builders)})"
@@ -0,0 +1,77 @@
+"""Transaction signing backends for bulk workloads."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from eth_account import Account
+
+logger = logging.getLogger(__name__)
+
+_worker_account = None
+
+
+def _init_worker(private_key: bytes) -> None:
+    global _worker_account
+    _worker_account = Account.from_key(private_key)
+
+
+def _sign_chunk(tx_dicts: list[dict]) -> list[bytes]:
+    return [bytes(_worker_account.sign_transaction(tx).raw_transaction) for tx in tx_dicts]
+
+
+class ProcessPoolSigner:
+    """Spreads transaction signing across a pool of worker processes.
+
+    The private key is handed to each worker once, through the pool
+    initializer, and is never part of a task payload. The pool only lives
+    for the duration of one ``sign_many`` call, so no worker keeps the key
+    afterwards. Batches smaller than ``min_batch`` are signed in-process.
+
+    Workers start with ``mp_context="spawn"`` by default: callers such as
+    ``send_many`` sign while other threads are running, and forking a
+    multi-threaded process can deadlock the child on a lock held by one of
+    those threads.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        chunk_size: int = 256,
+        min_batch: int = 1024,
+        mp_context: str = "spawn",
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._min_batch = min_batch
+        self._mp_context = mp_context
+
+    def sign_many(self, private_key: bytes, tx_dicts: list[dict]) -> list[bytes]:
+        """Sign every transaction and return raw transactions in input order."""
+        if len(tx_dicts) < self._min_batch or self._max_workers == 1:
+            account = Account.from_key(private_key)
+            return [bytes(account.sign_transaction(tx).raw_transaction) for tx in tx_dicts]
+
+        chunks = [
+            tx_dicts[i : i + self._chunk_size] for i in range(0, len(tx_dicts), self._chunk_size)
+        ]
+        context = multiprocessing.get_context(self._mp_context)
+        with ProcessPoolExecutor(
+            max_workers=min(self._max_workers, len(chunks)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(bytes(private_key),),
+        ) as pool:
+            signed = [raw for chunk in pool.map(_sign_chunk, chunks) for raw in chunk]
+        logger.debug("Signed %d transactions in %d chunks", len(signed), len(chunks))
+        return signed
+
+    def __repr__(self) -> str:
+        return f"ProcessPoolSigner(max_workers={self._max_workers}, chunk_size={self._chunk_size})"
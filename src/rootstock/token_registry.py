@@ -0,0 +1,115 @@
+"""On-disk registry of ERC-20 token metadata, stored in SQLite."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+from rootstock._utils.checksum import normalize_address_for_web3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tokens (
+    chain_id INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    name TEXT NOT NULL,
+    decimals INTEGER NOT NULL,
+    PRIMARY KEY (chain_id, address)
+);
+CREATE INDEX IF NOT EXISTS tokens_by_symbol ON tokens (chain_id, symbol COLLATE NOCASE);
+"""
+
+_COLUMNS = "chain_id, address, name, symbol, decimals"
+
+
+@dataclass(frozen=True)
+class TokenMetadata:
+    """Name, symbol and decimals of a token, which never change after deployment."""
+
+    chain_id: int
+    address: str
+    name: str
+    symbol: str
+    decimals: int
+
+
+class TokenRegistry:
+    """Token metadata indexed by address and by symbol, shared through a SQLite file.
+
+    Several processes can point at the same file; lookups by symbol are
+    case-insensitive and may return more than one token.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0):
+        self._path = str(path)
+        self._timeout = timeout
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get(self, chain_id: int, address: str) -> TokenMetadata | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM tokens WHERE chain_id = ? AND address = ?",
+                (chain_id, address.lower()),
+            ).fetchone()
+        return self._to_metadata(row) if row else None
+
+    def get_many(self, chain_id: int, addresses: Iterable[str]) -> dict[str, TokenMetadata]:
+        """Look up many tokens at once, keyed by lowercase address; unknown ones are left out."""
+        wanted = list(dict.fromkeys(a.lower() for a in addresses))
+        found: dict[str, TokenMetadata] = {}
+        with closing(self._connect()) as conn:
+            # Stay under SQLite's default limit on bound parameters.
+            for i in range(0, len(wanted), 500):
+                chunk = wanted[i : i + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"SELECT {_COLUMNS} FROM tokens "
+                    f"WHERE chain_id = ? AND address IN ({placeholders})",
+                    (chain_id, *chunk),
+                ).fetchall()
+                for row in rows:
+                    found[row[1]] = self._to_metadata(row)
+        return found
+
+    def find(self, chain_id: int, symbol: str) -> list[TokenMetadata]:
+        """Return every token on ``chain_id`` with this symbol."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM tokens "
+                "WHERE chain_id = ? AND symbol = ? COLLATE NOCASE ORDER BY address",
+                (chain_id, symbol),
+            ).fetchall()
+        return [self._to_metadata(row) for row in rows]
+
+    def add(self, metadata: TokenMetadata) -> None:
+        self.add_many([metadata])
+
+    def add_many(self, items: Iterable[TokenMetadata]) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO tokens ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                [(m.chain_id, m.address.lower(), m.name, m.symbol, m.decimals) for m in items],
+            )
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+
+    @staticmethod
+    def _to_metadata(row: tuple) -> TokenMetadata:
+        chain_id, address, name, symbol, decimals = row
+        return TokenMetadata(chain_id, normalize_address_for_web3(address), name, symbol, decimals)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=self._timeout)
+
+    def __repr__(self) -> str:
+        return f"TokenRegistry(path={self._path!r})"
@@ -3,84 +3,190 @@
 from __future__ import annotations
 
 import functools
-import json
 import logging
+import threading
+from collections.abc import Callable, Iterable, Sequence
 from decimal import Decimal
-from importlib.resources import files as pkg_files
 
+from web3.contract import Contract as Web3Contract
+
+from rootstock._abi import bind_contract, load_abi
+from rootstock._utils.abi import FunctionCodec, function_codec
 from rootstock._utils.checksum import normalize_address_for_web3
 from rootstock.constants import TOKENS, ChainId
+from rootstock.events import APPROVAL_TOPIC, TRANSFER_TOPIC, ERC20Log, decode_erc20_logs
 from rootstock.exceptions import AllowanceExceededError, RPCError, TokenError
+from rootstock.multicall import Multicall
 from rootstock.provider import RootstockProvider
+from rootstock.token_registry import TokenMetadata, TokenRegistry
 from rootstock.transactions import TransactionBuilder
+from rootstock.types import BlockIdentifier
 from rootstock.wallet import Wallet
 
 logger = logging.getLogger(__name__)
 
 
 @functools.lru_cache(maxsize=1)
-def _load_erc20_abi() -> list[dict]:
-    abi_dir = pkg_files("rootstock._abi")
-    return json.loads((abi_dir / "erc20.json").read_text(encoding="utf-8"))
+def _symbol_index() -> dict[str, dict[ChainId, str]]:
+    return {name.upper(): addresses for name, addresses in TOKENS.items()}
+
+
+# Metadata fields per (chain_id, lowercase address), shared by every ERC20Token in the process.
+_metadata_cache: dict[tuple[int, str], dict[str, object]] = {}
+_metadata_lock = threading.Lock()
+
+_METADATA_FIELDS = ("name", "symbol", "decimals")
+
+
+def _cache_metadata(metadata: TokenMetadata) -> None:
+    with _metadata_lock:
+        _metadata_cache[(metadata.chain_id, metadata.address.lower())] = {
+            "name": metadata.name,
+            "symbol": metadata.symbol,
+            "decimals": metadata.decimals,
+        }
+
+
+def clear_metadata_cache() -> None:
+    """Forget all token metadata cached in this process."""
+    with _metadata_lock:
+        _metadata_cache.clear()
+
+
+def fetch_token_metadata(
+    provider: RootstockProvider,
+    addresses: Iterable[str],
+    registry: TokenRegistry | None = None,
+    batch_size: int = 500,
+) -> dict[str, TokenMetadata]:
+    """Load name, symbol and decimals for many tokens, keyed by checksum address.
+
+    Tokens already cached in this process or in ``registry`` cost nothing;
+    the rest are read through Multicall with three calls per token in
+    batches of ``batch_size`` calls. Tokens whose metadata cannot be read
+    (e.g. a ``bytes32`` symbol) are left out. New results are cached and
+    written to ``registry``.
+    """
+    chain_id = provider.chain_id
+    found: dict[str, TokenMetadata] = {}
+    missing: list[str] = []
+    for address in dict.fromkeys(normalize_address_for_web3(a) for a in addresses):
+        with _metadata_lock:
+            fields = _metadata_cache.get((chain_id, address.lower()), {})
+        if all(f in fields for f in _METADATA_FIELDS):
+            found[address] = TokenMetadata(chain_id, address, **fields)
+        else:
+            missing.append(address)
+    if registry is not None and missing:
+        stored = registry.get_many(chain_id, missing)
+        for metadata in stored.values():
+            _cache_metadata(metadata)
+            found[metadata.address] = metadata
+        missing = [a for a in missing if a.lower() not in stored]
+    if not missing:
+        return found
+
+    mc = Multicall(provider, allow_failure=True, batch_size=batch_size)
+    for address in missing:
+        token = ERC20Token(provider, address)
+        for field in _METADATA_FIELDS:
+            mc.add(token, field)
+    results = mc.execute()
+    loaded = []
+    for i, address in enumerate(missing):
+        name, symbol, decimals = results[3 * i : 3 * i + 3]
+        if name is None or symbol is None or decimals is None:
+            logger.debug("Could not read metadata of token %s", address)
+            continue
+        metadata = TokenMetadata(chain_id, address, name, symbol, decimals)
+        _cache_metadata(metadata)
+        found[address] = metadata
+        loaded.append(metadata)
+    if registry is not None and loaded:
+        registry.add_many(loaded)
+    logger.info("Loaded metadata for %d/%d tokens", len(loaded), len(missing))
+    return found
 
 
 class ERC20Token:
+    """An ERC-20 token contract.
+
+    ``name``, ``symbol`` and ``decimals`` are read once per process and
+    shared by every instance for the same token; with a ``registry`` they are
+    also shared with other processes through its file.
+    """
+
     def __init__(
         self,
         provider: RootstockProvider,
         token_address: str,
         abi: list | None = None,
+        registry: TokenRegistry | None = None,
     ):
         self._provider = provider
         self._address = normalize_address_for_web3(token_address)
-        self._abi = abi or _load_erc20_abi()
-        self._contract = provider.w3.eth.contract(address=self._address, abi=self._abi)
+        self._abi = abi or load_abi("erc20")
+        self._bound: Web3Contract | None = None
+        self._registry = registry
+        self._cache_key = (provider.chain_id, self._address.lower())
+        self._codecs: dict[str, FunctionCodec] = {}
 
     @classmethod
-    def from_symbol(cls, provider: RootstockProvider, symbol: str) -> ERC20Token:
-        """Look up a well-known token by ticker symbol."""
-        symbol_upper = symbol.upper()
-        for token_name, addresses in TOKENS.items():
-            if token_name.upper() == symbol_upper:
-                chain_id = ChainId(provider.chain_id)
-                if chain_id in addresses:
-                    return cls(provider, addresses[chain_id])
-                raise TokenError(f"Token {symbol!r} not available on chain ID {provider.chain_id}")
+    def from_symbol(
+        cls, provider: RootstockProvider, symbol: str, registry: TokenRegistry | None = None
+    ) -> ERC20Token:
+        """Look up a token by ticker symbol among the well-known tokens, then in ``registry``."""
+        addresses = _symbol_index().get(symbol.upper())
+        if addresses is not None:
+            chain_id = ChainId(provider.chain_id)
+            if chain_id in addresses:
+                return cls(provider, addresses[chain_id], registry=registry)
+            raise TokenError(f"Token {symbol!r} not available on chain ID {provider.chain_id}")
+        if registry is not None:
+            matches = registry.find(provider.chain_id, symbol)
+            if len(matches) > 1:
+                raise TokenError(
+                    f"Symbol {symbol!r} is ambiguous: {len(matches)} tokens in registry"
+                )
+            if matches:
+                _cache_metadata(matches[0])
+                return cls(provider, matches[0].address, registry=registry)
         raise TokenError(f"Unknown token symbol: {symbol!r}")
 
+    def metadata(self) -> TokenMetadata:
+        """Return name, symbol and decimals, reading them from the chain at most once."""
+        return TokenMetadata(
+            self._provider.chain_id,
+            self._address,
+            self.name(),
+            self.symbol(),
+            self.decimals(),
+        )
+
     def name(self) -> str:
         """Return the token name."""
-        try:
-            return self._contract.functions.name().call()
-        except Exception as exc:
-            raise RPCError(f"Failed to get token name: {exc}") from exc
+        return self._cached("name", "token name")
 
     def symbol(self) -> str:
         """Return the token symbol."""
-        try:
-            return self._contract.functions.symbol().call()
-        except Exception as exc:
-            raise RPCError(f"Failed to get token symbol: {exc}") from exc
+        return self._cached("symbol", "token symbol")
 
     def decimals(self) -> int:
         """Return the number of decimals."""
-        try:
-            return self._contract.functions.decimals().call()
-        except Exception as exc:
-            raise RPCError(f"Failed to get token decimals: {exc}") from exc
+        return self._cached("decimals", "token decimals")
 
     def total_supply(self) -> int:
         """Return the total token supply in smallest units."""
         try:
-            return self._contract.functions.totalSupply().call()
+            return self.web3_contract.functions.totalSupply().call()
         except Exception as exc:
             raise RPCError(f"Failed to get total supply: {exc}") from exc
 
-    def balance_of(self, address: str) -> int:
+    def balance_of(self, address: str, block: BlockIdentifier = "latest") -> int:
         """Return the token balance of an address in smallest units."""
         try:
             addr = normalize_address_for_web3(address)
-            return self._contract.functions.balanceOf(addr).call()
+            return self.web3_contract.functions.balanceOf(addr).call(block_identifier=block)
         except Exception as exc:
             raise RPCError(f"Failed to get balance: {exc}") from exc
 
@@ -89,7 +195,7 @@ class ERC20Token:
         try:
             owner_addr = normalize_address_for_web3(owner)
             spender_addr = normalize_address_for_web3(spender)
-            return self._contract.functions.allowance(owner_addr, spender_addr).call()
+            return self.web3_contract.functions.allowance(owner_addr, spender_addr).call()
         except Exception as exc:
             raise RPCError(f"Failed to get allowance: {exc}") from exc
 
@@ -100,6 +206,57 @@ class ERC20Token:
         value = Decimal(str(raw)) / Decimal(10**dec)
         return str(value)
 
+    def get_transfers(
+        self,
+        from_block: BlockIdentifier = 0,
+        to_block: BlockIdentifier = "latest",
+        sender: str | None = None,
+        recipient: str | None = None,
+        event: str = "Transfer",
+    ) -> list[ERC20Log]:
+        """Fetch Transfer (or ``event="Approval"``) logs with the fast fixed-layout decoder.
+
+        ``sender`` and ``recipient`` filter on the first and second indexed
+        address (owner and spender for Approval).
+        """
+        topics = {"Transfer": TRANSFER_TOPIC, "Approval": APPROVAL_TOPIC}
+        if event not in topics:
+            raise ValueError(f"event must be 'Transfer' or 'Approval', got {event!r}")
+        topic_filter: list = [topics[event], None, None]
+        for i, address in ((1, sender), (2, recipient)):
+            if address is not None:
+                topic_filter[i] = "0x" + "0" * 24 + normalize_address_for_web3(address)[2:].lower()
+        while topic_filter[-1] is None:
+            topic_filter.pop()
+        logs = self._provider.get_logs(
+            {
+                "address": self._address,
+                "topics": topic_filter,
+                "fromBlock": from_block,
+                "toBlock": to_block,
+            }
+        )
+        return decode_erc20_logs(logs)
+
+    def encode_transfer(self, to: str, amount: int) -> str:
+        """Return calldata for ``transfer(to, amount)`` without any RPC call."""
+        return self._codec("transfer").encode_hex(normalize_address_for_web3(to), amount)
+
+    def encode_transfers(self, recipients: Sequence[str], amounts: Sequence[int]) -> list[bytes]:
+        """Return ``transfer`` calldata for many rows at once; ``amounts`` may be a NumPy array."""
+        recipients = [normalize_address_for_web3(r) for r in recipients]
+        return self._codec("transfer").encode_many([recipients, amounts])
+
+    def encode_approve(self, spender: str, amount: int) -> str:
+        """Return calldata for ``approve(spender, amount)`` without any RPC call."""
+        return self._codec("approve").encode_hex(normalize_address_for_web3(spender), amount)
+
+    def encode_transfer_from(self, from_address: str, to: str, amount: int) -> str:
+        """Return calldata for ``transferFrom(from_address, to, amount)`` without any RPC call."""
+        return self._codec("transferFrom").encode_hex(
+            normalize_address_for_web3(from_address), normalize_address_for_web3(to), amount
+        )
+
     def transfer(
         self,
         wallet: Wallet,
@@ -114,13 +271,7 @@ class ERC20Token:
         """Send tokens to a recipient address."""
         if amount < 0:
             raise ValueError("amount must be non-negative")
-        to_addr = normalize_address_for_web3(to)
-        from_addr = normalize_address_for_web3(wallet.address)
-
-        data = self._contract.functions.transfer(to_addr, amount).build_transaction(
-            {"from": from_addr, "gas": 0}
-        )["data"]
-
+        data = self.encode_transfer(to, amount)
         builder = tx_builder or TransactionBuilder(self._provider, wallet)
         tx_dict = builder.build_transaction(
             to=self._address,
@@ -144,13 +295,7 @@ class ERC20Token:
         """Approve spender to spend amount tokens on behalf of wallet."""
         if amount < 0:
             raise ValueError("amount must be non-negative")
-        spender_addr = normalize_address_for_web3(spender)
-        from_addr = normalize_address_for_web3(wallet.address)
-
-        data = self._contract.functions.approve(spender_addr, amount).build_transaction(
-            {"from": from_addr, "gas": 0}
-        )["data"]
-
+        data = self.encode_approve(spender, amount)
         builder = tx_builder or TransactionBuilder(self._provider, wallet)
         tx_dict = builder.build_transaction(
             to=self._address,
@@ -180,14 +325,7 @@ class ERC20Token:
             raise AllowanceExceededError(
                 f"Allowance {current_allowance} < transfer amount {amount}"
             )
-        from_addr = normalize_address_for_web3(from_address)
-        to_addr = normalize_address_for_web3(to)
-        sender_addr = normalize_address_for_web3(wallet.address)
-
-        data = self._contract.functions.transferFrom(from_addr, to_addr, amount).build_transaction(
-            {"from": sender_addr, "gas": 0}
-        )["data"]
-
+        data = self.encode_transfer_from(from_address, to, amount)
         builder = tx_builder or TransactionBuilder(self._provider, wallet)
         tx_dict = builder.build_transaction(
             to=self._address,
@@ -197,9 +335,51 @@ class ERC20Token:
         )
         return builder.sign_and_send(tx_dict, wait=wait, timeout=timeout)
 
+    def _cached(self, field: str, label: str) -> object:
+        with _metadata_lock:
+            fields = _metadata_cache.get(self._cache_key)
+            if fields is not None and field in fields:
+                return fields[field]
+        if self._registry is not None:
+            stored = self._registry.get(*self._cache_key)
+            if stored is not None:
+                _cache_metadata(stored)
+                return getattr(stored, field)
+        fn: Callable = getattr(self.web3_contract.functions, field)
+        try:
+            value = fn().call()
+        except Exception as exc:
+            raise RPCError(f"Failed to get {label}: {exc}") from exc
+        with _metadata_lock:
+            fields = _metadata_cache.setdefault(self._cache_key, {})
+            fields[field] = value
+            complete = all(f in fields for f in _METADATA_FIELDS)
+        if complete and self._registry is not None:
+            self._registry.add(TokenMetadata(self._cache_key[0], self._address, **fields))
+        return value
+
     @property
     def address(self) -> str:
         return self._address
 
+    @property
+    def web3_contract(self) -> Web3Contract:
+        # Bound on first use: web3 builds per-instance function and event objects.
+        if self._bound is None:
+            self._bound = bind_contract(self._provider.w3, self._address, self._abi)
+        return self._bound
+
+    def _codec(self, name: str) -> FunctionCodec:
+        codec = self._codecs.get(name)
+        if codec is None:
+            entry = next(
+                (e for e in self._abi if e.get("type") == "function" and e.get("name") == name),
+                None,
+            )
+            if entry is None:
+                raise TokenError(f"Token ABI has no {name} function")
+            codec = self._codecs[name] = function_codec(entry)
+        return codec
+
     def __repr__(self) -> str:
         return f"ERC20Token(address={self._address!r})"
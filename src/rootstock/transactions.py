@@ -4,13 +4,25 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
+from eth_hash.auto import keccak
+
 from rootstock._utils.checksum import normalize_address_for_web3
 from rootstock._utils.units import from_wei, to_wei
 from rootstock.constants import DEFAULT_GAS_LIMIT_TRANSFER
-from rootstock.exceptions import InsufficientFundsError
+from rootstock.exceptions import (
+    InsufficientFundsError,
+    ProviderConnectionError,
+    TransactionError,
+    TransactionRevertedError,
+)
+from rootstock.ledger import BalanceLedger
+from rootstock.nonces import NonceAllocator
 from rootstock.provider import RootstockProvider
+from rootstock.signing import ProcessPoolSigner
 from rootstock.wallet import Wallet
 
 logger = logging.getLogger(__name__)
@@ -28,14 +40,182 @@ def _normalize_data(data: bytes | str) -> str:
     raise TypeError(f"data must be bytes or str, got {type(data).__name__}")
 
 
+_prefetch_pool: ThreadPoolExecutor | None = None
+_prefetch_pool_lock = threading.Lock()
+
+
+def _prefetch_executor() -> ThreadPoolExecutor:
+    global _prefetch_pool
+    with _prefetch_pool_lock:
+        if _prefetch_pool is None:
+            _prefetch_pool = ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="rootstock-prefetch"
+            )
+        return _prefetch_pool
+
+
+def _fetch_concurrently(
+    lookups: dict[str, Callable[[], int]],
+) -> tuple[dict[str, int], Exception | None]:
+    """Run independent RPC lookups in parallel.
+
+    Returns the successful results and the first error, so callers can undo
+    side effects (such as a reserved nonce) when another lookup failed.
+    """
+    if not lookups:
+        return {}, None
+    names = list(lookups)
+    # The first lookup runs on the calling thread; only the rest need the pool.
+    futures = {name: _prefetch_executor().submit(lookups[name]) for name in names[1:]}
+    results: dict[str, int] = {}
+    error: Exception | None = None
+    try:
+        results[names[0]] = lookups[names[0]]()
+    except Exception as exc:
+        error = exc
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as exc:
+            error = error or exc
+    return results, error
+
+
+def _intent_to_tx(entry: dict, from_addr: str, chain_id: int) -> dict:
+    """Turn a send_many-style entry into a tx dict without nonce or gasPrice.
+
+    ``gas`` is None when the entry carries calldata but no ``gas_limit``.
+    """
+    data_hex = _normalize_data(entry.get("data", b""))
+    return {
+        "from": from_addr,
+        "to": normalize_address_for_web3(entry["to"]),
+        "value": entry.get("value", 0),
+        "data": data_hex,
+        "chainId": chain_id,
+        "gas": entry.get("gas_limit")
+        or (DEFAULT_GAS_LIMIT_TRANSFER if data_hex == "0x" else None),
+    }
+
+
+def _max_cost(tx_dict: dict) -> int:
+    return tx_dict.get("value", 0) + tx_dict["gas"] * tx_dict["gasPrice"]
+
+
+class PendingTransaction:
+    """Handle for a broadcast transaction whose receipt can be awaited later.
+
+    If the broadcast itself failed, ``error`` holds the exception and
+    ``wait()`` re-raises it.
+    """
+
+    def __init__(
+        self,
+        provider: RootstockProvider,
+        nonce: int,
+        tx_hash: str | None = None,
+        error: Exception | None = None,
+        on_mined: Callable[[dict], None] | None = None,
+        sender: str | None = None,
+        blocked_by: int | None = None,
+    ):
+        self._provider = provider
+        self._nonce = nonce
+        self._tx_hash = tx_hash
+        self._error = error
+        self._on_mined = on_mined
+        self._sender = sender
+        self._blocked_by = blocked_by
+        self._receipt: dict | None = None
+        self._mined_seen = False
+
+    @property
+    def nonce(self) -> int:
+        return self._nonce
+
+    @property
+    def tx_hash(self) -> str | None:
+        return self._tx_hash
+
+    @property
+    def error(self) -> Exception | None:
+        return self._error
+
+    @property
+    def sender(self) -> str | None:
+        """Address of the wallet that signed the transaction."""
+        return self._sender
+
+    @property
+    def sent(self) -> bool:
+        return self._error is None
+
+    @property
+    def blocked_by(self) -> int | None:
+        """Lowest lower nonce of the same batch whose broadcast failed, if any.
+
+        A sent transaction cannot be mined until that nonce is used by some
+        other transaction.
+        """
+        return self._blocked_by
+
+    @property
+    def done(self) -> bool:
+        """True once the broadcast failed or ``wait()`` saw the transaction mined."""
+        return self._error is not None or self._mined_seen
+
+    def wait(self, timeout: int = 120, poll_interval: float = 2.0) -> dict:
+        """Block until the transaction is mined and return its receipt."""
+        if self._error is not None:
+            raise self._error
+        if self._receipt is None:
+            try:
+                self._receipt = self._provider.wait_for_transaction(
+                    self._tx_hash, timeout=timeout, poll_interval=poll_interval
+                )
+            except TransactionRevertedError as exc:
+                self._mined(exc.receipt)
+                raise
+            self._mined(self._receipt)
+        return self._receipt
+
+    def _mined(self, receipt: dict) -> None:
+        self._mined_seen = True
+        if self._on_mined is not None:
+            self._on_mined(receipt)
+
+    def __repr__(self) -> str:
+        if self._error is not None:
+            return f"PendingTransaction(nonce={self._nonce}, error={self._error!r})"
+        return f"PendingTransaction(nonce={self._nonce}, tx_hash={self._tx_hash!r})"
+
+
 class TransactionBuilder:
-    def __init__(self, provider: RootstockProvider, wallet: Wallet):
+    def __init__(
+        self,
+        provider: RootstockProvider,
+        wallet: Wallet,
+        nonce_allocator: NonceAllocator | None = None,
+        balance_ledger: BalanceLedger | None = None,
+    ):
+        if balance_ledger is not None and balance_ledger.address.lower() != wallet.address.lower():
+            raise ValueError("balance_ledger tracks a different address than wallet")
         self._provider = provider
         self._wallet = wallet
+        self._nonce_allocator = nonce_allocator
+        self._balance_ledger = balance_ledger
         self._lock = threading.Lock()
         self._nonce_offset = 0
         self._last_base_nonce: int | None = None
 
+    @property
+    def provider(self) -> RootstockProvider:
+        return self._provider
+
+    @property
+    def wallet(self) -> Wallet:
+        return self._wallet
+
     def transfer(
         self,
         to: str,
@@ -73,28 +253,41 @@ class TransactionBuilder:
         gas_price: int | None = None,
         nonce: int | None = None,
     ) -> dict:
-        """Build a legacy transaction dict."""
+        """Build a legacy transaction dict.
+
+        Missing nonce, gas price and gas limit are fetched concurrently, so
+        auto-filling costs one round trip of latency rather than three.
+        """
         to_addr = normalize_address_for_web3(to)
         from_addr = normalize_address_for_web3(self._wallet.address)
         data_hex = _normalize_data(data)
 
-        actual_nonce = nonce if nonce is not None else self._auto_nonce()
-        actual_gas_price = gas_price if gas_price is not None else self._auto_gas_price()
-
         tx: dict = {
             "from": from_addr,
             "to": to_addr,
             "value": value,
             "data": data_hex,
-            "nonce": actual_nonce,
-            "gasPrice": actual_gas_price,
+            "nonce": nonce,
+            "gasPrice": gas_price,
             "chainId": self._provider.chain_id,
+            "gas": gas_limit,
         }
+        call_params = {"from": from_addr, "to": to_addr, "value": value, "data": data_hex}
 
-        if gas_limit is not None:
-            tx["gas"] = gas_limit
-        else:
-            tx["gas"] = self._provider.estimate_gas(tx)
+        lookups: dict[str, Callable[[], int]] = {}
+        if nonce is None:
+            lookups["nonce"] = self._auto_nonce
+        if gas_price is None:
+            lookups["gasPrice"] = self._auto_gas_price
+        if gas_limit is None:
+            lookups["gas"] = lambda: self._provider.estimate_gas(call_params)
+
+        results, error = _fetch_concurrently(lookups)
+        if error is not None:
+            if "nonce" in results:
+                self.release_nonce(results["nonce"])
+            raise error
+        tx.update(results)
 
         logger.debug(
             "Built transaction: to=%s, value=%d, nonce=%d", tx["to"], tx["value"], tx["nonce"]
@@ -113,22 +306,122 @@ class TransactionBuilder:
         Set check_balance=True to verify the wallet has enough funds before
         sending. Raises InsufficientFundsError if the balance is too low.
         Defaults to False for contract calls where value is typically zero.
+        With a balance_ledger the check is made against the local ledger
+        instead of a get_balance call.
         """
-        if check_balance:
+        if check_balance and self._balance_ledger is not None:
+            self._balance_ledger.reserve(tx_dict["nonce"], _max_cost(tx_dict))
+        elif check_balance:
             balance = self._provider.get_balance(self._wallet.address)
-            total_needed = tx_dict.get("value", 0) + tx_dict["gas"] * tx_dict["gasPrice"]
+            total_needed = _max_cost(tx_dict)
             if balance < total_needed:
                 raise InsufficientFundsError(
                     f"Insufficient funds: balance {balance} wei < required {total_needed} wei"
                 )
 
         signed_tx = self._wallet.sign_transaction(tx_dict)
-        tx_hash = self._provider.send_raw_transaction(signed_tx)
+        try:
+            tx_hash = self._provider.send_raw_transaction(signed_tx)
+        except Exception as exc:
+            self._broadcast_failed(tx_dict["nonce"], signed_tx, exc)
+            raise
+        self._mark_broadcast(tx_dict["nonce"], tx_hash)
 
         if wait:
-            return self._provider.wait_for_transaction(tx_hash, timeout=timeout)
+            try:
+                receipt = self._provider.wait_for_transaction(tx_hash, timeout=timeout)
+            except TransactionRevertedError as exc:
+                self._mined(tx_dict, exc.receipt)
+                raise
+            self._mined(tx_dict, receipt)
+            return receipt
         return tx_hash
 
+    def send_many(
+        self,
+        txs: list[dict],
+        concurrency: int = 8,
+        gas_price: int | None = None,
+        check_balance: bool = False,
+        signer: ProcessPoolSigner | None = None,
+        stop_on_error: bool = False,
+    ) -> list[PendingTransaction]:
+        """Build, sign and broadcast many transactions without waiting for receipts.
+
+        Each entry in ``txs`` takes ``to`` and optionally ``value`` (wei),
+        ``data`` and ``gas_limit``. Nonces are assigned in list order from one
+        contiguous block and the gas price is fetched once. Entries without
+        ``gas_limit`` use 21000 for plain transfers and ``estimate_gas``
+        otherwise. Pass a ``ProcessPoolSigner`` to sign large batches on
+        several cores. Broadcasts run on ``concurrency`` threads; a failed
+        broadcast is reported on its handle rather than raised.
+
+        A failed broadcast leaves a nonce gap: the later transactions of the
+        batch were already sent and stay pending until the gap is filled, and
+        their handles name the missing nonce in ``blocked_by``. With a nonce
+        allocator the gap is handed out to the next transaction; without one
+        only a failure at the top of the batch can be given back, so fill the
+        gap yourself (e.g. ``transfer(..., nonce=handle.blocked_by)``). With
+        ``stop_on_error=True`` broadcasts run strictly in order and stop at the
+        first failure; the remaining nonces are released and their handles
+        carry a TransactionError, so no gap is left.
+
+        A broadcast that fails with ProviderConnectionError may still have
+        reached the node, so its nonce is kept (and recorded as broadcast by
+        the allocator) instead of being released.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if not txs:
+            return []
+
+        from_addr = normalize_address_for_web3(self._wallet.address)
+        chain_id = self._provider.chain_id
+        tx_dicts = [_intent_to_tx(entry, from_addr, chain_id) for entry in txs]
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            to_estimate = [tx for tx in tx_dicts if tx["gas"] is None]
+            estimates = pool.map(self._provider.estimate_gas, [dict(tx) for tx in to_estimate])
+            for tx, gas in zip(to_estimate, estimates, strict=True):
+                tx["gas"] = gas
+
+            actual_gas_price = gas_price if gas_price is not None else self._auto_gas_price()
+            if check_balance and self._balance_ledger is None:
+                balance = self._provider.get_balance(self._wallet.address)
+                total_needed = sum(tx["value"] + tx["gas"] * actual_gas_price for tx in tx_dicts)
+                if balance < total_needed:
+                    raise InsufficientFundsError(
+                        f"Insufficient funds: balance {balance} wei < required {total_needed} wei"
+                    )
+
+            first_nonce = self._auto_nonces(len(tx_dicts))
+            for offset, tx in enumerate(tx_dicts):
+                tx["nonce"] = first_nonce + offset
+                tx["gasPrice"] = actual_gas_price
+            if check_balance and self._balance_ledger is not None:
+                self._reserve_all(tx_dicts)
+
+        # Sign with no pool threads alive so a process-based signer starts clean.
+        signed = self._wallet.sign_transactions(tx_dicts, signer)
+        if stop_on_error:
+            outcomes = self._broadcast_in_order(tx_dicts, signed)
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                outcomes = self._mark_blocked(list(pool.map(self._broadcast, tx_dicts, signed)))
+
+        logger.info(
+            "Broadcast %d/%d transactions (nonces %d..%d)",
+            sum(1 for o in outcomes if o.sent),
+            len(outcomes),
+            first_nonce,
+            first_nonce + len(outcomes) - 1,
+        )
+        return outcomes
+
+    def sequence(self) -> TransactionSequence:
+        """Start a sequence of dependent transactions sent back-to-back."""
+        return TransactionSequence(self)
+
     def estimate_total_cost(
         self,
         to: str,
@@ -147,8 +440,16 @@ class TransactionBuilder:
             "data": data_hex,
         }
 
-        gas = self._provider.estimate_gas(tx_params)
-        gas_price = self._auto_gas_price()
+        results, error = _fetch_concurrently(
+            {
+                "gas": lambda: self._provider.estimate_gas(tx_params),
+                "gas_price": self._auto_gas_price,
+            }
+        )
+        if error is not None:
+            raise error
+        gas = results["gas"]
+        gas_price = results["gas_price"]
         gas_cost = gas * gas_price
         total_cost = value + gas_cost
 
@@ -162,21 +463,243 @@ class TransactionBuilder:
         }
 
     def reset_nonce(self) -> None:
-        """Reset the nonce offset."""
+        """Reset the nonce offset (and the allocator's records for this wallet)."""
         with self._lock:
             self._nonce_offset = 0
             self._last_base_nonce = None
+        if self._nonce_allocator is not None:
+            self._nonce_allocator.reset(self._wallet.address)
+
+    def release_nonce(self, nonce: int) -> None:
+        """Give back an auto-assigned nonce whose transaction was never broadcast."""
+        if self._nonce_allocator is not None:
+            self._nonce_allocator.release(self._wallet.address, nonce)
+            return
+        with self._lock:
+            # Only the most recently assigned nonce can be handed back without leaving a gap.
+            if self._last_base_nonce is None:
+                return
+            if nonce == self._last_base_nonce + self._nonce_offset:
+                if self._nonce_offset == 0:
+                    self._last_base_nonce = None
+                else:
+                    self._nonce_offset -= 1
+
+    def _auto_nonce(self, minimum: int = 0) -> int:
+        return self._auto_nonces(1, minimum)
+
+    def _auto_nonces(self, count: int, minimum: int = 0) -> int:
+        """Reserve ``count`` consecutive nonces and return the first one.
 
-    def _auto_nonce(self) -> int:
+        Without an allocator, ``minimum`` skips nonces known to be taken by
+        transactions the chain count does not show yet; an allocator already
+        records those itself.
+        """
+        if self._nonce_allocator is not None:
+            base = self._provider.get_transaction_count(self._wallet.address)
+            return self._nonce_allocator.allocate(self._wallet.address, base, count)
         # Local offset tracks rapid sequential builds; resets when the on-chain nonce advances.
         with self._lock:
             base = self._provider.get_transaction_count(self._wallet.address)
             if self._last_base_nonce is not None and base == self._last_base_nonce:
-                self._nonce_offset += 1
+                start = base + self._nonce_offset + 1
             else:
-                self._nonce_offset = 0
+                start = base
                 self._last_base_nonce = base
-            return base + self._nonce_offset
+            start = max(start, minimum)
+            self._nonce_offset = start - base + count - 1
+            return start
+
+    def _broadcast(self, tx_dict: dict, signed_tx: bytes) -> PendingTransaction:
+        nonce = tx_dict["nonce"]
+        try:
+            tx_hash = self._provider.send_raw_transaction(signed_tx)
+        except Exception as exc:
+            self._broadcast_failed(nonce, signed_tx, exc)
+            return PendingTransaction(
+                self._provider, nonce, error=exc, sender=self._wallet.address
+            )
+        self._mark_broadcast(nonce, tx_hash)
+        return PendingTransaction(
+            self._provider,
+            nonce,
+            tx_hash,
+            on_mined=lambda receipt: self._mined(tx_dict, receipt),
+            sender=self._wallet.address,
+        )
+
+    def _broadcast_in_order(
+        self, tx_dicts: list[dict], signed: list[bytes]
+    ) -> list[PendingTransaction]:
+        outcomes: list[PendingTransaction] = []
+        for tx, raw in zip(tx_dicts, signed, strict=True):
+            outcome = self._broadcast(tx, raw)
+            outcomes.append(outcome)
+            if not outcome.sent:
+                break
+        if len(outcomes) == len(tx_dicts):
+            return outcomes
+
+        failed_nonce = outcomes[-1].nonce
+        skipped = tx_dicts[len(outcomes) :]
+        # Release from the top down so the local nonce offset can roll back past the failure.
+        for tx in reversed(skipped):
+            self._unreserve(tx["nonce"])
+        if not isinstance(outcomes[-1].error, ProviderConnectionError):
+            self._unreserve(failed_nonce)
+        error = TransactionError(f"Not broadcast because nonce {failed_nonce} failed")
+        outcomes.extend(
+            PendingTransaction(
+                self._provider, tx["nonce"], error=error, sender=self._wallet.address
+            )
+            for tx in skipped
+        )
+        return outcomes
+
+    def _mark_blocked(self, outcomes: list[PendingTransaction]) -> list[PendingTransaction]:
+        failed = [o.nonce for o in outcomes if not o.sent]
+        if not failed:
+            return outcomes
+        gap = min(failed)
+        for outcome in outcomes:
+            if outcome.sent and outcome.nonce > gap:
+                outcome._blocked_by = gap
+        stranded = [o.nonce for o in outcomes if o.blocked_by is not None]
+        if stranded:
+            logger.warning(
+                "Nonces %s were broadcast but wait behind failed nonce(s) %s",
+                stranded,
+                sorted(failed),
+            )
+        return outcomes
+
+    def _reserve_all(self, tx_dicts: list[dict]) -> None:
+        reserved: list[int] = []
+        try:
+            for tx in tx_dicts:
+                self._balance_ledger.reserve(tx["nonce"], _max_cost(tx))
+                reserved.append(tx["nonce"])
+        except InsufficientFundsError:
+            for nonce in reserved:
+                self._balance_ledger.release(nonce)
+            for tx in reversed(tx_dicts):
+                self.release_nonce(tx["nonce"])
+            raise
+
+    def _broadcast_failed(self, nonce: int, signed_tx: bytes, exc: Exception) -> None:
+        if not isinstance(exc, ProviderConnectionError):
+            self._unreserve(nonce)
+            return
+        # The node may have accepted it before the connection failed, so the nonce stays taken.
+        logger.warning("Broadcast of nonce %d may have reached the node: %s", nonce, exc)
+        self._mark_broadcast(nonce, "0x" + keccak(bytes(signed_tx)).hex())
+
+    def _mark_broadcast(self, nonce: int, tx_hash: str) -> None:
+        if self._nonce_allocator is not None:
+            self._nonce_allocator.mark_broadcast(self._wallet.address, nonce, tx_hash)
+
+    def _unreserve(self, nonce: int) -> None:
+        self.release_nonce(nonce)
+        if self._balance_ledger is not None:
+            self._balance_ledger.release(nonce)
+
+    def _mined(self, tx_dict: dict, receipt: dict) -> None:
+        nonce = tx_dict["nonce"]
+        if self._nonce_allocator is not None:
+            self._nonce_allocator.mark_confirmed(self._wallet.address, nonce)
+        if self._balance_ledger is not None and "gasUsed" in receipt:
+            cost = tx_dict.get("value", 0) + receipt["gasUsed"] * tx_dict["gasPrice"]
+            self._balance_ledger.settle(nonce, cost)
 
     def _auto_gas_price(self) -> int:
         return self._provider.get_gas_price()
+
+
+class TransactionSequence:
+    """Dependent transactions broadcast back-to-back with consecutive nonces.
+
+    Node mempools order one sender's transactions by nonce, so a step that
+    depends on an earlier one (e.g. ``transferFrom`` after ``approve``) can be
+    broadcast before the earlier step is mined. Gas cannot be estimated for
+    such a step until its predecessors have executed, so steps with calldata
+    need an explicit ``gas_limit``. The whole sequence is usually mined in
+    one block instead of one block per step.
+    """
+
+    def __init__(self, builder: TransactionBuilder):
+        self._builder = builder
+        self._steps: list[dict] = []
+        self._handles: list[PendingTransaction] | None = None
+
+    @property
+    def handles(self) -> list[PendingTransaction]:
+        """Handles of the broadcast steps; empty until ``send`` is called."""
+        return list(self._handles or [])
+
+    def add(
+        self,
+        to: str,
+        value: int = 0,
+        data: bytes | str = b"",
+        gas_limit: int | None = None,
+    ) -> TransactionSequence:
+        """Append a step and return the sequence for chaining."""
+        if self._handles is not None:
+            raise TransactionError("Sequence was already sent")
+        if gas_limit is None and _normalize_data(data) != "0x":
+            raise ValueError("Steps with calldata need an explicit gas_limit")
+        self._steps.append({"to": to, "value": value, "data": data, "gas_limit": gas_limit})
+        return self
+
+    def send(
+        self,
+        wait: bool = True,
+        timeout: int = 120,
+        gas_price: int | None = None,
+        check_balance: bool = False,
+    ) -> list[dict] | list[PendingTransaction]:
+        """Broadcast every step in order without waiting in between.
+
+        If a broadcast fails, the later steps are not sent and the error is
+        raised. With ``wait=True`` returns the receipts of all steps; otherwise
+        returns their handles.
+        """
+        if self._handles is not None:
+            raise TransactionError("Sequence was already sent")
+        if not self._steps:
+            raise ValueError("Sequence has no steps")
+        self._handles = self._builder.send_many(
+            self._steps,
+            concurrency=1,
+            gas_price=gas_price,
+            check_balance=check_balance,
+            stop_on_error=True,
+        )
+        for handle in self._handles:
+            if handle.error is not None:
+                raise handle.error
+        if not wait:
+            return self.handles
+        return self.wait(timeout)
+
+    def wait(self, timeout: int = 120) -> list[dict]:
+        """Wait for the last step, then collect the receipts of the earlier ones.
+
+        Raises TransactionRevertedError for the first step that reverted.
+        """
+        if not self._handles:
+            raise TransactionError("Sequence was not sent")
+        *earlier, last = self._handles
+        receipts: list[dict] = []
+        last_error: TransactionRevertedError | None = None
+        try:
+            last_receipt = last.wait(timeout)
+        except TransactionRevertedError as exc:
+            last_receipt, last_error = exc.receipt, exc
+        # Nonce order means the earlier steps are mined once the last one is.
+        for handle in earlier:
+            receipts.append(handle.wait(timeout))
+        if last_error is not None:
+            raise last_error
+        receipts.append(last_receipt)
+        return receipts
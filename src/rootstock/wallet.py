@@ -12,6 +12,7 @@ from eth_account.signers.local import LocalAccount
 from rootstock._utils.checksum import to_checksum_address as rsk_checksum
 from rootstock.constants import ChainId
 from rootstock.exceptions import InvalidPrivateKeyError, KeystoreDecryptionError
+from rootstock.signing import ProcessPoolSigner
 from rootstock.types import KeystoreDict, PrivateKey
 
 logger = logging.getLogger(__name__)
@@ -91,6 +92,14 @@ class Wallet:
         signed = self._account.sign_transaction(tx_dict)
         return bytes(signed.raw_transaction)
 
+    def sign_transactions(
+        self, tx_dicts: list[dict], signer: ProcessPoolSigner | None = None
+    ) -> list[bytes]:
+        """Sign many transactions, optionally on a process pool. Results keep input order."""
+        if signer is None:
+            return [self.sign_transaction(tx) for tx in tx_dicts]
+        return signer.sign_many(self._account.key, tx_dicts)
+
     def sign_message(self, message: str | bytes) -> str:
         from eth_account.messages import encode_defunct
 
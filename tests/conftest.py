@@ -1,6 +1,11 @@
+from unittest.mock import patch
+
 import pytest
+from web3 import Web3
+from web3.providers import BaseProvider
 
 from rootstock.constants import ChainId
+from rootstock.provider import RootstockProvider
 from rootstock.wallet import Wallet
 
 TEST_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
@@ -9,3 +14,32 @@ TEST_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4
 @pytest.fixture
 def test_wallet():
     return Wallet.from_private_key(TEST_PRIVATE_KEY, chain_id=ChainId.TESTNET)
+
+
+class StubNode(BaseProvider):
+    """JSON-RPC provider answering each method from ``results`` (a value or a callable)."""
+
+    def __init__(self):
+        super().__init__()
+        self.results: dict = {}
+        self.calls: list[tuple[str, list]] = []
+
+    def make_request(self, method, params):
+        self.calls.append((method, list(params)))
+        result = self.results.get(method)
+        if callable(result):
+            result = result(params)
+        return {"jsonrpc": "2.0", "id": len(self.calls), "result": result}
+
+
+@pytest.fixture
+def stub_node():
+    return StubNode()
+
+
+@pytest.fixture
+def stub_provider(stub_node):
+    with patch.object(
+        RootstockProvider, "_configure_web3", lambda self, url, timeout: Web3(stub_node)
+    ):
+        return RootstockProvider.from_url("http://stub", chain_id=ChainId.TESTNET)
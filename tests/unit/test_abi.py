@@ -0,0 +1,185 @@
+from unittest.mock import MagicMock
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from rootstock._abi import abi_key, bind_contract, contract_class, load_abi
+from rootstock._utils.abi import FunctionCodec, function_codec, output_decoder
+from rootstock.exceptions import ABIError
+from rootstock.tokens import ERC20Token
+
+ADDR = "0x27b1fdb04752bbc536007a920d24acb045561c26"
+BAD_CHECKSUM = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAeD"
+LOWERCASE = "0x5aaeb6053f3e94c9b9a09f33669435e7ef1beaed"
+
+TRANSFER = {
+    "type": "function",
+    "name": "transfer",
+    "inputs": [{"name": "to", "type": "address"}, {"name": "amount", "type": "uint256"}],
+    "outputs": [{"name": "", "type": "bool"}],
+}
+MIXED = {
+    "type": "function",
+    "name": "mixed",
+    "inputs": [
+        {"name": "a", "type": "int8"},
+        {"name": "b", "type": "bool"},
+        {"name": "c", "type": "bytes4"},
+        {"name": "d", "type": "string"},
+    ],
+    "outputs": [],
+}
+
+
+def web3_encode(entry, *args):
+    return Web3().eth.contract(abi=[entry]).encode_abi(entry["name"], args=list(args))
+
+
+class TestFunctionCodec:
+    def test_selector(self):
+        assert function_codec(TRANSFER).selector.hex() == "a9059cbb"
+
+    def test_static_fast_path_matches_web3(self):
+        data = function_codec(TRANSFER).encode_hex(Web3.to_checksum_address(ADDR), 10**18)
+        assert data == web3_encode(TRANSFER, Web3.to_checksum_address(ADDR), 10**18)
+
+    def test_dynamic_types_match_web3(self):
+        args = (-5, True, b"\x01\x02\x03\x04", "hello")
+        assert function_codec(MIXED).encode_hex(*args) == web3_encode(MIXED, *args)
+
+    def test_negative_int_fast_path(self):
+        entry = {"type": "function", "name": "f", "inputs": [{"type": "int256"}]}
+        assert function_codec(entry).encode(-1)[4:] == b"\xff" * 32
+
+    def test_codec_shared_per_signature(self):
+        assert function_codec(TRANSFER) is function_codec(dict(TRANSFER))
+
+    def test_wrong_arity_raises(self):
+        with pytest.raises(ABIError, match="takes 2 arguments"):
+            function_codec(TRANSFER).encode(ADDR)
+
+    def test_out_of_range_raises(self):
+        with pytest.raises(ABIError, match="Cannot encode"):
+            function_codec(TRANSFER).encode(ADDR, -1)
+
+    def test_bad_checksum_raises(self):
+        with pytest.raises(ABIError, match="checksum"):
+            function_codec(TRANSFER).encode(BAD_CHECKSUM, 1)
+
+    def test_lowercase_address_raises(self):
+        with pytest.raises(ABIError, match="checksum"):
+            function_codec(TRANSFER).encode(LOWERCASE, 1)
+
+    def test_bad_checksum_raises_on_slow_path(self):
+        entry = {
+            "type": "function",
+            "name": "h",
+            "inputs": [{"type": "address[]"}, {"type": "string"}],
+        }
+        with pytest.raises(ABIError, match="checksum"):
+            function_codec(entry).encode([LOWERCASE], "x")
+
+    def test_bad_checksum_raises_in_encode_many(self):
+        with pytest.raises(ABIError, match="checksum"):
+            function_codec(TRANSFER).encode_many([[BAD_CHECKSUM], [1]])
+
+    def test_tuple_inputs_use_canonical_signature(self):
+        entry = {
+            "type": "function",
+            "name": "g",
+            "inputs": [
+                {"type": "tuple", "components": [{"type": "address"}, {"type": "uint256"}]}
+            ],
+        }
+        assert function_codec(entry).signature == "g((address,uint256))"
+
+    def test_repr(self):
+        assert repr(FunctionCodec("f", ("uint256",))) == "FunctionCodec('f(uint256)')"
+
+
+class TestEncodeMany:
+    def test_matches_single_encodes(self):
+        codec = function_codec(TRANSFER)
+        addrs = ["0x" + f"{i:040x}" for i in range(3)]
+        amounts = [0, 1, 2**256 - 1]
+        assert codec.encode_many([addrs, amounts]) == [
+            codec.encode(a, v) for a, v in zip(addrs, amounts, strict=True)
+        ]
+
+    def test_dynamic_types_fall_back(self):
+        codec = function_codec(MIXED)
+        columns = [[1, -2], [True, False], [b"abcd", b"efgh"], ["x", "yz"]]
+        assert codec.encode_many(columns) == [
+            codec.encode(*row) for row in zip(*columns, strict=True)
+        ]
+
+    def test_uneven_columns_raise(self):
+        with pytest.raises(ABIError, match="same length"):
+            function_codec(TRANSFER).encode_many([[ADDR, ADDR], [1]])
+
+    def test_numpy_integer_column(self):
+        np = pytest.importorskip("numpy")
+        codec = function_codec(TRANSFER)
+        amounts = np.array([0, 5, 2**63], dtype=np.uint64)
+        to = Web3.to_checksum_address(ADDR)
+        assert codec.encode_many([[to] * 3, amounts]) == [
+            codec.encode(to, int(v)) for v in amounts
+        ]
+
+    def test_numpy_signed_negative(self):
+        np = pytest.importorskip("numpy")
+        entry = {"type": "function", "name": "f", "inputs": [{"type": "int256"}]}
+        codec = function_codec(entry)
+        assert codec.encode_many([np.array([-1, 3])]) == [codec.encode(-1), codec.encode(3)]
+
+
+class TestOutputDecoder:
+    def test_static_outputs_sliced(self):
+        data = bytes(12) + bytes.fromhex(ADDR[2:]) + (7).to_bytes(32, "big")
+        assert output_decoder(("address", "uint256"))(data) == [
+            Web3.to_checksum_address(ADDR),
+            7,
+        ]
+
+    def test_single_output_unwrapped(self):
+        assert output_decoder(("bool",))((1).to_bytes(32, "big")) is True
+
+    def test_dynamic_output(self):
+        data = encode(["string"], ["hi"])
+        assert output_decoder(("string",))(data) == "hi"
+
+    def test_signed_output(self):
+        assert output_decoder(("int256",))(b"\xff" * 32) == -1
+
+    def test_fixed_bytes_output(self):
+        data = encode(["bytes4", "uint8"], [b"abcd", 3])
+        assert output_decoder(("bytes4", "uint8"))(data) == [b"abcd", 3]
+
+
+class TestContractClassCache:
+    def test_bundled_abi_parsed_once(self):
+        assert load_abi("erc20") is load_abi("erc20")
+
+    def test_key_depends_on_content(self):
+        abi = [TRANSFER]
+        assert abi_key(abi) == abi_key([dict(TRANSFER)])
+        assert abi_key(abi) != abi_key([MIXED])
+
+    def test_class_shared_per_web3_and_abi(self):
+        w3 = Web3()
+        cls = contract_class(w3, [TRANSFER])
+        assert contract_class(w3, [dict(TRANSFER)]) is cls
+        assert contract_class(Web3(), [TRANSFER]) is not cls
+
+    def test_bind_contract(self):
+        contract = bind_contract(Web3(), Web3.to_checksum_address(ADDR), [TRANSFER])
+        assert contract.address == Web3.to_checksum_address(ADDR)
+
+    def test_tokens_bind_lazily(self):
+        provider = MagicMock()
+        provider.w3 = Web3()
+        token = ERC20Token(provider, ADDR)
+        assert token._bound is None
+        other = ERC20Token(provider, "0x" + "11" * 20)
+        assert type(token.web3_contract) is type(other.web3_contract)
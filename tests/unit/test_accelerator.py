@@ -0,0 +1,170 @@
+from unittest.mock import MagicMock
+
+import pytest
+from eth_hash.auto import keccak
+
+from rootstock.accelerator import GasBumpPolicy, TransactionAccelerator
+from rootstock.constants import ChainId
+from rootstock.exceptions import (
+    NonceTooLowError,
+    RPCError,
+    TransactionError,
+    TransactionRevertedError,
+)
+from rootstock.transactions import TransactionBuilder
+from rootstock.wallet import Wallet
+
+TEST_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+TEST_TO = "0x0000000000000000000000000000000000000001"
+HASH_A = "0x" + "aa" * 32
+HASH_B = "0x" + "bb" * 32
+
+
+def keccak_hex(raw_hex: str) -> str:
+    return keccak(bytes.fromhex(raw_hex.removeprefix("0x"))).hex()
+
+
+@pytest.fixture
+def mock_provider():
+    provider = MagicMock()
+    provider.chain_id = ChainId.TESTNET
+    provider.get_transaction_count.return_value = 5
+    provider.get_gas_price.return_value = 60_000_000
+    provider.get_block_number.return_value = 100
+    provider.get_transaction_receipt.return_value = None
+    provider.send_raw_transaction.side_effect = [HASH_A, HASH_B]
+    return provider
+
+
+@pytest.fixture
+def builder(mock_provider):
+    wallet = Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+    return TransactionBuilder(mock_provider, wallet)
+
+
+@pytest.fixture
+def accelerator(builder):
+    return TransactionAccelerator(builder, GasBumpPolicy(stuck_after_blocks=3, bump_percent=10))
+
+
+@pytest.fixture
+def tx(builder):
+    return builder.build_transaction(to=TEST_TO, value=1, gas_limit=21_000)
+
+
+class TestGasBumpPolicy:
+    def test_bumps_by_percent(self):
+        assert GasBumpPolicy(bump_percent=10).next_gas_price(100, 50) == 110
+
+    def test_rounds_up(self):
+        assert GasBumpPolicy(bump_percent=10).next_gas_price(101, 0) == 112
+
+    def test_follows_network_price(self):
+        assert GasBumpPolicy(bump_percent=10).next_gas_price(100, 500) == 500
+
+    def test_capped_by_max(self):
+        policy = GasBumpPolicy(bump_percent=50, max_gas_price=120)
+        assert policy.next_gas_price(100, 0) == 120
+        assert policy.next_gas_price(120, 0) is None
+
+    def test_invalid_values_raise(self):
+        with pytest.raises(ValueError):
+            GasBumpPolicy(stuck_after_blocks=0)
+        with pytest.raises(ValueError):
+            GasBumpPolicy(bump_percent=0)
+
+
+class TestTransactionAccelerator:
+    def test_send_tracks_transaction(self, accelerator, tx):
+        item = accelerator.send(tx)
+        assert item.hashes == [HASH_A]
+        assert item.sent_block == 100
+        assert accelerator.pending == [item]
+
+    def test_not_bumped_before_threshold(self, accelerator, mock_provider, tx):
+        accelerator.send(tx)
+        mock_provider.get_block_number.return_value = 102
+        assert accelerator.poll() == []
+        assert mock_provider.send_raw_transaction.call_count == 1
+
+    def test_bumps_stuck_transaction(self, accelerator, mock_provider, tx):
+        item = accelerator.send(tx)
+        mock_provider.get_block_number.return_value = 103
+        accelerator.poll()
+        assert item.hashes == [HASH_A, HASH_B]
+        assert item.gas_price == 66_000_000
+        assert item.tx_dict["nonce"] == tx["nonce"]
+        assert item.sent_block == 103
+
+    def test_reports_mined_replacement(self, accelerator, mock_provider, tx):
+        item = accelerator.send(tx)
+        mock_provider.get_block_number.return_value = 103
+        accelerator.poll()
+        mock_provider.get_transaction_receipt.side_effect = lambda h: (
+            {"status": 1, "transactionHash": h} if h == HASH_B else None
+        )
+        assert accelerator.poll() == [item]
+        assert item.mined_hash == HASH_B
+        assert item.replaced is True
+        assert accelerator.pending == []
+
+    def test_original_mined(self, accelerator, mock_provider, tx):
+        item = accelerator.send(tx)
+        mock_provider.get_transaction_receipt.return_value = {"status": 1}
+        accelerator.poll()
+        assert item.mined_hash == HASH_A
+        assert item.replaced is False
+
+    def test_rejected_replacement_keeps_tracking(self, accelerator, mock_provider, tx):
+        item = accelerator.send(tx)
+        mock_provider.send_raw_transaction.side_effect = RPCError("replacement underpriced")
+        mock_provider.get_block_number.return_value = 110
+        accelerator.poll()
+        assert item.hashes == [HASH_A]
+        assert accelerator.pending == [item]
+
+    def test_nonce_too_low_on_bump(self, accelerator, mock_provider, tx):
+        item = accelerator.send(tx)
+        mock_provider.send_raw_transaction.side_effect = NonceTooLowError("nonce too low")
+        mock_provider.get_block_number.return_value = 110
+        accelerator.poll()
+        assert item.hashes == [HASH_A]
+
+    def test_wait_returns_receipt(self, accelerator, mock_provider, tx):
+        item = accelerator.send(tx)
+        mock_provider.get_transaction_receipt.return_value = {"status": 1}
+        assert accelerator.wait(item, poll_interval=0) == {"status": 1}
+
+    def test_wait_reverted_raises(self, accelerator, mock_provider, tx):
+        item = accelerator.send(tx)
+        mock_provider.get_transaction_receipt.return_value = {"status": 0}
+        with pytest.raises(TransactionRevertedError):
+            accelerator.wait(item, poll_interval=0)
+
+    def test_wait_timeout_raises(self, accelerator, tx):
+        item = accelerator.send(tx)
+        with pytest.raises(TransactionError, match="not mined"):
+            accelerator.wait(item, timeout=0, poll_interval=0)
+
+
+class TestAgainstNode:
+    def test_pending_receipt_from_node_is_not_an_error(self, stub_provider, stub_node):
+        block = {"number": 100}
+        stub_node.results.update(
+            {
+                "eth_blockNumber": lambda params: hex(block["number"]),
+                "eth_gasPrice": hex(60_000_000),
+                "eth_getTransactionCount": "0x5",
+                "eth_sendRawTransaction": lambda params: "0x" + keccak_hex(params[0]),
+                "eth_getTransactionReceipt": None,
+            }
+        )
+        wallet = Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+        builder = TransactionBuilder(stub_provider, wallet)
+        accelerator = TransactionAccelerator(builder, GasBumpPolicy(stuck_after_blocks=3))
+        item = accelerator.send(builder.build_transaction(to=TEST_TO, value=1, gas_limit=21_000))
+
+        assert accelerator.poll() == []
+        block["number"] = 103
+        assert accelerator.poll() == []
+        assert len(item.hashes) == 2
@@ -0,0 +1,130 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from web3 import Web3
+
+from rootstock.airdrop import Airdrop, read_recipients
+from rootstock.constants import ChainId
+from rootstock.exceptions import RPCError
+from rootstock.tokens import ERC20Token
+from rootstock.transactions import TransactionBuilder
+from rootstock.wallet import Wallet
+
+TEST_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+RIF = "0x2acc95758f8b5f583470ba265eb685a8f45fc9d5"
+RECIPIENTS = [("0x" + f"{i:040x}", i * 10) for i in range(1, 6)]
+
+
+@pytest.fixture
+def provider():
+    provider = MagicMock()
+    provider.chain_id = ChainId.TESTNET
+    provider.w3 = Web3()
+    provider.get_transaction_count.return_value = 0
+    provider.get_gas_price.return_value = 60_000_000
+    provider.estimate_gas.return_value = 50_000
+    provider.send_raw_transaction.return_value = "0x" + "ab" * 32
+    return provider
+
+
+@pytest.fixture
+def airdrop(provider, tmp_path):
+    wallet = Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+    builder = TransactionBuilder(provider, wallet)
+    return Airdrop(ERC20Token(provider, RIF), builder, tmp_path / "results.jsonl", batch_size=2)
+
+
+class TestAirdrop:
+    def test_sends_every_row(self, airdrop, provider):
+        report = airdrop.run(RECIPIENTS)
+        assert [r.nonce for r in report.sent] == [0, 1, 2, 3, 4]
+        assert provider.send_raw_transaction.call_count == 5
+
+    def test_learns_gas_limit_once(self, airdrop, provider):
+        airdrop.run(RECIPIENTS)
+        assert provider.estimate_gas.call_count == 5
+        assert airdrop.gas_limit == 60_000
+        airdrop.run([*RECIPIENTS, ("0x" + "77" * 20, 1)])
+        assert provider.estimate_gas.call_count == 5
+
+    def test_gas_limit_covers_costliest_sampled_row(self, provider, tmp_path):
+        wallet = Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+        airdrop = Airdrop(
+            ERC20Token(provider, RIF),
+            TransactionBuilder(provider, wallet),
+            tmp_path / "r.jsonl",
+            gas_sample_size=3,
+        )
+        provider.estimate_gas.side_effect = [35_000, 52_000, 35_000]
+        recipients = [("0x" + f"{i:040x}", 1) for i in range(1, 10)]
+        airdrop.run(recipients)
+        assert provider.estimate_gas.call_count == 3
+        assert airdrop.gas_limit == 52_000 * 120 // 100
+        sampled = [c.args[0]["data"][-128:-64] for c in provider.estimate_gas.call_args_list]
+        assert [int(d, 16) for d in sampled] == [1, 5, 9]
+
+    def test_gas_price_fetched_once(self, airdrop, provider):
+        airdrop.run(RECIPIENTS)
+        provider.get_gas_price.assert_called_once()
+
+    def test_results_file_written_per_row(self, airdrop, tmp_path):
+        airdrop.run(RECIPIENTS)
+        lines = (tmp_path / "results.jsonl").read_text().splitlines()
+        assert [json.loads(line)["row"] for line in lines] == [0, 1, 2, 3, 4]
+
+    def test_resume_skips_sent_and_retries_failed(self, airdrop, provider):
+        provider.send_raw_transaction.side_effect = [
+            "0x" + "ab" * 32,
+            RPCError("rejected"),
+            *["0x" + "ab" * 32] * 10,
+        ]
+        first = airdrop.run(RECIPIENTS)
+        assert [r.row for r in first.failed] == [1]
+        assert first.unsent == 3
+
+        second = airdrop.run(RECIPIENTS)
+        assert second.skipped == 1
+        assert [r.row for r in second.sent] == [1, 2, 3, 4]
+
+    def test_mid_batch_failure_leaves_no_nonce_gap(self, provider, tmp_path):
+        wallet = Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+        builder = TransactionBuilder(provider, wallet)
+        airdrop = Airdrop(ERC20Token(provider, RIF), builder, tmp_path / "r.jsonl", batch_size=5)
+        provider.send_raw_transaction.side_effect = [
+            "0x" + "ab" * 32,
+            RPCError("rejected"),
+            *["0x" + "ab" * 32] * 10,
+        ]
+        first = airdrop.run(RECIPIENTS)
+        assert [r.nonce for r in first.sent] == [0]
+        assert [r.row for r in first.failed] == [1, 2, 3, 4]
+        assert provider.send_raw_transaction.call_count == 2
+
+        second = airdrop.run(RECIPIENTS)
+        assert second.skipped == 1
+        assert [r.nonce for r in second.sent] == [1, 2, 3, 4]
+        sent = first.sent + second.sent
+        assert sorted(r.nonce for r in sent) == list(range(5))
+
+    def test_changed_recipients_rejected(self, airdrop):
+        airdrop.run(RECIPIENTS[:2])
+        changed = [(RECIPIENTS[0][0], 999), RECIPIENTS[1]]
+        with pytest.raises(ValueError, match="differs"):
+            airdrop.run(changed)
+
+    def test_negative_amount_rejected(self, airdrop):
+        with pytest.raises(ValueError):
+            airdrop.run([(RECIPIENTS[0][0], -1)])
+
+
+class TestReadRecipients:
+    def test_csv_with_header(self, tmp_path):
+        path = tmp_path / "r.csv"
+        path.write_text("address,amount\n0x" + "01" * 20 + ",5\n\n0x" + "02" * 20 + ",7\n")
+        assert read_recipients(path) == [("0x" + "01" * 20, 5), ("0x" + "02" * 20, 7)]
+
+    def test_run_accepts_path(self, airdrop, tmp_path):
+        path = tmp_path / "r.csv"
+        path.write_text("0x" + "01" * 20 + ",5\n")
+        assert len(airdrop.run(path).sent) == 1
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+import pytest
+from eth_hash.auto import keccak
+
+from rootstock.code_cache import CodeCache
+
+CODE = b"\x60\x80\x60\x40"
+CODE_HASH = "0x" + keccak(CODE).hex()
+TOKEN = "0x2acc95758f8b5f583470ba265eb685a8f45fc9d5"
+EOA = "0x" + "11" * 20
+
+
+@pytest.fixture
+def provider():
+    provider = MagicMock()
+    provider.chain_id = 30
+    codes = {TOKEN: CODE}
+    provider.get_code.side_effect = lambda a: codes.get(a.lower(), b"")
+    provider.get_code_many.side_effect = lambda addrs: [codes.get(a.lower(), b"") for a in addrs]
+    return provider
+
+
+class TestCodeCache:
+    def test_code_hash(self, provider):
+        cache = CodeCache()
+        assert cache.code_hash(provider, TOKEN) == CODE_HASH
+        assert cache.code_hash(provider, EOA) is None
+
+    def test_contract_code_fetched_once(self, provider):
+        cache = CodeCache()
+        assert cache.is_contract(provider, TOKEN)
+        assert cache.is_contract(provider, TOKEN.upper().replace("0X", "0x"))
+        provider.get_code.assert_called_once()
+
+    def test_empty_accounts_asked_again(self, provider):
+        cache = CodeCache()
+        cache.is_contract(provider, EOA)
+        cache.is_contract(provider, EOA)
+        assert provider.get_code.call_count == 2
+
+    def test_bulk_lookup_is_batched(self, provider):
+        cache = CodeCache()
+        addresses = [TOKEN, EOA, "0x" + "22" * 20]
+        assert cache.is_contract_many(provider, addresses, batch_size=2) == {
+            TOKEN: True,
+            EOA: False,
+            "0x" + "22" * 20: False,
+        }
+        assert provider.get_code_many.call_count == 1
+        assert provider.get_code.call_count == 1
+
+    def test_keyed_by_chain(self, provider):
+        cache = CodeCache()
+        cache.is_contract(provider, TOKEN)
+        provider.chain_id = 31
+        cache.is_contract(provider, TOKEN)
+        assert provider.get_code.call_count == 2
+
+    def test_persisted_to_file(self, provider, tmp_path):
+        CodeCache(tmp_path / "code.db").is_contract(provider, TOKEN)
+        provider.get_code.reset_mock()
+        assert CodeCache(tmp_path / "code.db").code_hash(provider, TOKEN) == CODE_HASH
+        provider.get_code.assert_not_called()
+
+    def test_clear(self, provider):
+        cache = CodeCache()
+        cache.is_contract(provider, TOKEN)
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
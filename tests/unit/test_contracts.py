@@ -3,7 +3,11 @@ import tempfile
 from unittest.mock import MagicMock
 
 import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
 
+from rootstock.code_cache import CodeCache, default_code_cache
 from rootstock.contracts import Contract
 from rootstock.exceptions import ABIError, ContractNotFoundError, RPCError
 from rootstock.transactions import TransactionBuilder
@@ -38,9 +42,26 @@ SAMPLE_ABI = [
 ]
 
 CONTRACT_ADDR = "0x0000000000000000000000000000000000000042"
+BALANCE_ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    }
+]
+
 TEST_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
 
 
+@pytest.fixture(autouse=True)
+def fresh_code_cache():
+    default_code_cache().clear()
+    yield
+    default_code_cache().clear()
+
+
 @pytest.fixture
 def mock_provider():
     provider = MagicMock()
@@ -49,6 +70,8 @@ def mock_provider():
     provider.get_code.return_value = b"\x60\x80"
 
     mock_contract = MagicMock()
+    # The class built for the ABI, bound to an address, is the same mock.
+    mock_contract.return_value = mock_contract
     provider.w3.eth.contract.return_value = mock_contract
     return provider
 
@@ -137,6 +160,17 @@ class TestContractNotFound:
         contract = Contract(mock_provider, CONTRACT_ADDR, SAMPLE_ABI)
         assert contract.address.lower() == CONTRACT_ADDR.lower()
 
+    def test_code_check_cached_across_instances(self, mock_provider):
+        Contract(mock_provider, CONTRACT_ADDR, SAMPLE_ABI)
+        Contract(mock_provider, CONTRACT_ADDR, SAMPLE_ABI)
+        mock_provider.get_code.assert_called_once()
+
+    def test_custom_code_cache(self, mock_provider):
+        cache = CodeCache()
+        Contract(mock_provider, CONTRACT_ADDR, SAMPLE_ABI, code_cache=cache)
+        assert cache.is_contract(mock_provider, CONTRACT_ADDR)
+        assert len(default_code_cache()) == 0
+
     def test_verify_false_skips_code_check(self, mock_provider):
         mock_provider.get_code.return_value = b""
         contract = Contract(mock_provider, CONTRACT_ADDR, SAMPLE_ABI, verify=False)
@@ -190,14 +224,23 @@ class TestContractTransact:
 
 class TestContractEncodeFunctionData:
     def test_encode_returns_hex_string(self, mock_provider):
-        mock_contract = mock_provider.w3.eth.contract.return_value
-        mock_fn = MagicMock()
-        mock_fn.return_value.build_transaction.return_value = {"data": "0xdeadbeef"}
-        mock_contract.functions.__getitem__ = MagicMock(return_value=mock_fn)
-
         contract = Contract(mock_provider, CONTRACT_ADDR, SAMPLE_ABI)
         data = contract.encode_function_data("setGreeting", "Hello")
-        assert data == "0xdeadbeef"
+        assert data == "0x" + Web3().eth.contract(abi=SAMPLE_ABI).encode_abi(
+            "setGreeting", args=["Hello"]
+        ).removeprefix("0x")
+
+    def test_encode_accepts_keyword_arguments(self, mock_provider):
+        contract = Contract(mock_provider, CONTRACT_ADDR, SAMPLE_ABI)
+        assert contract.encode_function_data(
+            "setGreeting", greeting="Hi"
+        ) == contract.encode_function_data("setGreeting", "Hi")
+
+    def test_encode_does_not_build_a_transaction(self, mock_provider):
+        mock_contract = mock_provider.w3.eth.contract.return_value
+        contract = Contract(mock_provider, CONTRACT_ADDR, SAMPLE_ABI)
+        contract.encode_function_data("setGreeting", "Hello")
+        mock_contract.functions.__getitem__.assert_not_called()
 
     def test_encode_unknown_function_raises(self, mock_provider):
         mock_contract = mock_provider.w3.eth.contract.return_value
@@ -207,6 +250,32 @@ class TestContractEncodeFunctionData:
         with pytest.raises(ABIError, match="not found"):
             contract.encode_function_data("nonexistent")
 
+    def test_encode_bad_checksum_raises(self, mock_provider):
+        contract = Contract(mock_provider, CONTRACT_ADDR, BALANCE_ABI)
+        with pytest.raises(ABIError, match="checksum"):
+            contract.encode_function_data(
+                "balanceOf", "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAeD"
+            )
+
+
+class TestContractBulkCodec:
+    def test_encode_many(self, mock_provider):
+        contract = Contract(mock_provider, CONTRACT_ADDR, BALANCE_ABI)
+        owners = [CONTRACT_ADDR, "0x" + "11" * 20]
+        assert contract.encode_many("balanceOf", [owners]) == [
+            bytes.fromhex(contract.encode_function_data("balanceOf", o)[2:]) for o in owners
+        ]
+
+    def test_encode_many_wrong_arity_raises(self, mock_provider):
+        contract = Contract(mock_provider, CONTRACT_ADDR, BALANCE_ABI)
+        with pytest.raises(ABIError, match="overload"):
+            contract.encode_many("balanceOf", [[CONTRACT_ADDR], [1]])
+
+    def test_decode_many(self, mock_provider):
+        contract = Contract(mock_provider, CONTRACT_ADDR, BALANCE_ABI)
+        results = [(5).to_bytes(32, "big"), "0x" + (6).to_bytes(32, "big").hex()]
+        assert contract.decode_many("balanceOf", results) == [5, 6]
+
 
 class TestContractGetEvents:
     def test_get_events_returns_list(self, mock_provider):
@@ -249,3 +318,72 @@ class TestContractGetEvents:
         contract = Contract(mock_provider, CONTRACT_ADDR, SAMPLE_ABI)
         with pytest.raises(RPCError, match="Failed to fetch events"):
             contract.get_events("GreetingChanged")
+
+
+class TestContractIterEvents:
+    def make_log(self, block, setter, greeting):
+        topic = Web3.keccak(text="GreetingChanged(address,string)")
+        return {
+            "address": Web3.to_checksum_address(CONTRACT_ADDR),
+            "topics": [topic, HexBytes(bytes(12) + bytes.fromhex(setter[2:]))],
+            "data": HexBytes(encode(["string"], [greeting])),
+            "blockNumber": block,
+            "logIndex": 0,
+            "transactionIndex": 0,
+            "transactionHash": HexBytes(bytes(32)),
+            "blockHash": HexBytes(bytes(32)),
+        }
+
+    @pytest.fixture
+    def provider(self, mock_provider):
+        mock_provider.w3 = Web3()
+        mock_provider.get_block_number.return_value = 9
+        setters = ["0x" + "11" * 20, "0x" + "22" * 20]
+        mock_provider.get_logs.side_effect = lambda params: [
+            self.make_log(b, setters[b % 2], f"hi {b}")
+            for b in range(params["fromBlock"], params["toBlock"] + 1)
+        ]
+        return mock_provider
+
+    def test_streams_decoded_events_in_order(self, provider):
+        contract = Contract(provider, CONTRACT_ADDR, SAMPLE_ABI)
+        events = list(contract.iter_events("GreetingChanged", chunk_size=3))
+        assert [e["args"]["greeting"] for e in events] == [f"hi {b}" for b in range(10)]
+
+    def test_indexed_filter_sent_as_topic(self, provider):
+        contract = Contract(provider, CONTRACT_ADDR, SAMPLE_ABI)
+        setter = Web3.to_checksum_address("0x" + "11" * 20)
+        list(contract.iter_events("GreetingChanged", 0, 1, filters={"setter": setter}))
+        topics = provider.get_logs.call_args.args[0]["topics"]
+        assert topics[1] == "0x" + "00" * 12 + "11" * 20
+
+    def test_non_indexed_filter_applied_locally(self, provider):
+        contract = Contract(provider, CONTRACT_ADDR, SAMPLE_ABI)
+        events = list(contract.iter_events("GreetingChanged", filters={"greeting": "hi 4"}))
+        assert [e["blockNumber"] for e in events] == [4]
+
+    def test_unknown_event_raises(self, provider):
+        contract = Contract(provider, CONTRACT_ADDR, SAMPLE_ABI)
+        with pytest.raises(ABIError):
+            next(contract.iter_events("Nope"))
+
+    def test_iter_event_columns(self, provider):
+        contract = Contract(provider, CONTRACT_ADDR, SAMPLE_ABI)
+        batches = list(contract.iter_event_columns("GreetingChanged", batch_size=4))
+        assert [len(b["greeting"]) for b in batches] == [4, 4, 2]
+        assert batches[0]["setter"][1] == Web3.to_checksum_address("0x" + "22" * 20)
+
+    def test_iter_event_columns_rejects_non_indexed_filters(self, provider):
+        contract = Contract(provider, CONTRACT_ADDR, SAMPLE_ABI)
+        with pytest.raises(ABIError, match="non-indexed"):
+            next(contract.iter_event_columns("GreetingChanged", filters={"greeting": "x"}))
+
+    def test_follow_events_marks_additions(self, provider):
+        provider.get_block.return_value = {"hash": bytes(32)}
+        provider.new_filter.side_effect = RPCError("unsupported")
+        contract = Contract(provider, CONTRACT_ADDR, SAMPLE_ABI)
+        stream = contract.follow_events("GreetingChanged", from_block=8)
+        first = next(stream)
+        stream.close()
+        assert first["args"]["greeting"] == "hi 8"
+        assert first["removed"] is False
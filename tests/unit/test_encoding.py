@@ -0,0 +1,18 @@
+from rootstock._utils.encoding import as_bytes, to_hex
+
+
+class TestAsBytes:
+    def test_bytes_unchanged(self):
+        assert as_bytes(b"\x01\x02") == b"\x01\x02"
+
+    def test_hex_with_and_without_prefix(self):
+        assert as_bytes("0xabcd") == as_bytes("abcd") == b"\xab\xcd"
+
+
+class TestToHex:
+    def test_bytes(self):
+        assert to_hex(b"\xab\xcd") == "0xabcd"
+
+    def test_string_lowercased_and_prefixed(self):
+        assert to_hex("0xABCD") == "0xabcd"
+        assert to_hex("ABCD") == "0xabcd"
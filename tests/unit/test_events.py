@@ -0,0 +1,189 @@
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from rootstock.events import (
+    APPROVAL_TOPIC,
+    TRANSFER_TOPIC,
+    EventDecoder,
+    decode_erc20_log,
+    decode_erc20_logs,
+)
+
+TOKEN = "0x2acc95758f8b5f583470ba265eb685a8f45fc9d5"
+ALICE = "0x" + "ab" * 20
+BOB = "0x" + "cd" * 20
+
+
+def make_log(topic0=TRANSFER_TOPIC, value=5, as_hex=False, topics=None):
+    log = {
+        "address": Web3.to_checksum_address(TOKEN),
+        "topics": topics
+        or [
+            HexBytes(topic0),
+            HexBytes(bytes(12) + bytes.fromhex(ALICE[2:])),
+            HexBytes(bytes(12) + bytes.fromhex(BOB[2:])),
+        ],
+        "data": HexBytes(value.to_bytes(32, "big")),
+        "blockNumber": 7,
+        "logIndex": 2,
+        "transactionHash": HexBytes(b"\x11" * 32),
+    }
+    if as_hex:
+        log["topics"] = ["0x" + bytes(t).hex() for t in log["topics"]]
+        log["data"] = "0x" + bytes(log["data"]).hex()
+        log["transactionHash"] = "0x" + "11" * 32
+    return log
+
+
+class TestDecodeErc20Log:
+    def test_transfer(self):
+        item = decode_erc20_log(make_log(value=10**30))
+        assert item.event == "Transfer"
+        assert item.from_address == Web3.to_checksum_address(ALICE)
+        assert item.to_address == Web3.to_checksum_address(BOB)
+        assert item.value == 10**30
+        assert (item.block_number, item.log_index) == (7, 2)
+        assert item.tx_hash == "0x" + "11" * 32
+
+    def test_approval(self):
+        assert decode_erc20_log(make_log(APPROVAL_TOPIC)).event == "Approval"
+
+    def test_hex_string_fields(self):
+        assert decode_erc20_log(make_log(as_hex=True)) == decode_erc20_log(make_log())
+
+    def test_lowercase_without_checksum(self):
+        item = decode_erc20_log(make_log(), checksum=False)
+        assert item.from_address == ALICE
+        assert item.token == TOKEN
+
+    def test_other_event_ignored(self):
+        assert decode_erc20_log(make_log("0x" + "00" * 32)) is None
+
+    def test_erc721_style_transfer_ignored(self):
+        log = make_log()
+        log["topics"] = [*log["topics"], HexBytes(bytes(32))]
+        assert decode_erc20_log(log) is None
+
+
+class TestDecodeErc20Logs:
+    def test_bulk_matches_scalar(self):
+        logs = [make_log(value=i) for i in range(5)] + [make_log("0x" + "00" * 32)]
+        bulk = decode_erc20_logs(logs)
+        assert bulk == [decode_erc20_log(log) for log in logs[:5]]
+
+
+ORDER_ABI = {
+    "type": "event",
+    "name": "Order",
+    "anonymous": False,
+    "inputs": [
+        {"name": "maker", "type": "address", "indexed": True},
+        {"name": "tag", "type": "string", "indexed": True},
+        {"name": "amount", "type": "uint256", "indexed": False},
+        {"name": "note", "type": "string", "indexed": False},
+        {"name": "taker", "type": "address", "indexed": False},
+    ],
+}
+STATIC_ABI = {
+    "type": "event",
+    "name": "Tick",
+    "anonymous": False,
+    "inputs": [
+        {"name": "who", "type": "address", "indexed": True},
+        {"name": "delta", "type": "int64", "indexed": False},
+        {"name": "flag", "type": "bool", "indexed": False},
+    ],
+}
+
+
+def order_log(block, amount, note="hello"):
+    topic = Web3.keccak(text="Order(address,string,uint256,string,address)")
+    return {
+        "address": Web3.to_checksum_address(TOKEN),
+        "topics": [
+            topic,
+            HexBytes(bytes(12) + bytes.fromhex(ALICE[2:])),
+            Web3.keccak(text="vip"),
+        ],
+        "data": HexBytes(encode(["uint256", "string", "address"], [amount, note, BOB])),
+        "blockNumber": block,
+        "logIndex": 0,
+        "transactionIndex": 0,
+        "transactionHash": HexBytes(bytes([block]) * 32),
+        "blockHash": HexBytes(bytes(32)),
+    }
+
+
+class TestEventDecoder:
+    def test_columns_match_web3_decoding(self):
+        logs = [order_log(1, 2**200), order_log(2, 7, "bye")]
+        columns = EventDecoder(ORDER_ABI).decode(logs)
+        event = Web3().eth.contract(abi=[ORDER_ABI]).events.Order()
+        for i, log in enumerate(logs):
+            expected = event.process_log(log)
+            assert columns["block_number"][i] == expected["blockNumber"]
+            assert columns["tx_hash"][i] == "0x" + expected["transactionHash"].hex()
+            assert columns["address"][i] == expected["address"]
+            for name in ("maker", "amount", "note", "taker"):
+                assert columns[name][i] == expected["args"][name]
+            assert columns["tag"][i] == "0x" + expected["args"]["tag"].hex()
+
+    def test_column_order(self):
+        assert EventDecoder(ORDER_ABI).columns == [
+            "block_number",
+            "log_index",
+            "tx_hash",
+            "address",
+            "maker",
+            "tag",
+            "amount",
+            "note",
+            "taker",
+        ]
+
+    def test_static_fast_path(self):
+        topic = Web3.keccak(text="Tick(address,int64,bool)")
+        log = {
+            **make_log(),
+            "topics": [topic, HexBytes(bytes(12) + bytes.fromhex(ALICE[2:]))],
+            "data": HexBytes(encode(["int64", "bool"], [-3, True])),
+        }
+        columns = EventDecoder(STATIC_ABI, checksum=False).decode([log])
+        assert columns["who"] == [ALICE]
+        assert columns["delta"] == [-3]
+        assert columns["flag"] == [True]
+        assert columns["address"] == [TOKEN]
+
+    def test_other_events_skipped(self):
+        columns = EventDecoder(ORDER_ABI).decode([make_log(), order_log(3, 1)])
+        assert columns["block_number"] == [3]
+
+    def test_iter_batches(self):
+        logs = [order_log(b, b) for b in range(1, 6)]
+        batches = list(EventDecoder(ORDER_ABI).iter_batches(logs, batch_size=2))
+        assert [b["amount"] for b in batches] == [[1, 2], [3, 4], [5]]
+
+    def test_parquet_round_trip(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        decoder = EventDecoder(ORDER_ABI)
+        batches = decoder.iter_batches([order_log(b, 2**200 + b) for b in range(1, 4)], 2)
+        assert decoder.write(batches, tmp_path / "orders.parquet") == 3
+        table = pq.read_table(tmp_path / "orders.parquet")
+        assert table.column("amount").to_pylist()[0] == str(2**200 + 1)
+        assert table.column("block_number").to_pylist() == [1, 2, 3]
+
+    def test_arrow_ipc(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        decoder = EventDecoder(ORDER_ABI)
+        decoder.write([decoder.decode([order_log(1, 5)])], tmp_path / "o.arrow", format="arrow")
+        with pa.ipc.open_file(tmp_path / "o.arrow") as reader:
+            assert reader.read_all().num_rows == 1
+
+    def test_unknown_format(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError, match="Unknown format"):
+            EventDecoder(ORDER_ABI).write([], tmp_path / "x", format="csv")
@@ -0,0 +1,140 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from rootstock.events import TRANSFER_TOPIC
+from rootstock.exceptions import RPCError
+from rootstock.indexer import TransferIndexer
+
+TOKEN = "0x2acc95758f8b5f583470ba265eb685a8f45fc9d5"
+ZERO = "0x" + "00" * 20
+ALICE = "0x" + "aa" * 20
+BOB = "0x" + "bb" * 20
+
+
+def topic(address):
+    return bytes(12) + bytes.fromhex(address[2:])
+
+
+def transfer(block, index, sender, receiver, value):
+    return {
+        "address": TOKEN,
+        "blockNumber": block,
+        "logIndex": index,
+        "transactionHash": bytes([block]) * 32,
+        "topics": [bytes.fromhex(TRANSFER_TOPIC[2:]), topic(sender), topic(receiver)],
+        "data": value.to_bytes(32, "big"),
+    }
+
+
+class FakeChain:
+    def __init__(self):
+        self.head = 0
+        self.logs = []
+        self.reorg_after: int | None = None
+
+    def block(self, number):
+        forked = self.reorg_after is not None and number > self.reorg_after
+        return {"hash": bytes([forked]) + number.to_bytes(31, "big")}
+
+    def get_logs(self, params):
+        return [
+            log
+            for log in self.logs
+            if params["fromBlock"] <= log["blockNumber"] <= params["toBlock"]
+        ]
+
+
+@pytest.fixture
+def chain():
+    return FakeChain()
+
+
+@pytest.fixture
+def provider(chain):
+    provider = MagicMock()
+    provider.get_block_number.side_effect = lambda: chain.head
+    provider.get_block.side_effect = chain.block
+    provider.get_logs.side_effect = chain.get_logs
+    return provider
+
+
+@pytest.fixture
+def indexer(provider, tmp_path):
+    return TransferIndexer(provider, TOKEN, tmp_path / "index.db", start_block=1, chunk_size=3)
+
+
+class TestTransferIndexer:
+    def test_builds_balances(self, chain, indexer):
+        chain.logs = [transfer(1, 0, ZERO, ALICE, 100), transfer(4, 0, ALICE, BOB, 30)]
+        chain.head = 5
+        assert indexer.sync() == 2
+        assert indexer.balance_of(ALICE) == 70
+        assert indexer.balance_of(BOB) == 30
+        assert indexer.holder_count() == 2
+        assert indexer.last_block == 5
+
+    def test_rejected_range_is_split(self, chain, indexer, provider):
+        chain.logs = [transfer(1, 0, ZERO, ALICE, 100), transfer(3, 0, ALICE, BOB, 30)]
+        chain.head = 3
+
+        def limited(params):
+            if params["toBlock"] - params["fromBlock"] > 1:
+                raise RPCError("query returned more than 10000 results")
+            return chain.get_logs(params)
+
+        provider.get_logs.side_effect = limited
+        assert indexer.sync() == 2
+        assert indexer.balance_of(BOB) == 30
+
+    def test_incremental_sync(self, chain, indexer, provider):
+        chain.logs = [transfer(1, 0, ZERO, ALICE, 100)]
+        chain.head = 2
+        indexer.sync()
+        chain.logs.append(transfer(3, 0, ALICE, BOB, 100))
+        chain.head = 3
+        provider.get_logs.reset_mock()
+        assert indexer.sync() == 1
+        assert provider.get_logs.call_args.args[0]["fromBlock"] == 3
+        # Empty balances are dropped.
+        assert indexer.holder_count() == 1
+
+    def test_top_holders_ordered_numerically(self, chain, indexer):
+        chain.logs = [transfer(1, 0, ZERO, ALICE, 9), transfer(1, 1, ZERO, BOB, 10**30)]
+        chain.head = 1
+        indexer.sync()
+        holders = indexer.top_holders()
+        assert [b for _, b in holders] == [10**30, 9]
+        assert holders[0][0].lower() == BOB
+
+    def test_balance_at_block(self, chain, indexer):
+        chain.logs = [transfer(1, 0, ZERO, ALICE, 100), transfer(4, 0, ALICE, BOB, 30)]
+        chain.head = 5
+        indexer.sync()
+        assert indexer.balance_at(ALICE, 3) == 100
+        assert indexer.balance_at(ALICE, 4) == 70
+        assert indexer.balance_at(BOB, 3) == 0
+
+    def test_reorg_rolls_back(self, chain, indexer):
+        chain.logs = [transfer(1, 0, ZERO, ALICE, 100), transfer(5, 0, ALICE, BOB, 30)]
+        chain.head = 6
+        indexer.sync()
+        assert indexer.balance_of(BOB) == 30
+
+        # Blocks after 3 are replaced; the transfer to BOB disappears.
+        chain.reorg_after = 3
+        chain.logs = [transfer(1, 0, ZERO, ALICE, 100)]
+        indexer.sync()
+        assert indexer.balance_of(BOB) == 0
+        assert indexer.balance_of(ALICE) == 100
+
+    def test_confirmations(self, chain, provider, tmp_path):
+        chain.head = 10
+        indexer = TransferIndexer(provider, TOKEN, tmp_path / "i.db", confirmations=4)
+        indexer.sync()
+        assert indexer.last_block == 6
+
+    def test_file_bound_to_token(self, provider, tmp_path):
+        TransferIndexer(provider, TOKEN, tmp_path / "i.db")
+        with pytest.raises(ValueError, match="indexes token"):
+            TransferIndexer(provider, ALICE, tmp_path / "i.db")
@@ -0,0 +1,145 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from rootstock.constants import ChainId
+from rootstock.exceptions import InsufficientFundsError, RPCError
+from rootstock.ledger import BalanceLedger
+from rootstock.transactions import TransactionBuilder
+from rootstock.wallet import Wallet
+
+TEST_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+TEST_TO = "0x0000000000000000000000000000000000000001"
+GAS_COST = 21_000 * 60_000_000
+
+
+@pytest.fixture
+def mock_provider():
+    provider = MagicMock()
+    provider.chain_id = ChainId.TESTNET
+    provider.get_block_number.return_value = 100
+    provider.get_balance.return_value = 10**18
+    provider.get_transaction_count.return_value = 5
+    provider.get_gas_price.return_value = 60_000_000
+    provider.send_raw_transaction.return_value = "0x" + "ab" * 32
+    provider.wait_for_transaction.return_value = {"status": 1, "gasUsed": 21_000}
+    return provider
+
+
+@pytest.fixture
+def wallet():
+    return Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+
+
+@pytest.fixture
+def ledger(mock_provider, wallet):
+    return BalanceLedger(mock_provider, wallet.address, max_age=3600)
+
+
+class TestBalanceLedger:
+    def test_reserve_debits_locally(self, ledger, mock_provider):
+        ledger.reserve(5, 4 * 10**17)
+        ledger.reserve(6, 4 * 10**17)
+        assert ledger.available == 2 * 10**17
+        mock_provider.get_balance.assert_called_once()
+
+    def test_snapshot_read_at_one_block(self, ledger, mock_provider, wallet):
+        ledger.reserve(5, 1)
+        mock_provider.get_balance.assert_called_with(wallet.address, 100)
+        mock_provider.get_transaction_count.assert_called_with(wallet.address, 100)
+
+    def test_overdraw_raises(self, ledger):
+        ledger.reserve(5, 6 * 10**17)
+        with pytest.raises(InsufficientFundsError):
+            ledger.reserve(6, 6 * 10**17)
+        assert ledger.pending == {5: 6 * 10**17}
+
+    def test_rechecks_chain_before_refusing(self, ledger, mock_provider):
+        ledger.reserve(5, 6 * 10**17)
+        mock_provider.get_block_number.return_value = 101
+        mock_provider.get_balance.return_value = 2 * 10**18
+        ledger.reserve(6, 6 * 10**17)
+        assert ledger.available == 8 * 10**17
+
+    def test_reconcile_drops_mined_reservations(self, ledger, mock_provider):
+        ledger.reserve(5, 10**17)
+        ledger.reserve(6, 10**17)
+        mock_provider.get_block_number.return_value = 101
+        mock_provider.get_balance.return_value = 9 * 10**17
+        mock_provider.get_transaction_count.return_value = 6
+        ledger.reconcile()
+        assert ledger.pending == {6: 10**17}
+        assert ledger.available == 8 * 10**17
+
+    def test_reconcile_same_head_skips_reads(self, ledger, mock_provider):
+        ledger.reserve(5, 1)
+        ledger.reconcile()
+        mock_provider.get_balance.assert_called_once()
+
+    def test_settle_shrinks_reservation(self, ledger):
+        ledger.reserve(5, 10**17)
+        ledger.settle(5, 10**16)
+        assert ledger.pending == {5: 10**16}
+
+    def test_replacement_reuses_nonce(self, ledger):
+        ledger.reserve(5, 6 * 10**17)
+        ledger.reserve(5, 7 * 10**17)
+        assert ledger.available == 3 * 10**17
+
+    def test_release(self, ledger):
+        ledger.reserve(5, 10**17)
+        ledger.release(5)
+        assert ledger.pending == {}
+
+    def test_stale_snapshot_reconciles(self, mock_provider, wallet):
+        ledger = BalanceLedger(mock_provider, wallet.address, max_age=0)
+        ledger.reserve(5, 1)
+        ledger.reserve(6, 1)
+        assert mock_provider.get_block_number.call_count == 2
+
+
+class TestBuilderWithLedger:
+    def test_no_get_balance_per_send(self, mock_provider, wallet, ledger):
+        builder = TransactionBuilder(mock_provider, wallet, balance_ledger=ledger)
+        for _ in range(3):
+            builder.transfer(to=TEST_TO, value_wei=10**17, wait=False)
+        mock_provider.get_balance.assert_called_once()
+        assert ledger.available == 10**18 - 3 * (10**17 + GAS_COST)
+
+    def test_refuses_overdraw(self, mock_provider, wallet, ledger):
+        builder = TransactionBuilder(mock_provider, wallet, balance_ledger=ledger)
+        builder.transfer(to=TEST_TO, value_wei=9 * 10**17, wait=False)
+        with pytest.raises(InsufficientFundsError):
+            builder.transfer(to=TEST_TO, value_wei=9 * 10**17, wait=False)
+        mock_provider.send_raw_transaction.assert_called_once()
+
+    def test_receipt_settles_actual_cost(self, mock_provider, wallet, ledger):
+        mock_provider.wait_for_transaction.return_value = {"status": 1, "gasUsed": 20_000}
+        builder = TransactionBuilder(mock_provider, wallet, balance_ledger=ledger)
+        builder.transfer(to=TEST_TO, value_wei=10**17, wait=True)
+        assert ledger.pending == {5: 10**17 + 20_000 * 60_000_000}
+
+    def test_failed_broadcast_releases(self, mock_provider, wallet, ledger):
+        mock_provider.send_raw_transaction.side_effect = RPCError("rejected")
+        builder = TransactionBuilder(mock_provider, wallet, balance_ledger=ledger)
+        with pytest.raises(RPCError):
+            builder.transfer(to=TEST_TO, value_wei=10**17, wait=False)
+        assert ledger.pending == {}
+
+    def test_send_many_reserves_each(self, mock_provider, wallet, ledger):
+        builder = TransactionBuilder(mock_provider, wallet, balance_ledger=ledger)
+        builder.send_many([{"to": TEST_TO, "value": 10**17}] * 3, check_balance=True)
+        assert sorted(ledger.pending) == [5, 6, 7]
+
+    def test_send_many_overdraw_rolls_back(self, mock_provider, wallet, ledger):
+        builder = TransactionBuilder(mock_provider, wallet, balance_ledger=ledger)
+        with pytest.raises(InsufficientFundsError):
+            builder.send_many([{"to": TEST_TO, "value": 4 * 10**17}] * 3, check_balance=True)
+        assert ledger.pending == {}
+        assert builder._auto_nonce() == 5
+        mock_provider.send_raw_transaction.assert_not_called()
+
+    def test_mismatched_address_raises(self, mock_provider, wallet):
+        other = BalanceLedger(mock_provider, TEST_TO)
+        with pytest.raises(ValueError, match="different address"):
+            TransactionBuilder(mock_provider, wallet, balance_ledger=other)
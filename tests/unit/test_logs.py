@@ -0,0 +1,347 @@
+from unittest.mock import MagicMock
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+
+from rootstock.events import APPROVAL_TOPIC, TRANSFER_TOPIC
+from rootstock.exceptions import ABIError, RPCError
+from rootstock.logs import LogFollower, LogQuery, iter_logs
+from rootstock.tokens import ERC20Token
+
+
+def chain(logs_per_block=1, max_span=None):
+    """A provider whose get_logs returns one log per block and fails on spans over max_span."""
+    provider = MagicMock()
+    provider.get_block_number.return_value = 99
+    calls = []
+
+    def get_logs(params):
+        start, end = params["fromBlock"], params["toBlock"]
+        calls.append((start, end))
+        if max_span is not None and end - start + 1 > max_span:
+            raise RPCError("query returned more than 10000 results")
+        return [
+            {"blockNumber": b, "logIndex": i}
+            for b in range(start, end + 1)
+            for i in range(logs_per_block)
+        ]
+
+    provider.get_logs.side_effect = get_logs
+    return provider, calls
+
+
+class TestIterLogs:
+    def test_yields_every_block_in_order(self):
+        provider, _ = chain()
+        logs = list(iter_logs(provider, {"address": "0x1"}, 0, chunk_size=7, concurrency=3))
+        assert [log["blockNumber"] for log in logs] == list(range(100))
+
+    def test_latest_resolved_once(self):
+        provider, _ = chain()
+        list(iter_logs(provider, {}, 0, chunk_size=10))
+        provider.get_block_number.assert_called_once()
+
+    def test_explicit_range(self):
+        provider, calls = chain()
+        logs = list(iter_logs(provider, {}, 10, 19, chunk_size=100))
+        assert [log["blockNumber"] for log in logs] == list(range(10, 20))
+        assert calls == [(10, 19)]
+
+    def test_filter_block_keys_replaced(self):
+        provider, _ = chain()
+        list(iter_logs(provider, {"fromBlock": 500, "toBlock": 600}, 0, 4))
+        assert provider.get_logs.call_args.args[0]["fromBlock"] == 0
+
+    def test_rejected_chunks_are_split(self):
+        provider, calls = chain(max_span=5)
+        logs = list(iter_logs(provider, {}, 0, 39, chunk_size=20, concurrency=1))
+        assert [log["blockNumber"] for log in logs] == list(range(40))
+        # The split of 0..19 halves the size of the next chunk.
+        assert (20, 29) in calls
+
+    def test_chunk_grows_on_sparse_results(self):
+        provider, calls = chain(logs_per_block=0)
+        list(iter_logs(provider, {}, 0, 99, chunk_size=5, concurrency=1))
+        spans = [end - start + 1 for start, end in calls]
+        assert spans[:3] == [5, 10, 20]
+
+    def test_chunk_shrinks_on_dense_results(self):
+        provider, calls = chain(logs_per_block=10)
+        list(iter_logs(provider, {}, 0, 99, chunk_size=40, target_logs=100, concurrency=1))
+        spans = [end - start + 1 for start, end in calls]
+        assert spans[:2] == [40, 20]
+
+    def test_single_block_failure_raises(self):
+        provider = MagicMock()
+        provider.get_logs.side_effect = RPCError("boom")
+        with pytest.raises(RPCError):
+            list(iter_logs(provider, {}, 0, 3, concurrency=1))
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            list(iter_logs(MagicMock(), {}, 0, 1, chunk_size=0))
+
+
+class FakeChain:
+    def __init__(self):
+        self.head = 0
+        self.blocks_with_logs = set()
+        self.fork_after: int | None = None
+
+    def hash_of(self, number):
+        forked = self.fork_after is not None and number > self.fork_after
+        return bytes([forked]) + number.to_bytes(31, "big")
+
+    def log(self, number, index=0):
+        return {
+            "address": "0x" + "42" * 20,
+            "blockNumber": number,
+            "blockHash": self.hash_of(number),
+            "logIndex": index,
+            "transactionHash": bytes([number]) * 32,
+            "topics": [b"\x01" * 32],
+            "data": b"",
+        }
+
+    def get_logs(self, params):
+        return [
+            self.log(b)
+            for b in sorted(self.blocks_with_logs)
+            if params["fromBlock"] <= b <= params["toBlock"]
+        ]
+
+
+@pytest.fixture
+def fake_chain():
+    return FakeChain()
+
+
+@pytest.fixture
+def follower_provider(fake_chain):
+    provider = MagicMock()
+    provider.get_block_number.side_effect = lambda: fake_chain.head
+    provider.get_block.side_effect = lambda n: {"hash": fake_chain.hash_of(n)}
+    provider.get_logs.side_effect = fake_chain.get_logs
+    return provider
+
+
+def summary(batch):
+    return [(log["blockNumber"], log["removed"]) for log in batch]
+
+
+class TestLogFollower:
+    def test_delivers_new_logs_once(self, fake_chain, follower_provider):
+        follower = LogFollower(follower_provider, {}, from_block=1, use_filter=False)
+        fake_chain.blocks_with_logs = {2, 4}
+        fake_chain.head = 5
+        assert summary(follower.poll()) == [(2, False), (4, False)]
+        assert follower.poll() == []
+        fake_chain.blocks_with_logs.add(6)
+        fake_chain.head = 6
+        assert summary(follower.poll()) == [(6, False)]
+
+    def test_defaults_to_next_block(self, fake_chain, follower_provider):
+        fake_chain.head = 10
+        follower = LogFollower(follower_provider, {}, use_filter=False)
+        assert follower.next_block == 11
+
+    def test_confirmations_hold_back_recent_blocks(self, fake_chain, follower_provider):
+        follower = LogFollower(follower_provider, {}, from_block=1, confirmations=2)
+        fake_chain.blocks_with_logs = {3, 5}
+        fake_chain.head = 5
+        assert summary(follower.poll()) == [(3, False)]
+
+    def test_catch_up_is_chunked(self, fake_chain, follower_provider):
+        follower = LogFollower(follower_provider, {}, from_block=1, chunk_size=4, use_filter=False)
+        fake_chain.blocks_with_logs = {2, 7}
+        fake_chain.head = 8
+        assert summary(follower.poll()) == [(2, False)]
+        assert summary(follower.poll()) == [(7, False)]
+
+    def test_reorg_emits_removals_then_new_logs(self, fake_chain, follower_provider):
+        follower = LogFollower(follower_provider, {}, from_block=1, use_filter=False)
+        fake_chain.blocks_with_logs = {2, 4, 5}
+        fake_chain.head = 5
+        follower.poll()
+        fake_chain.fork_after = 3
+        fake_chain.blocks_with_logs = {2, 4, 6}
+        fake_chain.head = 6
+        batch = follower.poll()
+        assert summary(batch) == [(5, True), (4, True), (4, False), (6, False)]
+        assert batch[1]["blockHash"] == FakeChain().hash_of(4)
+
+    def test_checkpoint_resumes_and_remembers_logs(self, fake_chain, follower_provider, tmp_path):
+        path = tmp_path / "follow.json"
+        first = LogFollower(
+            follower_provider, {}, from_block=1, checkpoint_path=path, use_filter=False
+        )
+        fake_chain.blocks_with_logs = {2, 4}
+        fake_chain.head = 4
+        first.poll()
+
+        fake_chain.fork_after = 3
+        fake_chain.head = 5
+        second = LogFollower(
+            follower_provider, {}, from_block=1, checkpoint_path=path, use_filter=False
+        )
+        assert second.next_block == 5
+        batch = second.poll()
+        assert summary(batch) == [(4, True), (4, False)]
+        assert isinstance(batch[0]["topics"][0], bytes)
+
+    def test_follow_redelivers_unfinished_batch(self, fake_chain, follower_provider, tmp_path):
+        path = tmp_path / "follow.json"
+        follower = LogFollower(
+            follower_provider, {}, from_block=1, checkpoint_path=path, use_filter=False
+        )
+        fake_chain.blocks_with_logs = {2, 3}
+        fake_chain.head = 3
+        stream = follower.follow()
+        assert next(stream)["blockNumber"] == 2
+        stream.close()
+        assert follower.next_block == 1
+        assert not path.exists()
+        assert summary(follower.poll()) == [(2, False), (3, False)]
+
+    def test_uses_log_filter_once_caught_up(self, fake_chain, follower_provider):
+        follower_provider.new_filter.return_value = "0xf"
+        follower_provider.get_filter_changes.return_value = [fake_chain.log(7)]
+        follower = LogFollower(follower_provider, {"address": "0x1"}, from_block=1)
+        fake_chain.head = 5
+        follower.poll()
+        follower_provider.new_filter.assert_called_once_with({"address": "0x1", "fromBlock": 6})
+        fake_chain.head = 7
+        assert summary(follower.poll()) == [(7, False)]
+        assert follower.next_block == 8
+
+    def test_filter_removed_logs_become_removals(self, fake_chain, follower_provider):
+        follower_provider.new_filter.return_value = "0xf"
+        follower = LogFollower(follower_provider, {}, from_block=1)
+        fake_chain.head = 5
+        follower.poll()
+        follower_provider.get_filter_changes.return_value = [fake_chain.log(6)]
+        follower.poll()
+        follower_provider.get_filter_changes.return_value = [
+            {**fake_chain.log(6), "removed": True}
+        ]
+        assert summary(follower.poll()) == [(6, True)]
+
+    def test_filter_failure_falls_back_to_polling(self, fake_chain, follower_provider):
+        follower_provider.new_filter.return_value = "0xf"
+        follower_provider.get_filter_changes.side_effect = RPCError("filter not found")
+        follower = LogFollower(follower_provider, {}, from_block=1)
+        fake_chain.head = 5
+        follower.poll()
+        fake_chain.blocks_with_logs = {6}
+        fake_chain.head = 6
+        assert summary(follower.poll()) == [(6, False)]
+        follower.poll()
+        follower_provider.get_filter_changes.assert_called_once()
+
+
+RIF = "0x2acc95758f8b5f583470ba265eb685a8f45fc9d5"
+DOC = "0xe700691da7b9851f2f35f8b8182c69c53ccad9db"
+
+
+def erc20_log(token, topic0, block, index=0, value=1):
+    return {
+        "address": Web3.to_checksum_address(token),
+        "topics": [
+            HexBytes(topic0),
+            HexBytes(bytes(12) + b"\xaa" * 20),
+            HexBytes(bytes(12) + b"\xbb" * 20),
+        ],
+        "data": HexBytes(value.to_bytes(32, "big")),
+        "blockNumber": block,
+        "logIndex": index,
+        "transactionIndex": 0,
+        "transactionHash": HexBytes(bytes([block]) * 32),
+        "blockHash": HexBytes(bytes(32)),
+    }
+
+
+@pytest.fixture
+def query_provider():
+    provider = MagicMock()
+    provider.w3 = Web3()
+    provider.chain_id = 30
+    provider.get_block_number.return_value = 10
+    logs = [
+        erc20_log(RIF, TRANSFER_TOPIC, 1),
+        erc20_log(DOC, TRANSFER_TOPIC, 2),
+        erc20_log(DOC, APPROVAL_TOPIC, 3),
+        erc20_log(RIF, APPROVAL_TOPIC, 4),
+        erc20_log(RIF, TRANSFER_TOPIC, 4, index=1),
+    ]
+
+    def get_logs(params):
+        wanted = {a.lower() for a in params["address"]}
+        topic0s = {t.lower() for t in params["topics"][0]}
+        return [
+            log
+            for log in logs
+            if params["fromBlock"] <= log["blockNumber"] <= params["toBlock"]
+            and log["address"].lower() in wanted
+            and "0x" + log["topics"][0].hex() in topic0s
+        ]
+
+    provider.get_logs.side_effect = get_logs
+    return provider
+
+
+class TestLogQuery:
+    def test_one_filter_for_many_contracts(self, query_provider):
+        query = LogQuery(query_provider).add(ERC20Token(query_provider, RIF), "Transfer")
+        query.add(ERC20Token(query_provider, DOC), "Transfer", "Approval")
+        events = query.get_events(0, 10)
+        assert [(e["event"], e["blockNumber"]) for e in events] == [
+            ("Transfer", 1),
+            ("Transfer", 2),
+            ("Approval", 3),
+            ("Transfer", 4),
+        ]
+        query_provider.get_logs.assert_called_once()
+        params = query_provider.get_logs.call_args.args[0]
+        assert len(params["address"]) == 2
+        assert params["topics"] == [sorted([TRANSFER_TOPIC, APPROVAL_TOPIC])]
+
+    def test_address_groups_are_merged_in_order(self, query_provider):
+        query = LogQuery(query_provider, max_addresses=1)
+        query.add(ERC20Token(query_provider, RIF), "Transfer")
+        query.add(ERC20Token(query_provider, DOC), "Transfer")
+        events = query.get_events(0, 10)
+        assert [e["blockNumber"] for e in events] == [1, 2, 4]
+        assert query_provider.get_logs.call_count == 2
+
+    def test_add_event_by_abi(self, query_provider):
+        transfer_abi = next(
+            e
+            for e in ERC20Token(query_provider, RIF).web3_contract.abi
+            if e.get("name") == "Transfer"
+        )
+        query = LogQuery(query_provider).add_event(DOC, transfer_abi)
+        assert [e["address"].lower() for e in query.get_events(0, 10)] == [DOC]
+
+    def test_add_event_shares_contract_class(self, query_provider):
+        transfer_abi = next(
+            e
+            for e in ERC20Token(query_provider, RIF).web3_contract.abi
+            if e.get("name") == "Transfer"
+        )
+        query_provider.w3 = MagicMock(wraps=Web3())
+        LogQuery(query_provider).add_event(DOC, transfer_abi)
+        LogQuery(query_provider).add_event(RIF, transfer_abi)
+        query_provider.w3.eth.contract.assert_called_once()
+
+    def test_all_events_by_default(self, query_provider):
+        query = LogQuery(query_provider).add(ERC20Token(query_provider, RIF))
+        assert len(query) == 2
+
+    def test_unknown_event_raises(self, query_provider):
+        with pytest.raises(ABIError):
+            LogQuery(query_provider).add(ERC20Token(query_provider, RIF), "Nope")
+
+    def test_empty_query(self, query_provider):
+        assert LogQuery(query_provider).get_events() == []
+        query_provider.get_logs.assert_not_called()
@@ -0,0 +1,106 @@
+from unittest.mock import MagicMock
+
+import pytest
+from eth_abi import decode, encode
+from web3 import Web3
+
+from rootstock.constants import ChainId
+from rootstock.exceptions import ContractError, RPCError
+from rootstock.multicall import Multicall
+from rootstock.tokens import ERC20Token
+
+RIF = "0x2acc95758f8b5f583470ba265eb685a8f45fc9d5"
+WRBTC = "0x542FDA317318eBf1d3DeAF76E0B632741a7e677d"
+HOLDER = "0x0000000000000000000000000000000000000001"
+
+
+@pytest.fixture
+def provider():
+    provider = MagicMock()
+    provider.chain_id = ChainId.MAINNET
+    provider.w3 = Web3()
+    return provider
+
+
+def aggregate_result(*entries):
+    return encode(["(bool,bytes)[]"], [list(entries)])
+
+
+def sent_calls(provider, index=0):
+    payload = provider.call.call_args_list[index].args[0]["data"]
+    assert payload[:4] == bytes.fromhex("82ad56cb")
+    return decode(["(address,bool,bytes)[]"], payload[4:])[0]
+
+
+class TestMulticall:
+    def test_default_address_per_chain(self, provider):
+        assert Multicall(provider).address == "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+    def test_unknown_chain_requires_address(self, provider):
+        provider.chain_id = 1337
+        with pytest.raises(ValueError, match="Multicall3"):
+            Multicall(provider)
+
+    def test_calls_across_tokens_in_one_eth_call(self, provider):
+        rif, wrbtc = ERC20Token(provider, RIF), ERC20Token(provider, WRBTC)
+        provider.call.return_value = aggregate_result(
+            (True, encode(["uint256"], [5])), (True, encode(["uint8"], [18]))
+        )
+        mc = Multicall(provider)
+        mc.add(rif, "balanceOf", HOLDER)
+        mc.add(wrbtc, "decimals")
+        assert mc.execute() == [5, 18]
+        provider.call.assert_called_once()
+        targets = [target.lower() for target, _, _ in sent_calls(provider)]
+        assert targets == [RIF.lower(), WRBTC.lower()]
+
+    def test_calldata_matches_contract_encoding(self, provider):
+        rif = ERC20Token(provider, RIF)
+        provider.call.return_value = aggregate_result((True, encode(["uint256"], [1])))
+        mc = Multicall(provider)
+        mc.add(rif, "balanceOf", HOLDER)
+        mc.execute()
+        (_, allow_failure, data) = sent_calls(provider)[0]
+        assert allow_failure is False
+        assert "0x" + data.hex() == rif.web3_contract.encode_abi("balanceOf", args=[HOLDER])
+
+    def test_allow_failure_yields_none(self, provider):
+        rif = ERC20Token(provider, RIF)
+        provider.call.return_value = aggregate_result(
+            (False, b""), (True, encode(["uint256"], [7]))
+        )
+        mc = Multicall(provider, allow_failure=True)
+        mc.add(rif, "balanceOf", HOLDER)
+        mc.add(rif, "totalSupply")
+        assert mc.execute() == [None, 7]
+        assert sent_calls(provider)[0][1] is True
+
+    def test_revert_without_allow_failure_raises(self, provider):
+        provider.call.side_effect = RPCError("Call reverted: Multicall3: call failed")
+        mc = Multicall(provider)
+        mc.add(ERC20Token(provider, RIF), "totalSupply")
+        with pytest.raises(ContractError):
+            mc.execute()
+
+    def test_batches(self, provider):
+        rif = ERC20Token(provider, RIF)
+        provider.call.side_effect = lambda params, block: aggregate_result(
+            *[(True, encode(["uint256"], [3]))]
+            * len(decode(["(address,bool,bytes)[]"], params["data"][4:])[0])
+        )
+        mc = Multicall(provider, batch_size=2)
+        for _ in range(5):
+            mc.add(rif, "totalSupply")
+        assert mc.execute() == [3] * 5
+        assert provider.call.call_count == 3
+        assert len(mc) == 0
+
+    def test_address_outputs_are_checksummed(self, provider):
+        provider.call.return_value = aggregate_result((True, encode(["address"], [RIF])))
+        mc = Multicall(provider)
+        mc.add_call(RIF, "0x12345678", ["address"])
+        assert mc.execute() == [Web3.to_checksum_address(RIF)]
+
+    def test_empty(self, provider):
+        assert Multicall(provider).execute() == []
+        provider.call.assert_not_called()
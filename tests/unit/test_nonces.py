@@ -0,0 +1,204 @@
+import multiprocessing
+from unittest.mock import MagicMock
+
+import pytest
+
+from rootstock.constants import ChainId
+from rootstock.exceptions import ProviderConnectionError, RPCError, TransactionRevertedError
+from rootstock.nonces import (
+    ALLOCATED,
+    BROADCAST,
+    CONFIRMED,
+    NonceAllocator,
+    SQLiteNonceAllocator,
+)
+from rootstock.transactions import TransactionBuilder
+from rootstock.wallet import Wallet
+
+TEST_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+TEST_TO = "0x0000000000000000000000000000000000000001"
+ADDR = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+
+
+@pytest.fixture
+def allocator(tmp_path):
+    return SQLiteNonceAllocator(tmp_path / "nonces.db")
+
+
+@pytest.fixture
+def mock_provider():
+    provider = MagicMock()
+    provider.chain_id = ChainId.TESTNET
+    provider.get_transaction_count.return_value = 5
+    provider.get_gas_price.return_value = 60_000_000
+    provider.send_raw_transaction.return_value = "0x" + "ab" * 32
+    provider.wait_for_transaction.return_value = {"status": 1}
+    return provider
+
+
+@pytest.fixture
+def wallet():
+    return Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+
+
+def _allocate_many(path, count, queue):
+    allocator = SQLiteNonceAllocator(path)
+    queue.put([allocator.allocate(ADDR, 0) for _ in range(count)])
+
+
+class TestSQLiteNonceAllocator:
+    def test_sequential_allocation(self, allocator):
+        assert allocator.allocate(ADDR, 5) == 5
+        assert allocator.allocate(ADDR, 5) == 6
+        assert allocator.get_state(ADDR, 6) == ALLOCATED
+
+    def test_block_allocation(self, allocator):
+        assert allocator.allocate(ADDR, 5, count=3) == 5
+        assert allocator.allocate(ADDR, 5) == 8
+
+    def test_invalid_count_raises(self, allocator):
+        with pytest.raises(ValueError, match="count"):
+            allocator.allocate(ADDR, 0, count=0)
+
+    def test_shared_between_instances(self, tmp_path):
+        a = SQLiteNonceAllocator(tmp_path / "shared.db")
+        b = SQLiteNonceAllocator(tmp_path / "shared.db")
+        assert a.allocate(ADDR, 0) == 0
+        assert b.allocate(ADDR, 0) == 1
+
+    def test_release_fills_gap(self, allocator):
+        allocator.allocate(ADDR, 0, count=3)
+        allocator.release(ADDR, 1)
+        assert allocator.get_state(ADDR, 1) is None
+        assert allocator.allocate(ADDR, 0) == 1
+        assert allocator.allocate(ADDR, 0) == 3
+
+    def test_release_ignores_broadcast(self, allocator):
+        allocator.allocate(ADDR, 0)
+        allocator.mark_broadcast(ADDR, 0, "0xabc")
+        allocator.release(ADDR, 0)
+        assert allocator.get_state(ADDR, 0) == BROADCAST
+
+    def test_chain_advance_confirms_lower_nonces(self, allocator):
+        allocator.allocate(ADDR, 0, count=2)
+        allocator.mark_broadcast(ADDR, 0, "0xabc")
+        assert allocator.allocate(ADDR, 2) == 2
+        assert allocator.get_state(ADDR, 0) == CONFIRMED
+        assert allocator.get_state(ADDR, 1) == CONFIRMED
+
+    def test_addresses_are_case_insensitive(self, allocator):
+        allocator.allocate(ADDR, 0)
+        assert allocator.allocate(ADDR.lower(), 0) == 1
+
+    def test_expired_lease_is_reclaimed(self, allocator, monkeypatch):
+        now = 1_000.0
+        monkeypatch.setattr("rootstock.nonces.time.time", lambda: now)
+        allocator.allocate(ADDR, 0, count=5)
+        for nonce in range(5):
+            allocator.mark_broadcast(ADDR, nonce, "0xabc")
+        assert allocator.allocate(ADDR, 0) == 5  # worker dies before broadcasting
+        now += 301
+        assert allocator.allocate(ADDR, 0) == 5
+        assert allocator.allocate(ADDR, 0) == 6
+        assert allocator.get_state(ADDR, 0) == BROADCAST
+
+    def test_live_lease_is_kept(self, allocator, monkeypatch):
+        now = 1_000.0
+        monkeypatch.setattr("rootstock.nonces.time.time", lambda: now)
+        allocator.allocate(ADDR, 0)
+        now += 299
+        assert allocator.allocate(ADDR, 0) == 1
+
+    def test_lease_disabled(self, tmp_path, monkeypatch):
+        allocator = SQLiteNonceAllocator(tmp_path / "nolease.db", lease_seconds=None)
+        now = 1_000.0
+        monkeypatch.setattr("rootstock.nonces.time.time", lambda: now)
+        allocator.allocate(ADDR, 0)
+        now += 10**6
+        assert allocator.allocate(ADDR, 0) == 1
+
+    def test_base_class_is_abstract(self):
+        with pytest.raises(TypeError):
+            NonceAllocator()
+
+    def test_reset(self, allocator):
+        allocator.allocate(ADDR, 0, count=3)
+        allocator.reset(ADDR)
+        assert allocator.allocate(ADDR, 0) == 0
+
+    def test_unique_across_processes(self, tmp_path):
+        path = str(tmp_path / "procs.db")
+        SQLiteNonceAllocator(path)
+        queue = multiprocessing.Queue()
+        procs = [
+            multiprocessing.Process(target=_allocate_many, args=(path, 10, queue))
+            for _ in range(4)
+        ]
+        for p in procs:
+            p.start()
+        results = [n for _ in procs for n in queue.get(timeout=30)]
+        for p in procs:
+            p.join()
+        assert sorted(results) == list(range(40))
+
+
+class TestBuilderWithAllocator:
+    def test_auto_nonce_uses_allocator(self, mock_provider, wallet, allocator):
+        builder = TransactionBuilder(mock_provider, wallet, nonce_allocator=allocator)
+        other = TransactionBuilder(mock_provider, wallet, nonce_allocator=allocator)
+        assert builder._auto_nonce() == 5
+        assert other._auto_nonce() == 6
+
+    def test_sign_and_send_records_states(self, mock_provider, wallet, allocator):
+        builder = TransactionBuilder(mock_provider, wallet, nonce_allocator=allocator)
+        tx = builder.build_transaction(to=TEST_TO, gas_limit=21_000)
+        builder.sign_and_send(tx, wait=False)
+        assert allocator.get_state(wallet.address, 5) == BROADCAST
+        tx = builder.build_transaction(to=TEST_TO, gas_limit=21_000)
+        builder.sign_and_send(tx, wait=True)
+        assert allocator.get_state(wallet.address, 6) == CONFIRMED
+
+    def test_failed_broadcast_releases_nonce(self, mock_provider, wallet, allocator):
+        builder = TransactionBuilder(mock_provider, wallet, nonce_allocator=allocator)
+        mock_provider.send_raw_transaction.side_effect = RPCError("rejected")
+        tx = builder.build_transaction(to=TEST_TO, gas_limit=21_000)
+        with pytest.raises(RPCError):
+            builder.sign_and_send(tx, wait=False)
+        assert allocator.get_state(wallet.address, 5) is None
+
+    def test_connection_error_keeps_nonce(self, mock_provider, wallet, allocator):
+        builder = TransactionBuilder(mock_provider, wallet, nonce_allocator=allocator)
+        mock_provider.send_raw_transaction.side_effect = ProviderConnectionError("timeout")
+        tx = builder.build_transaction(to=TEST_TO, gas_limit=21_000)
+        with pytest.raises(ProviderConnectionError):
+            builder.sign_and_send(tx, wait=False)
+        assert allocator.get_state(wallet.address, 5) == BROADCAST
+        assert builder._auto_nonce() == 6
+
+    def test_send_many_connection_error_keeps_nonce(self, mock_provider, wallet, allocator):
+        builder = TransactionBuilder(mock_provider, wallet, nonce_allocator=allocator)
+        mock_provider.send_raw_transaction.side_effect = [
+            "0x01",
+            ProviderConnectionError("timeout"),
+            "0x03",
+        ]
+        handles = builder.send_many([{"to": TEST_TO}] * 3, stop_on_error=True)
+        assert [h.sent for h in handles] == [True, False, False]
+        assert allocator.get_state(wallet.address, 6) == BROADCAST
+        assert allocator.get_state(wallet.address, 7) is None
+
+    def test_reverted_transaction_confirms_nonce(self, mock_provider, wallet, allocator):
+        builder = TransactionBuilder(mock_provider, wallet, nonce_allocator=allocator)
+        mock_provider.wait_for_transaction.side_effect = TransactionRevertedError(
+            "0xabc", {"status": 0}
+        )
+        tx = builder.build_transaction(to=TEST_TO, gas_limit=21_000)
+        with pytest.raises(TransactionRevertedError):
+            builder.sign_and_send(tx)
+        assert allocator.get_state(wallet.address, 5) == CONFIRMED
+
+    def test_reset_nonce_clears_allocator(self, mock_provider, wallet, allocator):
+        builder = TransactionBuilder(mock_provider, wallet, nonce_allocator=allocator)
+        builder._auto_nonce()
+        builder.reset_nonce()
+        assert builder._auto_nonce() == 5
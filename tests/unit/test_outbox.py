@@ -0,0 +1,253 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from eth_hash.auto import keccak
+
+from rootstock.constants import ChainId
+from rootstock.exceptions import GasEstimationError, ProviderConnectionError, RPCError
+from rootstock.nonces import BROADCAST as NONCE_BROADCAST
+from rootstock.nonces import SQLiteNonceAllocator
+from rootstock.outbox import BROADCAST, FAILED, MINED, QUEUED, REVERTED, SIGNED, TransactionOutbox
+from rootstock.transactions import TransactionBuilder
+from rootstock.wallet import Wallet
+
+TEST_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+TEST_TO = "0x0000000000000000000000000000000000000001"
+
+
+@pytest.fixture
+def mock_provider():
+    provider = MagicMock()
+    provider.chain_id = ChainId.TESTNET
+    provider.get_transaction_count.return_value = 5
+    provider.get_gas_price.return_value = 60_000_000
+    provider.estimate_gas.return_value = 50_000
+    provider.send_raw_transaction.return_value = "0x" + "ab" * 32
+    provider.get_transaction_receipt.return_value = None
+    return provider
+
+
+@pytest.fixture
+def builder(mock_provider):
+    wallet = Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+    return TransactionBuilder(mock_provider, wallet)
+
+
+@pytest.fixture
+def outbox(tmp_path, builder):
+    return TransactionOutbox(tmp_path / "outbox.db", builder, max_per_second=1000)
+
+
+class TestEnqueue:
+    def test_enqueue_returns_queued_entry(self, outbox):
+        entry = outbox.enqueue("payout-1", TEST_TO, value=100)
+        assert entry.status == QUEUED
+        assert entry.value == 100
+        assert entry.data == "0x"
+
+    def test_enqueue_is_idempotent(self, outbox):
+        outbox.enqueue("payout-1", TEST_TO, value=100)
+        outbox.enqueue("payout-1", TEST_TO, value=100)
+        assert len(outbox.entries()) == 1
+
+    def test_reused_key_with_different_params_raises(self, outbox):
+        outbox.enqueue("payout-1", TEST_TO, value=100)
+        with pytest.raises(ValueError, match="already used"):
+            outbox.enqueue("payout-1", TEST_TO, value=200)
+
+    def test_negative_value_raises(self, outbox):
+        with pytest.raises(ValueError):
+            outbox.enqueue("payout-1", TEST_TO, value=-1)
+
+    def test_uint256_value_round_trips(self, outbox):
+        entry = outbox.enqueue("big", TEST_TO, value=2**255)
+        assert outbox.get("big").value == entry.value == 2**255
+
+    def test_get_unknown_key(self, outbox):
+        assert outbox.get("missing") is None
+
+
+class TestProcessing:
+    def test_broadcasts_queued_entries(self, outbox, mock_provider):
+        outbox.enqueue("a", TEST_TO, value=1)
+        outbox.enqueue("b", TEST_TO, value=2)
+        assert outbox.process_once() == 2
+        assert [e.status for e in outbox.entries()] == [BROADCAST, BROADCAST]
+        assert [e.nonce for e in outbox.entries()] == [5, 6]
+        mock_provider.estimate_gas.assert_not_called()
+
+    def test_contract_call_estimates_gas(self, outbox, mock_provider):
+        outbox.enqueue("a", TEST_TO, data="0xabcd")
+        outbox.process_once()
+        mock_provider.estimate_gas.assert_called_once()
+
+    def test_records_receipt(self, outbox, mock_provider):
+        outbox.enqueue("a", TEST_TO, value=1)
+        outbox.process_once()
+        mock_provider.get_transaction_receipt.return_value = {
+            "status": 1,
+            "blockHash": b"\x01" * 32,
+        }
+        outbox.process_once()
+        entry = outbox.get("a")
+        assert entry.status == MINED
+        assert entry.done
+        assert entry.receipt["blockHash"] == "0x" + "01" * 32
+
+    def test_records_revert(self, outbox, mock_provider):
+        outbox.enqueue("a", TEST_TO, value=1)
+        outbox.process_once()
+        mock_provider.get_transaction_receipt.return_value = {"status": 0}
+        outbox.process_once()
+        assert outbox.get("a").status == REVERTED
+
+    def test_rejected_broadcast_fails_entry(self, outbox, mock_provider, builder):
+        mock_provider.send_raw_transaction.side_effect = RPCError("insufficient funds")
+        outbox.enqueue("a", TEST_TO, value=1)
+        outbox.process_once()
+        entry = outbox.get("a")
+        assert entry.status == FAILED
+        assert "insufficient" in entry.error
+        assert builder._auto_nonce() == 5
+
+    def test_build_connection_error_keeps_queued(self, outbox, mock_provider):
+        mock_provider.get_gas_price.side_effect = ProviderConnectionError("down")
+        outbox.enqueue("a", TEST_TO, value=1)
+        with pytest.raises(ProviderConnectionError):
+            outbox.process_once()
+        assert outbox.get("a").status == QUEUED
+        mock_provider.get_gas_price.side_effect = None
+        assert outbox.process_once() == 1
+        assert outbox.get("a").nonce == 5
+
+    def test_gas_estimation_error_fails_entry(self, outbox, mock_provider, builder):
+        mock_provider.estimate_gas.side_effect = GasEstimationError("reverted")
+        outbox.enqueue("a", TEST_TO, data="0xabcd")
+        outbox.process_once()
+        assert outbox.get("a").status == FAILED
+        assert builder._auto_nonce() == 5
+
+    def test_allocator_sees_broadcast(self, tmp_path, mock_provider, builder):
+        allocator = SQLiteNonceAllocator(tmp_path / "nonces.db")
+        shared = TransactionBuilder(mock_provider, builder.wallet, nonce_allocator=allocator)
+        outbox = TransactionOutbox(tmp_path / "outbox.db", shared, max_per_second=1000)
+        outbox.enqueue("a", TEST_TO, value=1)
+        outbox.process_once()
+        assert allocator.get_state(builder.wallet.address, 5) == NONCE_BROADCAST
+
+    def test_already_known_counts_as_broadcast(self, outbox, mock_provider):
+        mock_provider.send_raw_transaction.side_effect = RPCError("already known")
+        outbox.enqueue("a", TEST_TO, value=1)
+        outbox.process_once()
+        assert outbox.get("a").status == BROADCAST
+
+    def test_connection_error_keeps_signed_and_retries(self, outbox, mock_provider):
+        mock_provider.send_raw_transaction.side_effect = ProviderConnectionError("down")
+        outbox.enqueue("a", TEST_TO, value=1)
+        with pytest.raises(ProviderConnectionError):
+            outbox.process_once()
+        assert outbox.get("a").status == SIGNED
+        mock_provider.send_raw_transaction.side_effect = None
+        outbox.process_once()
+        assert outbox.get("a").status == BROADCAST
+
+    def test_rejected_rebroadcast_fails_signed_entry(self, outbox, mock_provider, builder):
+        mock_provider.send_raw_transaction.side_effect = ProviderConnectionError("down")
+        outbox.enqueue("a", TEST_TO, value=1)
+        with pytest.raises(ProviderConnectionError):
+            outbox.process_once()
+        mock_provider.send_raw_transaction.side_effect = RPCError("insufficient funds")
+        outbox.process_once()
+        entry = outbox.get("a")
+        assert entry.status == FAILED
+        assert "insufficient" in entry.error
+
+        mock_provider.send_raw_transaction.side_effect = None
+        outbox.enqueue("b", TEST_TO, value=2)
+        outbox.process_once()
+        assert outbox.get("b").nonce == 5
+
+    def test_rebroadcast_connection_error_keeps_signed(self, outbox, mock_provider):
+        mock_provider.send_raw_transaction.side_effect = ProviderConnectionError("down")
+        outbox.enqueue("a", TEST_TO, value=1)
+        with pytest.raises(ProviderConnectionError):
+            outbox.process_once()
+        outbox.process_once()
+        assert outbox.get("a").status == SIGNED
+
+
+class TestCrashRecovery:
+    def test_restart_rebroadcasts_same_transaction(self, tmp_path, mock_provider, builder):
+        path = tmp_path / "outbox.db"
+        first = TransactionOutbox(path, builder, max_per_second=1000)
+        first.enqueue("a", TEST_TO, value=1)
+        first.process_once()
+        raw = mock_provider.send_raw_transaction.call_args[0][0]
+        tx_hash = first.get("a").tx_hash
+
+        mock_provider.send_raw_transaction.reset_mock()
+        restarted_builder = TransactionBuilder(mock_provider, builder.wallet)
+        second = TransactionOutbox(path, restarted_builder, max_per_second=1000)
+        second.enqueue("b", TEST_TO, value=2)
+        second.process_once()
+
+        sent = [c[0][0] for c in mock_provider.send_raw_transaction.call_args_list]
+        assert sent[0] == raw
+        assert second.get("a").tx_hash == tx_hash
+        assert second.get("b").nonce == 6
+        assert restarted_builder._auto_nonce() == 7
+
+    def test_restart_skips_mined(self, tmp_path, mock_provider, builder):
+        path = tmp_path / "outbox.db"
+        first = TransactionOutbox(path, builder, max_per_second=1000)
+        first.enqueue("a", TEST_TO, value=1)
+        first.process_once()
+        mock_provider.send_raw_transaction.reset_mock()
+        mock_provider.get_transaction_receipt.return_value = {"status": 1}
+        second = TransactionOutbox(path, builder, max_per_second=1000)
+        second.process_once()
+        mock_provider.send_raw_transaction.assert_not_called()
+        assert second.get("a").status == MINED
+
+
+class TestWorkerThread:
+    def test_start_and_stop(self, outbox):
+        outbox.enqueue("a", TEST_TO, value=1)
+        outbox.start(poll_interval=0.01)
+        deadline = time.monotonic() + 5
+        while outbox.get("a").status != BROADCAST and time.monotonic() < deadline:
+            time.sleep(0.01)
+        outbox.stop(timeout=5)
+        assert outbox.get("a").status == BROADCAST
+
+    def test_invalid_rate_raises(self, tmp_path, builder):
+        with pytest.raises(ValueError, match="max_per_second"):
+            TransactionOutbox(tmp_path / "x.db", builder, max_per_second=0)
+
+
+class TestAgainstNode:
+    def test_restart_with_pending_transaction(self, tmp_path, stub_provider, stub_node):
+        stub_node.results.update(
+            {
+                "eth_getTransactionCount": "0x5",
+                "eth_gasPrice": hex(60_000_000),
+                "eth_sendRawTransaction": lambda params: (
+                    "0x" + keccak(bytes.fromhex(params[0][2:])).hex()
+                ),
+                "eth_getTransactionReceipt": None,
+            }
+        )
+        wallet = Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+        path = tmp_path / "outbox.db"
+        first = TransactionOutbox(path, TransactionBuilder(stub_provider, wallet), 1000)
+        first.enqueue("a", TEST_TO, value=1)
+        assert first.process_once() == 1
+
+        second = TransactionOutbox(path, TransactionBuilder(stub_provider, wallet), 1000)
+        second.enqueue("b", TEST_TO, value=2)
+        assert second.process_once() == 1
+        sent = [p[0] for m, p in stub_node.calls if m == "eth_sendRawTransaction"]
+        assert sent[0] == sent[1]
+        assert second.get("a").status == BROADCAST
+        assert second.get("b").nonce == 6
@@ -0,0 +1,96 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from eth_abi import decode, encode
+from web3 import Web3
+
+from rootstock.constants import ChainId
+from rootstock.exceptions import TokenError
+from rootstock.portfolio import RBTC, PortfolioScanner
+from rootstock.tokens import ERC20Token, clear_metadata_cache
+
+RIF = "0x2acc95758f8b5f583470ba265eb685a8f45fc9d5"
+HOLDERS = [
+    "0x0000000000000000000000000000000000000001",
+    "0x0000000000000000000000000000000000000002",
+    "0x0000000000000000000000000000000000000003",
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_metadata_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def fake_multicall(params, block):
+    """Answer each call with holder index * 10, plus 1 for RBTC balances."""
+    calls = decode(["(address,bool,bytes)[]"], params["data"][4:])[0]
+    results = []
+    for _, _, data in calls:
+        holder = int.from_bytes(data[4:], "big")
+        value = holder * 10 + (1 if data[:4].hex() == "4d2301cc" else 0)
+        results.append((True, encode(["uint256"], [value])))
+    return encode(["(bool,bytes)[]"], [results])
+
+
+@pytest.fixture
+def provider():
+    provider = MagicMock()
+    provider.chain_id = ChainId.MAINNET
+    provider.w3 = Web3()
+    provider.get_block_number.return_value = 1_000
+    provider.call.side_effect = fake_multicall
+    return provider
+
+
+@pytest.fixture
+def rif(provider, monkeypatch):
+    token = ERC20Token(provider, RIF)
+    monkeypatch.setattr(token, "decimals", lambda: 6)
+    return token
+
+
+class TestPortfolioScanner:
+    def test_matrix_shape_and_values(self, provider, rif):
+        portfolio = PortfolioScanner(provider, [RBTC, rif]).scan(HOLDERS)
+        assert portfolio.balances == [[11, 10], [21, 20], [31, 30]]
+        assert portfolio.tokens == [RBTC, rif.address]
+        assert portfolio.decimals == [18, 6]
+        assert portfolio.block == 1_000
+
+    def test_all_batches_pinned_to_one_block(self, provider, rif):
+        PortfolioScanner(provider, [RBTC, rif], batch_size=2, concurrency=1).scan(HOLDERS)
+        assert provider.call.call_count == 3
+        assert {c.args[1] for c in provider.call.call_args_list} == {1_000}
+
+    def test_column_and_human(self, provider, rif):
+        portfolio = PortfolioScanner(provider, [rif]).scan(HOLDERS[:1])
+        assert portfolio.column(RIF.upper().replace("0X", "0x")) == [10]
+        assert portfolio.human() == [[Decimal("0.00001")]]
+
+    def test_failed_balance_raises(self, provider, rif):
+        provider.call.side_effect = lambda params, block: encode(
+            ["(bool,bytes)[]"], [[(False, b"")]]
+        )
+        with pytest.raises(TokenError, match="could not be read"):
+            PortfolioScanner(provider, [rif]).scan(HOLDERS[:1])
+
+    def test_direct_fallback_without_multicall(self, provider):
+        provider.chain_id = 1337
+        provider.get_balance.side_effect = lambda holder, block: int(holder, 16)
+        portfolio = PortfolioScanner(provider, [RBTC]).scan(HOLDERS)
+        assert portfolio.balances == [[1], [2], [3]]
+        provider.call.assert_not_called()
+
+    def test_to_numpy(self, provider, rif):
+        np = pytest.importorskip("numpy")
+        portfolio = PortfolioScanner(provider, [RBTC, rif]).scan(HOLDERS)
+        assert portfolio.to_numpy().shape == (3, 2)
+        assert np.allclose(portfolio.to_numpy(human=True)[:, 1], [1e-5, 2e-5, 3e-5])
+
+    def test_empty_tokens_raises(self, provider):
+        with pytest.raises(ValueError):
+            PortfolioScanner(provider, [])
@@ -0,0 +1,110 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from eth_account import Account
+from eth_hash.auto import keccak
+
+from rootstock.constants import ChainId
+from rootstock.exceptions import NonceTooLowError, RPCError
+from rootstock.presign import BulkBroadcaster, presign_transfers, read_presigned
+from rootstock.wallet import Wallet
+
+TEST_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+TEST_TO = "0x0000000000000000000000000000000000000001"
+
+
+@pytest.fixture
+def wallet():
+    return Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+
+
+@pytest.fixture
+def presigned(tmp_path, wallet):
+    path = tmp_path / "batch.jsonl"
+    intents = [{"to": TEST_TO, "value": i} for i in range(5)]
+    presign_transfers(wallet, intents, start_nonce=7, gas_price=60_000_000, path=path)
+    return path
+
+
+class TestPresignTransfers:
+    def test_writes_one_line_per_intent(self, presigned):
+        records = list(read_presigned(presigned))
+        assert [r["nonce"] for r in records] == [7, 8, 9, 10, 11]
+        assert [r["value"] for r in records] == ["0", "1", "2", "3", "4"]
+
+    def test_raw_transactions_decode(self, presigned, wallet):
+        record = next(read_presigned(presigned))
+        raw = bytes.fromhex(record["raw"][2:])
+        assert Account.recover_transaction(raw).lower() == wallet.address.lower()
+
+    def test_calldata_requires_gas_limit(self, tmp_path, wallet):
+        with pytest.raises(ValueError, match="gas_limit"):
+            presign_transfers(
+                wallet, [{"to": TEST_TO, "data": "0x1234"}], 0, 1, tmp_path / "out.jsonl"
+            )
+
+    def test_calldata_with_gas_limit(self, tmp_path, wallet):
+        path = tmp_path / "out.jsonl"
+        count = presign_transfers(
+            wallet, [{"to": TEST_TO, "data": "0x1234", "gas_limit": 50_000}], 0, 1, path
+        )
+        assert count == 1
+        assert json.loads(path.read_text())["nonce"] == 0
+
+
+class TestBulkBroadcaster:
+    def test_broadcasts_every_record(self, presigned):
+        provider = MagicMock()
+        report = BulkBroadcaster(provider, max_per_second=1000).broadcast_file(presigned)
+        assert report.sent == 5
+        assert provider.send_raw_transaction.call_count == 5
+
+    def test_already_known_counts_as_success(self, presigned):
+        provider = MagicMock()
+        provider.send_raw_transaction.side_effect = RPCError("already known")
+        report = BulkBroadcaster(provider, max_per_second=1000).broadcast_file(presigned)
+        assert report.already_known == 5
+        assert report.failed == []
+
+    def test_failures_are_reported(self, presigned):
+        provider = MagicMock()
+        provider.send_raw_transaction.side_effect = RPCError("insufficient funds")
+        report = BulkBroadcaster(provider, max_per_second=1000).broadcast_file(presigned)
+        assert [nonce for nonce, _ in report.failed] == [7, 8, 9, 10, 11]
+
+    def test_mined_records_are_not_failures(self, presigned):
+        records = list(read_presigned(presigned))
+        mined = {r["tx_hash"] for r in records[:3]}
+
+        def send(raw):
+            if "0x" + keccak(raw).hex() in mined:
+                raise NonceTooLowError("nonce too low")
+
+        provider = MagicMock()
+        provider.send_raw_transaction.side_effect = send
+        provider.get_transaction_receipt.side_effect = lambda h: (
+            {"status": 1} if h in mined else None
+        )
+        report = BulkBroadcaster(provider, max_per_second=1000).broadcast_file(presigned)
+        assert report.already_mined == 3
+        assert report.sent == 2
+        assert report.failed == []
+        assert report.total == 5
+
+    def test_nonce_taken_by_other_transaction_fails(self, presigned):
+        provider = MagicMock()
+        provider.send_raw_transaction.side_effect = NonceTooLowError("nonce too low")
+        provider.get_transaction_receipt.return_value = None
+        report = BulkBroadcaster(provider, max_per_second=1000).broadcast_file(presigned)
+        assert report.already_mined == 0
+        assert len(report.failed) == 5
+
+    def test_skip(self, presigned):
+        provider = MagicMock()
+        report = BulkBroadcaster(provider, max_per_second=1000).broadcast_file(presigned, skip=3)
+        assert report.total == 2
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            BulkBroadcaster(MagicMock(), max_per_second=0)
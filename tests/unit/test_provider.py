@@ -119,6 +119,36 @@ class TestProviderReadMethods:
         code = provider.get_code("0x0000000000000000000000000000000000000001")
         assert code == b"\x60\x80"
 
+    def test_get_logs(self, mock_web3):
+        mock_web3.eth.get_logs.return_value = [{"blockNumber": 1, "logIndex": 0}]
+        provider = RootstockProvider.from_testnet()
+        logs = provider.get_logs({"fromBlock": 1, "toBlock": 2})
+        assert logs == [{"blockNumber": 1, "logIndex": 0}]
+        mock_web3.eth.get_logs.assert_called_once_with({"fromBlock": 1, "toBlock": 2})
+
+    def test_log_filter_round_trip(self, mock_web3):
+        mock_web3.eth.filter.return_value.filter_id = "0x1"
+        mock_web3.eth.get_filter_changes.return_value = [{"blockNumber": 3, "removed": False}]
+        provider = RootstockProvider.from_testnet()
+        filter_id = provider.new_filter({"address": "0x1"})
+        assert provider.get_filter_changes(filter_id) == [{"blockNumber": 3, "removed": False}]
+        mock_web3.eth.get_filter_changes.assert_called_once_with("0x1")
+        provider.uninstall_filter(filter_id)
+        mock_web3.eth.uninstall_filter.assert_called_once_with("0x1")
+
+    def test_get_code_many_uses_one_batch(self, mock_web3):
+        batch = mock_web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [b"\x60\x80", b""]
+        provider = RootstockProvider.from_testnet()
+        codes = provider.get_code_many(["0x" + "01" * 20, "0x" + "02" * 20])
+        assert codes == [b"\x60\x80", b""]
+        assert batch.add.call_count == 2
+        batch.execute.assert_called_once()
+
+    def test_get_code_many_empty(self, mock_web3):
+        assert RootstockProvider.from_testnet().get_code_many([]) == []
+        mock_web3.batch_requests.assert_not_called()
+
     def test_estimate_gas(self, mock_web3):
         mock_web3.eth.estimate_gas.return_value = 21000
         provider = RootstockProvider.from_testnet()
@@ -193,3 +223,85 @@ class TestProviderErrorHandling:
         provider = RootstockProvider.from_testnet()
         with pytest.raises(NonceTooLowError):
             provider.send_raw_transaction(b"\x00")
+
+
+class TestBroadcastFanOut:
+    RAW = b"\x01\x02\x03"
+
+    @pytest.fixture
+    def endpoints(self, mock_web3):
+        extra = [MagicMock(), MagicMock()]
+        with patch("rootstock.provider.Web3") as web3_cls:
+            web3_cls.side_effect = [mock_web3, *extra]
+            web3_cls.HTTPProvider = MagicMock()
+            provider = RootstockProvider.from_testnet(
+                broadcast_urls=["https://a.example", "https://b.example"]
+            )
+        return provider, [mock_web3, *extra]
+
+    def test_sends_to_every_endpoint(self, endpoints):
+        provider, w3s = endpoints
+        for w3 in w3s:
+            w3.eth.send_raw_transaction.return_value = b"\xab" * 32
+        provider.send_raw_transaction(self.RAW)
+        provider._broadcast_pool.shutdown(wait=True)
+        for w3 in w3s:
+            w3.eth.send_raw_transaction.assert_called_once_with(self.RAW)
+
+    def test_hash_is_computed_locally(self, endpoints):
+        from eth_hash.auto import keccak
+
+        provider, w3s = endpoints
+        w3s[0].eth.send_raw_transaction.side_effect = Exception("node down")
+        assert provider.send_raw_transaction(self.RAW) == keccak(self.RAW).hex()
+
+    def test_already_known_counts_as_success(self, endpoints):
+        from web3.exceptions import Web3RPCError
+
+        provider, w3s = endpoints
+        for w3 in w3s:
+            w3.eth.send_raw_transaction.side_effect = Web3RPCError("already known")
+        assert provider.send_raw_transaction(self.RAW)
+
+    def test_all_rejected_raises(self, endpoints):
+        from web3.exceptions import Web3RPCError
+
+        provider, w3s = endpoints
+        for w3 in w3s:
+            w3.eth.send_raw_transaction.side_effect = Web3RPCError("nonce too low")
+        with pytest.raises(NonceTooLowError):
+            provider.send_raw_transaction(self.RAW)
+
+    def test_fan_out_can_be_disabled(self, endpoints):
+        provider, w3s = endpoints
+        w3s[0].eth.send_raw_transaction.return_value = b"\xab" * 32
+        provider.send_raw_transaction(self.RAW, fan_out=False)
+        w3s[1].eth.send_raw_transaction.assert_not_called()
+
+    def test_duplicate_urls_ignored(self, mock_web3):
+        provider = RootstockProvider.from_url(
+            "https://main.example", 31, broadcast_urls=["https://main.example"]
+        )
+        assert provider._broadcast_w3s == []
+
+
+TX_HASH = "0x" + "ab" * 32
+
+
+class TestTransactionReceipt:
+    def test_pending_transaction_returns_none(self, stub_provider, stub_node):
+        stub_node.results["eth_getTransactionReceipt"] = None
+        assert stub_provider.get_transaction_receipt(TX_HASH) is None
+        assert stub_node.calls == [("eth_getTransactionReceipt", [TX_HASH])]
+
+    def test_mined_transaction_returns_receipt(self, stub_provider, stub_node):
+        stub_node.results["eth_getTransactionReceipt"] = {
+            "transactionHash": TX_HASH,
+            "blockNumber": "0x10",
+            "status": "0x1",
+            "gasUsed": "0x5208",
+            "logs": [],
+        }
+        receipt = stub_provider.get_transaction_receipt(TX_HASH)
+        assert receipt["blockNumber"] == 16
+        assert receipt["status"] == 1
@@ -15,6 +15,11 @@ MOCK_RESOLVER_ADDR = "0x4efd25e3d348f8f25a14fb7655fba6f72edfe93a"
 MOCK_RESOLVED_ADDR = "0x1234567890abcdef1234567890abcdef12345678"
 
 
+def contract_class(provider):
+    """The web3 contract class mock that bind_contract instantiates for every RNS contract."""
+    return provider.w3.eth.contract.return_value
+
+
 @pytest.fixture
 def mock_provider():
     provider = MagicMock()
@@ -51,61 +56,40 @@ def rns(mock_provider):
 
 class TestRNSResolve:
     def test_resolve_domain(self, rns, mock_provider):
-        registry_contract = mock_provider.w3.eth.contract.return_value
+        registry_contract = MagicMock()
         registry_contract.functions.resolver.return_value.call.return_value = MOCK_RESOLVER_ADDR
 
         resolver_contract = MagicMock()
         resolver_contract.functions.addr.return_value.call.return_value = MOCK_RESOLVED_ADDR
 
-        mock_provider.w3.eth.contract.side_effect = [
-            registry_contract,
-            resolver_contract,
-        ]
-
-        # Re-create RNS since we changed side_effect above
-        with patch(
-            "rootstock.rns._load_abi",
-            return_value=[
-                {
-                    "constant": True,
-                    "inputs": [{"name": "node", "type": "bytes32"}],
-                    "name": "resolver",
-                    "outputs": [{"name": "", "type": "address"}],
-                    "type": "function",
-                    "stateMutability": "view",
-                },
-                {
-                    "constant": True,
-                    "inputs": [{"name": "node", "type": "bytes32"}],
-                    "name": "owner",
-                    "outputs": [{"name": "", "type": "address"}],
-                    "type": "function",
-                    "stateMutability": "view",
-                },
-            ],
-        ):
-            mock_provider.w3.eth.contract.side_effect = None
-            mock_provider.w3.eth.contract.return_value = registry_contract
-            rns_inst = RNS(mock_provider)
-
-        def contract_factory(address, abi):
-            if address.lower() == MOCK_RESOLVER_ADDR.lower():
-                return resolver_contract
-            return registry_contract
-
-        mock_provider.w3.eth.contract.side_effect = contract_factory
-        rns_inst._registry = registry_contract
-
-        result = rns_inst.resolve("alice.rsk")
+        def bind(address):
+            assert address.lower() == MOCK_RESOLVER_ADDR.lower()
+            return resolver_contract
+
+        contract_class(mock_provider).side_effect = bind
+        rns._registry = registry_contract
+
+        result = rns.resolve("alice.rsk")
         assert result.lower() == MOCK_RESOLVED_ADDR.lower()
 
+    def test_contract_classes_built_once(self, rns, mock_provider):
+        registry_contract = MagicMock()
+        registry_contract.functions.resolver.return_value.call.return_value = MOCK_RESOLVER_ADDR
+        contract_class(
+            mock_provider
+        ).return_value.functions.addr.return_value.call.return_value = MOCK_RESOLVED_ADDR
+        rns._registry = registry_contract
+        rns.resolve("alice.rsk")
+        rns.resolve("bob.rsk")
+        mock_provider.w3.eth.contract.assert_called_once()
+
     def test_resolve_adds_rsk_suffix(self, rns, mock_provider):
         registry_contract = mock_provider.w3.eth.contract.return_value
         registry_contract.functions.resolver.return_value.call.return_value = MOCK_RESOLVER_ADDR
 
         resolver_contract = MagicMock()
         resolver_contract.functions.addr.return_value.call.return_value = MOCK_RESOLVED_ADDR
-        mock_provider.w3.eth.contract.side_effect = lambda address, abi: resolver_contract
+        contract_class(mock_provider).return_value = resolver_contract
 
         rns._registry = registry_contract
         result = rns.resolve("alice")  # should auto-append .rsk
@@ -117,7 +101,7 @@ class TestRNSResolve:
 
         resolver_contract = MagicMock()
         resolver_contract.functions.addr.return_value.call.return_value = ZERO_ADDRESS
-        mock_provider.w3.eth.contract.side_effect = lambda address, abi: resolver_contract
+        contract_class(mock_provider).return_value = resolver_contract
 
         rns._registry = registry_contract
         with pytest.raises(DomainNotFoundError, match="zero address"):
@@ -140,7 +124,7 @@ class TestRNSReverseResolve:
         resolver_contract = MagicMock()
         resolver_contract.functions.name.return_value.call.return_value = "alice.rsk"
         resolver_contract.functions.addr.return_value.call.return_value = MOCK_RESOLVED_ADDR
-        mock_provider.w3.eth.contract.side_effect = lambda address, abi: resolver_contract
+        contract_class(mock_provider).return_value = resolver_contract
 
         rns._registry = registry_contract
         result = rns.reverse_resolve(MOCK_RESOLVED_ADDR)
@@ -160,7 +144,7 @@ class TestRNSReverseResolve:
 
         resolver_contract = MagicMock()
         resolver_contract.functions.name.return_value.call.return_value = ""
-        mock_provider.w3.eth.contract.side_effect = lambda address, abi: resolver_contract
+        contract_class(mock_provider).return_value = resolver_contract
 
         rns._registry = registry_contract
         result = rns.reverse_resolve(MOCK_RESOLVED_ADDR)
@@ -201,7 +185,7 @@ class TestRNSReverseResolveForwardVerification:
         resolver_contract.functions.addr.return_value.call.return_value = (
             "0x0000000000000000000000000000000000000001"  # different address
         )
-        mock_provider.w3.eth.contract.side_effect = lambda address, abi: resolver_contract
+        contract_class(mock_provider).return_value = resolver_contract
 
         rns._registry = registry_contract
         result = rns.reverse_resolve(MOCK_RESOLVED_ADDR)
@@ -214,7 +198,7 @@ class TestRNSReverseResolveForwardVerification:
         resolver_contract = MagicMock()
         resolver_contract.functions.name.return_value.call.return_value = "alice.rsk"
         resolver_contract.functions.addr.return_value.call.return_value = MOCK_RESOLVED_ADDR
-        mock_provider.w3.eth.contract.side_effect = lambda address, abi: resolver_contract
+        contract_class(mock_provider).return_value = resolver_contract
 
         rns._registry = registry_contract
         result = rns.reverse_resolve(MOCK_RESOLVED_ADDR)
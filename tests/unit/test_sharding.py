@@ -0,0 +1,111 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from rootstock.constants import ChainId
+from rootstock.exceptions import RPCError
+from rootstock.sharding import ShardedSender
+from rootstock.wallet import Wallet
+
+KEYS = [
+    "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80",
+    "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d",
+    "0x5de4111afa1a4b94908f83536e2e5f3b5b6c3a0a44ae8ca5e2f6f4e7e0f4d6c1",
+]
+TEST_TO = "0x0000000000000000000000000000000000000001"
+
+
+@pytest.fixture
+def mock_provider():
+    provider = MagicMock()
+    provider.chain_id = ChainId.TESTNET
+    provider.get_transaction_count.return_value = 0
+    provider.get_gas_price.return_value = 60_000_000
+    provider.get_balance.return_value = 10**18
+    provider.send_raw_transaction.return_value = "0x" + "ab" * 32
+    provider.wait_for_transaction.return_value = {"status": 1, "gasUsed": 21_000}
+    return provider
+
+
+@pytest.fixture
+def wallets():
+    return [Wallet.from_private_key(k, chain_id=ChainId.TESTNET) for k in KEYS]
+
+
+@pytest.fixture
+def sender(mock_provider, wallets):
+    return ShardedSender(mock_provider, wallets, min_balance=10**17, top_up_amount=3 * 10**17)
+
+
+class TestShardedSender:
+    def test_spreads_batch_evenly(self, sender):
+        handles = sender.send_many([{"to": TEST_TO, "value": 1}] * 9)
+        assert sorted(sender.loads().values()) == [3, 3, 3]
+        assert {h.sender for h in handles} == set(sender.addresses)
+
+    def test_each_wallet_has_own_nonce_stream(self, sender):
+        handles = sender.send_many([{"to": TEST_TO}] * 6)
+        by_sender = {}
+        for h in handles:
+            by_sender.setdefault(h.sender, []).append(h.nonce)
+        assert all(nonces == [0, 1] for nonces in by_sender.values())
+
+    def test_gas_price_fetched_once(self, sender, mock_provider):
+        sender.send_many([{"to": TEST_TO}] * 6)
+        mock_provider.get_gas_price.assert_called_once()
+
+    def test_transfer_routes_to_least_loaded(self, sender):
+        first = sender.send_many([{"to": TEST_TO}] * 2)
+        handle = sender.transfer(TEST_TO, value=5)
+        assert handle.sender not in {h.sender for h in first}
+
+    def test_transfer_raises_on_broadcast_failure(self, sender, mock_provider):
+        mock_provider.send_raw_transaction.side_effect = RPCError("rejected")
+        with pytest.raises(RPCError):
+            sender.transfer(TEST_TO, value=5)
+
+    def test_waited_transactions_leave_load(self, sender):
+        handles = sender.send_many([{"to": TEST_TO}] * 3)
+        handles[0].wait()
+        assert sum(sender.loads().values()) == 2
+
+    def test_refresh_prunes_mined(self, sender, mock_provider):
+        sender.send_many([{"to": TEST_TO}] * 6)
+        mock_provider.get_transaction_count.return_value = 1
+        sender.refresh()
+        assert sorted(sender.loads().values()) == [1, 1, 1]
+
+    def test_low_balance_wallet_gets_no_work(self, sender, mock_provider, wallets):
+        poor = wallets[0].address
+        mock_provider.get_balance.side_effect = lambda a, *args: 0 if a == poor else 10**18
+        sender.refresh()
+        handles = sender.send_many([{"to": TEST_TO}] * 4)
+        assert poor not in {h.sender for h in handles}
+
+    def test_rebalance_tops_up_from_richest(self, sender, mock_provider, wallets):
+        poor = wallets[0].address
+        rich = wallets[2].address
+        mock_provider.get_balance.side_effect = lambda a, *args: {
+            poor: 0,
+            rich: 2 * 10**18,
+        }.get(a, 10**18)
+        handles = sender.rebalance()
+        assert len(handles) == 1
+        assert handles[0].sender == rich
+
+    def test_rebalance_noop_when_funded(self, sender, mock_provider):
+        assert sender.rebalance() == []
+        mock_provider.send_raw_transaction.assert_not_called()
+
+    def test_rebalance_requires_top_up_amount(self, mock_provider, wallets):
+        sender = ShardedSender(mock_provider, wallets)
+        with pytest.raises(ValueError, match="top_up_amount"):
+            sender.rebalance()
+
+    def test_empty_pool_raises(self, mock_provider):
+        with pytest.raises(ValueError, match="empty"):
+            ShardedSender(mock_provider, [])
+
+    def test_duplicate_wallets_raise(self, mock_provider, wallets):
+        with pytest.raises(ValueError, match="distinct"):
+            ShardedSender(mock_provider, [wallets[0], wallets[0]])
@@ -0,0 +1,64 @@
+from multiprocessing import get_context
+from unittest.mock import patch
+
+import pytest
+
+from rootstock.constants import ChainId
+from rootstock.signing import ProcessPoolSigner
+from rootstock.wallet import Wallet
+
+TEST_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+TEST_TO = "0x0000000000000000000000000000000000000001"
+
+
+@pytest.fixture
+def wallet():
+    return Wallet.from_private_key(TEST_KEY, chain_id=ChainId.TESTNET)
+
+
+def _txs(count):
+    return [
+        {
+            "to": TEST_TO,
+            "value": i,
+            "data": "0x",
+            "nonce": i,
+            "gas": 21_000,
+            "gasPrice": 60_000_000,
+            "chainId": ChainId.TESTNET,
+        }
+        for i in range(count)
+    ]
+
+
+class TestProcessPoolSigner:
+    def test_matches_serial_signing_in_order(self, wallet):
+        txs = _txs(12)
+        signer = ProcessPoolSigner(max_workers=2, chunk_size=5, min_batch=1)
+        assert wallet.sign_transactions(txs, signer) == [wallet.sign_transaction(t) for t in txs]
+
+    def test_small_batch_signed_in_process(self, wallet):
+        txs = _txs(3)
+        signer = ProcessPoolSigner(max_workers=4)
+        assert wallet.sign_transactions(txs, signer) == wallet.sign_transactions(txs)
+
+    def test_empty_batch(self, wallet):
+        assert wallet.sign_transactions([], ProcessPoolSigner(min_batch=0)) == []
+
+    def test_invalid_chunk_size_raises(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            ProcessPoolSigner(chunk_size=0)
+
+    def test_invalid_max_workers_raises(self):
+        with pytest.raises(ValueError, match="max_workers"):
+            ProcessPoolSigner(max_workers=0)
+
+    def test_repr_has_no_key(self):
+        assert "ProcessPoolSigner(" in repr(ProcessPoolSigner(max_workers=2))
+
+    def test_workers_spawned_by_default(self, wallet):
+        txs = _txs(4)
+        signer = ProcessPoolSigner(max_workers=2, chunk_size=2, min_batch=1)
+        with patch("rootstock.signing.multiprocessing.get_context", wraps=get_context) as ctx:
+            wallet.sign_transactions(txs, signer)
+        ctx.assert_called_once_with("spawn")
@@ -3,19 +3,29 @@ from unittest.mock import MagicMock
 import pytest
 
 from rootstock.constants import ChainId
-from rootstock.exceptions import AllowanceExceededError, TokenError
-from rootstock.tokens import ERC20Token
+from rootstock.exceptions import AllowanceExceededError, RPCError, TokenError
+from rootstock.token_registry import TokenMetadata, TokenRegistry
+from rootstock.tokens import ERC20Token, clear_metadata_cache, fetch_token_metadata
 
 RIF_MAINNET = "0x2acc95758f8b5f583470ba265eb685a8f45fc9d5"
 TRIF_TESTNET = "0x19f64674D8a5b4e652319F5e239EFd3bc969a1FE"
 
 
+@pytest.fixture(autouse=True)
+def fresh_metadata_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
 @pytest.fixture
 def mock_provider():
     provider = MagicMock()
     provider.chain_id = ChainId.MAINNET
     provider.w3 = MagicMock()
     mock_contract = MagicMock()
+    # The class built for the ABI, bound to an address, is the same mock.
+    mock_contract.return_value = mock_contract
     provider.w3.eth.contract.return_value = mock_contract
     return provider
 
@@ -26,6 +36,8 @@ def mock_testnet_provider():
     provider.chain_id = ChainId.TESTNET
     provider.w3 = MagicMock()
     mock_contract = MagicMock()
+    # The class built for the ABI, bound to an address, is the same mock.
+    mock_contract.return_value = mock_contract
     provider.w3.eth.contract.return_value = mock_contract
     return provider
 
@@ -198,3 +210,167 @@ class TestAllowanceCheck:
             pytest.fail("Exact allowance should not raise AllowanceExceededError")
         except Exception:
             pass
+
+
+class TestEncoders:
+    @pytest.fixture
+    def token(self, mock_provider):
+        from web3 import Web3
+
+        mock_provider.w3 = Web3()
+        return ERC20Token(mock_provider, RIF_MAINNET)
+
+    def test_encode_transfer(self, token):
+        data = token.encode_transfer("0x0000000000000000000000000000000000000002", 5)
+        assert data == "0xa9059cbb" + "2".rjust(64, "0") + "5".rjust(64, "0")
+
+    def test_encode_approve(self, token):
+        data = token.encode_approve("0x0000000000000000000000000000000000000002", 5)
+        assert data.startswith("0x095ea7b3")
+
+    def test_encode_transfer_from(self, token):
+        data = token.encode_transfer_from(
+            "0x0000000000000000000000000000000000000002",
+            "0x0000000000000000000000000000000000000003",
+            7,
+        )
+        assert data == "0x23b872dd" + "".join(x.rjust(64, "0") for x in ("2", "3", "7"))
+
+
+class TestMetadataCache:
+    def test_decimals_read_once_across_instances(self, mock_provider):
+        decimals = mock_provider.w3.eth.contract.return_value.functions.decimals
+        decimals.return_value.call.return_value = 18
+        assert ERC20Token(mock_provider, RIF_MAINNET).decimals() == 18
+        assert ERC20Token(mock_provider, RIF_MAINNET).decimals() == 18
+        assert decimals.return_value.call.call_count == 1
+
+    def test_balance_of_human_makes_one_call_when_cached(self, mock_provider):
+        functions = mock_provider.w3.eth.contract.return_value.functions
+        functions.decimals.return_value.call.return_value = 18
+        functions.balanceOf.return_value.call.return_value = 10**18
+        token = ERC20Token(mock_provider, RIF_MAINNET)
+        token.decimals()
+        functions.decimals.return_value.call.reset_mock()
+        assert token.balance_of_human("0x0000000000000000000000000000000000000001") == "1"
+        functions.decimals.return_value.call.assert_not_called()
+
+    def test_failed_read_not_cached(self, mock_provider):
+        decimals = mock_provider.w3.eth.contract.return_value.functions.decimals
+        decimals.return_value.call.side_effect = [Exception("boom"), 8]
+        token = ERC20Token(mock_provider, RIF_MAINNET)
+        with pytest.raises(RPCError):
+            token.decimals()
+        assert token.decimals() == 8
+
+    def test_registry_is_filled_and_used(self, mock_provider, tmp_path):
+        functions = mock_provider.w3.eth.contract.return_value.functions
+        functions.name.return_value.call.return_value = "RIF Token"
+        functions.symbol.return_value.call.return_value = "RIF"
+        functions.decimals.return_value.call.return_value = 18
+        registry = TokenRegistry(tmp_path / "tokens.db")
+        metadata = ERC20Token(mock_provider, RIF_MAINNET, registry=registry).metadata()
+        assert registry.get(ChainId.MAINNET, RIF_MAINNET) == metadata
+
+        clear_metadata_cache()
+        functions.decimals.return_value.call.reset_mock()
+        assert ERC20Token(mock_provider, RIF_MAINNET, registry=registry).decimals() == 18
+        functions.decimals.return_value.call.assert_not_called()
+
+
+class TestTokenRegistry:
+    def test_find_by_symbol_case_insensitive(self, tmp_path):
+        registry = TokenRegistry(tmp_path / "tokens.db")
+        registry.add(TokenMetadata(30, TRIF_TESTNET, "Test RIF", "tRIF", 18))
+        assert [m.symbol for m in registry.find(30, "TRIF")] == ["tRIF"]
+        assert registry.find(31, "tRIF") == []
+
+    def test_get_many(self, tmp_path):
+        registry = TokenRegistry(tmp_path / "tokens.db")
+        registry.add(TokenMetadata(30, RIF_MAINNET, "RIF Token", "RIF", 18))
+        found = registry.get_many(30, [RIF_MAINNET.upper().replace("0X", "0x"), TRIF_TESTNET])
+        assert list(found) == [RIF_MAINNET.lower()]
+
+    def test_from_symbol_uses_registry(self, mock_provider, tmp_path):
+        registry = TokenRegistry(tmp_path / "tokens.db")
+        registry.add(TokenMetadata(30, TRIF_TESTNET, "Custom", "CSTM", 6))
+        token = ERC20Token.from_symbol(mock_provider, "cstm", registry=registry)
+        assert token.address.lower() == TRIF_TESTNET.lower()
+        assert token.decimals() == 6
+
+    def test_from_symbol_ambiguous_raises(self, mock_provider, tmp_path):
+        registry = TokenRegistry(tmp_path / "tokens.db")
+        registry.add(TokenMetadata(30, TRIF_TESTNET, "A", "DUP", 6))
+        registry.add(TokenMetadata(30, RIF_MAINNET, "B", "DUP", 6))
+        with pytest.raises(TokenError, match="ambiguous"):
+            ERC20Token.from_symbol(mock_provider, "DUP", registry=registry)
+
+
+class TestFetchTokenMetadata:
+    @pytest.fixture
+    def provider(self):
+        from web3 import Web3
+
+        provider = MagicMock()
+        provider.chain_id = ChainId.MAINNET
+        provider.w3 = Web3()
+        return provider
+
+    def test_bulk_load_in_one_eth_call(self, provider, tmp_path):
+        from eth_abi import encode
+
+        provider.call.return_value = encode(
+            ["(bool,bytes)[]"],
+            [
+                [
+                    (True, encode(["string"], ["RIF Token"])),
+                    (True, encode(["string"], ["RIF"])),
+                    (True, encode(["uint8"], [18])),
+                    (False, b""),
+                    (True, encode(["string"], ["X"])),
+                    (True, encode(["uint8"], [0])),
+                ]
+            ],
+        )
+        registry = TokenRegistry(tmp_path / "tokens.db")
+        found = fetch_token_metadata(provider, [RIF_MAINNET, TRIF_TESTNET], registry=registry)
+        assert [m.symbol for m in found.values()] == ["RIF"]
+        provider.call.assert_called_once()
+        assert len(registry) == 1
+
+        # Second lookup is served from the process cache.
+        assert fetch_token_metadata(provider, [RIF_MAINNET]) == found
+        provider.call.assert_called_once()
+
+
+class TestGetTransfers:
+    def test_filters_and_decodes(self, mock_provider):
+        from hexbytes import HexBytes
+
+        holder = "0x" + "ab" * 20
+        mock_provider.get_logs.return_value = [
+            {
+                "address": RIF_MAINNET,
+                "topics": [
+                    HexBytes("0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"),
+                    HexBytes(bytes(12) + bytes.fromhex(holder[2:])),
+                    HexBytes(bytes(32)),
+                ],
+                "data": HexBytes((42).to_bytes(32, "big")),
+                "blockNumber": 1,
+                "logIndex": 0,
+                "transactionHash": HexBytes(bytes(32)),
+            }
+        ]
+        token = ERC20Token(mock_provider, RIF_MAINNET)
+        logs = token.get_transfers(from_block=1, to_block=10, sender=holder)
+        assert [log.value for log in logs] == [42]
+        params = mock_provider.get_logs.call_args.args[0]
+        assert params["topics"] == [
+            "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",
+            "0x" + "0" * 24 + "ab" * 20,
+        ]
+
+    def test_unknown_event_raises(self, mock_provider):
+        with pytest.raises(ValueError):
+            ERC20Token(mock_provider, RIF_MAINNET).get_transfers(event="Mint")
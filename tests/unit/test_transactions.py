@@ -1,10 +1,18 @@
 import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
 from rootstock.constants import ChainId
-from rootstock.exceptions import InsufficientFundsError
+from rootstock.exceptions import (
+    GasEstimationError,
+    InsufficientFundsError,
+    ProviderConnectionError,
+    RPCError,
+    TransactionError,
+    TransactionRevertedError,
+)
 from rootstock.transactions import TransactionBuilder, _normalize_data
 from rootstock.wallet import Wallet
 
@@ -81,6 +89,43 @@ class TestBuildTransaction:
         assert tx["data"] == "0x"
 
 
+class TestConcurrentPrefetch:
+    def test_lookups_run_concurrently(self, builder, mock_provider):
+        def slow(value):
+            def call(*args):
+                time.sleep(0.2)
+                return value
+
+            return call
+
+        mock_provider.get_transaction_count.side_effect = slow(5)
+        mock_provider.get_gas_price.side_effect = slow(60_000_000)
+        mock_provider.estimate_gas.side_effect = slow(21_000)
+        start = time.monotonic()
+        tx = builder.build_transaction(to=TEST_TO, value=1)
+        assert time.monotonic() - start < 0.5
+        assert (tx["nonce"], tx["gasPrice"], tx["gas"]) == (5, 60_000_000, 21_000)
+
+    def test_estimate_failure_releases_nonce(self, builder, mock_provider):
+        mock_provider.estimate_gas.side_effect = GasEstimationError("reverted")
+        with pytest.raises(GasEstimationError):
+            builder.build_transaction(to=TEST_TO, data="0xabcd")
+        mock_provider.estimate_gas.side_effect = None
+        assert builder.build_transaction(to=TEST_TO)["nonce"] == 5
+
+    def test_estimate_params_exclude_nonce(self, builder, mock_provider):
+        builder.build_transaction(to=TEST_TO, value=7)
+        params = mock_provider.estimate_gas.call_args[0][0]
+        assert params["value"] == 7
+        assert "nonce" not in params
+
+    def test_no_lookups_when_fully_specified(self, builder, mock_provider):
+        builder.build_transaction(to=TEST_TO, gas_limit=21_000, gas_price=1, nonce=3)
+        mock_provider.get_transaction_count.assert_not_called()
+        mock_provider.get_gas_price.assert_not_called()
+        mock_provider.estimate_gas.assert_not_called()
+
+
 class TestTransfer:
     def test_transfer_rbtc(self, builder, mock_provider):
         result = builder.transfer(to=TEST_TO, value_rbtc=0.001, wait=True)
@@ -148,6 +193,153 @@ class TestEstimateTotalCost:
         assert "gas" in cost
 
 
+class TestSendMany:
+    def test_assigns_consecutive_nonces(self, builder, mock_provider):
+        handles = builder.send_many([{"to": TEST_TO, "value": 1}] * 3)
+        assert [h.nonce for h in handles] == [5, 6, 7]
+        assert all(h.sent for h in handles)
+        assert mock_provider.send_raw_transaction.call_count == 3
+
+    def test_fetches_gas_price_and_nonce_once(self, builder, mock_provider):
+        builder.send_many([{"to": TEST_TO, "value": 1}] * 4)
+        mock_provider.get_gas_price.assert_called_once()
+        mock_provider.get_transaction_count.assert_called_once()
+
+    def test_plain_transfers_skip_estimation(self, builder, mock_provider):
+        builder.send_many([{"to": TEST_TO, "value": 1}, {"to": TEST_TO, "data": "0xabcd"}])
+        mock_provider.estimate_gas.assert_called_once()
+
+    def test_explicit_gas_limit(self, builder, mock_provider):
+        builder.send_many([{"to": TEST_TO, "data": "0xabcd", "gas_limit": 50_000}])
+        mock_provider.estimate_gas.assert_not_called()
+
+    def test_continues_after_previous_builds(self, builder, mock_provider):
+        builder.build_transaction(to=TEST_TO, gas_limit=21000)
+        handles = builder.send_many([{"to": TEST_TO}] * 2)
+        assert [h.nonce for h in handles] == [6, 7]
+        assert builder._auto_nonce() == 8
+
+    def test_broadcast_failure_reported_on_handle(self, builder, mock_provider):
+        mock_provider.send_raw_transaction.side_effect = ["0x01", RPCError("rejected"), "0x03"]
+        handles = builder.send_many([{"to": TEST_TO}] * 3, concurrency=1)
+        assert [h.sent for h in handles] == [True, False, True]
+        with pytest.raises(RPCError):
+            handles[1].wait()
+
+    def test_connection_error_keeps_nonce(self, builder, mock_provider):
+        mock_provider.send_raw_transaction.side_effect = ProviderConnectionError("timeout")
+        handles = builder.send_many([{"to": TEST_TO}])
+        assert isinstance(handles[0].error, ProviderConnectionError)
+        assert builder._auto_nonce() == 6
+
+    def test_handles_behind_a_failure_are_blocked(self, builder, mock_provider):
+        mock_provider.send_raw_transaction.side_effect = [
+            "0x01",
+            RPCError("rejected"),
+            "0x03",
+            "0x04",
+        ]
+        handles = builder.send_many([{"to": TEST_TO}] * 4, concurrency=1)
+        assert [h.blocked_by for h in handles] == [None, None, 6, 6]
+
+    def test_no_failure_means_nothing_blocked(self, builder, mock_provider):
+        handles = builder.send_many([{"to": TEST_TO}] * 2)
+        assert [h.blocked_by for h in handles] == [None, None]
+
+    def test_wait_returns_receipt(self, builder, mock_provider):
+        handles = builder.send_many([{"to": TEST_TO}])
+        assert handles[0].wait()["status"] == 1
+        handles[0].wait()
+        mock_provider.wait_for_transaction.assert_called_once()
+
+    def test_check_balance_uses_one_call(self, builder, mock_provider):
+        mock_provider.get_balance.return_value = 10**18
+        builder.send_many([{"to": TEST_TO, "value": 10**17}] * 3, check_balance=True)
+        mock_provider.get_balance.assert_called_once()
+
+    def test_insufficient_balance_sends_nothing(self, builder, mock_provider):
+        mock_provider.get_balance.return_value = 10**17
+        with pytest.raises(InsufficientFundsError):
+            builder.send_many([{"to": TEST_TO, "value": 10**17}] * 3, check_balance=True)
+        mock_provider.send_raw_transaction.assert_not_called()
+
+    def test_uses_signer(self, builder, mock_provider):
+        signer = MagicMock()
+        signer.sign_many.return_value = [b"\x01", b"\x02"]
+        builder.send_many([{"to": TEST_TO}] * 2, signer=signer)
+        signer.sign_many.assert_called_once()
+        mock_provider.send_raw_transaction.assert_any_call(b"\x02")
+
+    def test_signs_with_no_pool_threads_running(self, builder, mock_provider):
+        def sign_many(key, txs):
+            workers = [t for t in threading.enumerate() if t.name.startswith("ThreadPoolExecutor")]
+            assert workers == []
+            return [b"\x01"] * len(txs)
+
+        signer = MagicMock()
+        signer.sign_many.side_effect = sign_many
+        builder.send_many([{"to": TEST_TO, "data": "0xabcd"}] * 2, signer=signer)
+        signer.sign_many.assert_called_once()
+
+    def test_empty_list(self, builder, mock_provider):
+        assert builder.send_many([]) == []
+        mock_provider.get_gas_price.assert_not_called()
+
+    def test_invalid_concurrency_raises(self, builder):
+        with pytest.raises(ValueError, match="concurrency"):
+            builder.send_many([{"to": TEST_TO}], concurrency=0)
+
+
+class TestTransactionSequence:
+    def test_steps_get_consecutive_nonces(self, builder, mock_provider):
+        seq = builder.sequence()
+        seq.add(TEST_TO, data="0x1234", gas_limit=50_000).add(TEST_TO, value=1)
+        receipts = seq.send()
+        assert [h.nonce for h in seq.handles] == [5, 6]
+        assert len(receipts) == 2
+        mock_provider.estimate_gas.assert_not_called()
+
+    def test_calldata_step_requires_gas_limit(self, builder):
+        with pytest.raises(ValueError, match="gas_limit"):
+            builder.sequence().add(TEST_TO, data="0x1234")
+
+    def test_no_wait_returns_handles(self, builder, mock_provider):
+        handles = builder.sequence().add(TEST_TO).add(TEST_TO).send(wait=False)
+        assert [h.nonce for h in handles] == [5, 6]
+        mock_provider.wait_for_transaction.assert_not_called()
+
+    def test_failed_step_stops_the_rest(self, builder, mock_provider):
+        mock_provider.send_raw_transaction.side_effect = [RPCError("rejected"), "0x" + "cd" * 32]
+        seq = builder.sequence().add(TEST_TO).add(TEST_TO).add(TEST_TO)
+        with pytest.raises(RPCError):
+            seq.send()
+        assert mock_provider.send_raw_transaction.call_count == 1
+        assert isinstance(seq.handles[2].error, TransactionError)
+        # Every nonce was released, so the next build starts at the chain nonce again.
+        assert builder.build_transaction(to=TEST_TO, gas_limit=21_000)["nonce"] == 5
+
+    def test_first_reverted_step_is_raised(self, builder, mock_provider):
+        reverted = {"status": 0, "gasUsed": 30_000}
+
+        def wait(tx_hash, timeout, poll_interval):
+            raise TransactionRevertedError(tx_hash, reverted)
+
+        mock_provider.wait_for_transaction.side_effect = wait
+        seq = builder.sequence().add(TEST_TO).add(TEST_TO)
+        with pytest.raises(TransactionRevertedError):
+            seq.send()
+
+    def test_send_twice_raises(self, builder):
+        seq = builder.sequence().add(TEST_TO)
+        seq.send(wait=False)
+        with pytest.raises(TransactionError):
+            seq.send()
+
+    def test_empty_sequence_raises(self, builder):
+        with pytest.raises(ValueError):
+            builder.sequence().send()
+
+
 class TestNormalizeData:
     def test_bytes_empty(self):
         assert _normalize_data(b"") == "0x"